@@ -1,75 +1,201 @@
 # API 엔드포인트
-from fastapi import APIRouter, Depends
+# 엔드포인트별 동시 처리 제한은 admission(<이름>) 의존성 (ADMISSION_* 설정)
+# 점수/히스토리/보고서 GET 은 ETag(+Last-Modified) 조건부 요청 지원: 바뀌지 않았으면 304 (app.common.conditional)
+from datetime import date, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from sqlalchemy.orm import Session
 from app.schema.score import (
     ScoreRequest, ScoreResponse, ScoreHistoryResponse, CreditReportResponse,
-    CreditScorePredictRequest, CreditScorePredictResponse
+    CreditScorePredictRequest, CreditScorePredictResponse,
+    CreditScorePredictGridRequest, CreditScorePredictGridResponse,
+    BatchScoreRequest, BatchScoreResponse, ScoreJobResponse, BulkScoreLookupRequest
 )
 from app.db.core_banking import (
     get_core_banking_read_db,
     get_core_banking_write_db,
 )
 from app.db.mydata import get_mydata_read_db
+from app.common.admission import admission
+from app.common.conditional import apply_validators, is_not_modified, make_validators, not_modified_response
+from app.common.exceptions import NotFoundException
+from app.common.profiling import request_profiler
 import app.service.scoring_service as scoring_service
 import app.repository.credit_repository as credit_repository
+from app.service.score_jobs import score_job_workers
 
 router = APIRouter()
 
 
 # ================ 신용 점수 계산 엔드포인트 ==================
-@router.post("", response_model=ScoreResponse)
-def scoring_credit_score(
+# 조회는 4개 테이블 동시 실행 (각자 풀 커넥션 사용)
+@router.post(
+    "", response_model=ScoreResponse, dependencies=[Depends(admission("scoring"))]
+)
+async def scoring_credit_score(
     request: ScoreRequest,
+    http_request: Request,
+    core_write_db = Depends(get_core_banking_write_db),
+):
+    with request_profiler.profile("scoring", http_request, request.user_id):
+        result = await scoring_service.calculate_credit_score_async(request, core_write_db)
+    return ScoreResponse(credit_score=result["credit_score"])
+
+
+# ================ 신용 점수 일괄 계산 엔드포인트 ==================
+@router.post(
+    "/batch", response_model=BatchScoreResponse, dependencies=[Depends(admission("batch"))]
+)
+def scoring_credit_score_batch(
+    request: BatchScoreRequest,
     core_read_db = Depends(get_core_banking_read_db),
     core_write_db = Depends(get_core_banking_write_db),
     mydata_db = Depends(get_mydata_read_db)
 ):
-    result = scoring_service.calculate_credit_score(
-        request, core_read_db, core_write_db, mydata_db
+    results = scoring_service.calculate_credit_scores_batch(
+        request.user_ids, core_read_db, core_write_db, mydata_db
+    )
+    return BatchScoreResponse(results=results)
+
+
+# ================ 최신 점수 / 히스토리 일괄 조회 엔드포인트 ==================
+# 응답은 NDJSON (유저 1명당 한 줄, 요청 순서), chunk 단위로 조회해 바로 내보내므로 메모리 일정
+@router.post("/lookup", dependencies=[Depends(admission("lookup"))])
+def lookup_credit_scores(request: BulkScoreLookupRequest):
+    return StreamingResponse(
+        scoring_service.iter_credit_score_lookups(request.user_ids, request.include_history),
+        media_type="application/x-ndjson",
+    )
+
+
+# ================ 비동기 신용 점수 계산 엔드포인트 ==================
+# 작업만 등록하고 202 반환 (같은 유저의 대기 중 작업이 있으면 그 작업 반환), 결과는 GET /jobs/{job_id}
+@router.post("/jobs", response_model=ScoreJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_credit_score_job(request: ScoreRequest):
+    _require_score_jobs()
+    job = score_job_workers.submit(request.user_id)
+    return _score_job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ScoreJobResponse)
+def credit_score_job(job_id: str):
+    _require_score_jobs()
+    job = score_job_workers.queue.get(job_id)
+    if job is None:
+        raise NotFoundException(f"Score job {job_id} not found")
+    return _score_job_response(job)
+
+
+def _require_score_jobs():
+    if not score_job_workers.running:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Score jobs are disabled")
+
+
+def _score_job_response(job) -> ScoreJobResponse:
+    return ScoreJobResponse(
+        job_id=job.id,
+        user_id=job.user_id,
+        status=job.status,
+        credit_score=job.credit_score,
+        error=job.error,
+        created_at=datetime.fromtimestamp(job.created_at),
+        updated_at=datetime.fromtimestamp(job.updated_at),
     )
-    return ScoreResponse(credit_score=result["credit_score"])
 
 
 # ================ 최신 신용 점수 조회 엔드포인트 ==================
-@router.get("/{user_id}", response_model=ScoreResponse)
+@router.get(
+    "/{user_id}", response_model=ScoreResponse, dependencies=[Depends(admission("latest"))]
+)
 def latest_credit_score(
     user_id: int,
+    http_request: Request,
+    response: Response,
     core_db = Depends(get_core_banking_read_db)
 ):
-    score = credit_repository.get_latest_credit_score(user_id, core_db)
+    # 점수와 갱신 시각을 PK 1행으로 함께 조회
+    version = credit_repository.get_credit_score_version(user_id, core_db)
+    score, updated_at = _score_version(version)
+    validators = make_validators("score", user_id, score, updated_at, last_modified=updated_at)
+    if is_not_modified(http_request, validators):
+        return not_modified_response(validators)
+    apply_validators(response, validators)
     return ScoreResponse(credit_score=score)
 
 
 # ================ 신용 점수 히스토리 엔드포인트 ==================
-@router.get("/history/{user_id}", response_model=ScoreHistoryResponse)
+@router.get(
+    "/history/{user_id}", response_model=ScoreHistoryResponse, dependencies=[Depends(admission("history"))]
+)
 def credit_score_history(
     user_id: int,
+    http_request: Request,
+    response: Response,
     core_db = Depends(get_core_banking_read_db)
 ):
+    # 히스토리는 점수 저장 때만 바뀌고 (credit_score.updated_at 도 함께 갱신), 조회 기간은 달이 바뀌면 이동
+    # -> 바뀌지 않았으면 롤업 조회 없이 304
+    version = credit_repository.get_credit_score_version(user_id, core_db)
+    score, updated_at = _score_version(version)
+    month_start = datetime.combine(date.today().replace(day=1), datetime.min.time())
+    last_modified = max(updated_at, month_start) if updated_at is not None else month_start
+    validators = make_validators(
+        "history", user_id, score, updated_at, month_start.strftime("%Y-%m"), last_modified=last_modified
+    )
+    if is_not_modified(http_request, validators):
+        return not_modified_response(validators)
+
     history = credit_repository.get_credit_score_history(user_id, core_db)
+    apply_validators(response, validators)
     return ScoreHistoryResponse(history=history)
 
 
+def _score_version(row):
+    # credit_score 행 -> (점수, 갱신 시각), 없으면 (0, None)
+    if row is None:
+        return 0, None
+    updated_at = row.updated_at
+    if isinstance(updated_at, str):
+        updated_at = datetime.fromisoformat(updated_at)
+    return int(row.score), updated_at
+
+
 # ================ 신용 보고서 엔드포인트 ==================
-@router.get("/report/{user_id}", response_model=CreditReportResponse)
-def credit_report(
-    user_id: int,
-    core_db: Session = Depends(get_core_banking_read_db),
-    mydata_db: Session = Depends(get_mydata_read_db)
-):
-    report_data = scoring_service.get_credit_report_data(user_id, core_db, mydata_db)
+@router.get(
+    "/report/{user_id}", response_model=CreditReportResponse, dependencies=[Depends(admission("report"))]
+)
+async def credit_report(user_id: int, http_request: Request, response: Response):
+    with request_profiler.profile("report", http_request, user_id):
+        # 데이터 워터마크(또는 신선한 스냅샷) + 날짜 + 모델 버전이 같으면 조회/피처 추출 없이 304
+        version = await scoring_service.get_credit_report_version_async(user_id)
+        validators = make_validators("report", user_id, *version.parts)
+        if is_not_modified(http_request, validators):
+            return not_modified_response(validators)
+        report_data = await scoring_service.get_credit_report_data_async(user_id, version)
+    apply_validators(response, validators)
     return CreditReportResponse(
         credit_score=report_data["credit_score"],
         features=report_data["features"]
     )
 
 # ================ 신용 점수 예측 엔드포인트 ==================
-@router.post("/prediction", response_model=CreditScorePredictResponse)
-def predict_credit_score(
-    request: CreditScorePredictRequest,
-    core_db: Session = Depends(get_core_banking_read_db),
-    mydata_db: Session = Depends(get_mydata_read_db)
-):
-    result = scoring_service.process_prediction(request, core_db, mydata_db)
+@router.post(
+    "/prediction", response_model=CreditScorePredictResponse, dependencies=[Depends(admission("prediction"))]
+)
+async def predict_credit_score(request: CreditScorePredictRequest, http_request: Request):
+    with request_profiler.profile("prediction", http_request, request.user_id):
+        result = await scoring_service.process_prediction_async(request)
+    return result
+
+
+# ================ 신용 점수 예측 (여러 송금액) 엔드포인트 ==================
+@router.post(
+    "/prediction/grid",
+    response_model=CreditScorePredictGridResponse,
+    dependencies=[Depends(admission("prediction"))],
+)
+async def predict_credit_score_grid(request: CreditScorePredictGridRequest, http_request: Request):
+    with request_profiler.profile("prediction_grid", http_request, request.user_id):
+        result = await scoring_service.process_prediction_grid_async(request)
     return result
@@ -0,0 +1,117 @@
+# credit_score_history -> credit_score_monthly 롤업 백필
+#
+# 사용법:
+#   python -m app.cli.backfill_score_rollup [--chunk-size 1000] [--create-table]
+#
+# user_id 순으로 chunk 단위(keyset)로 나눠 월별 (합계, 건수)를 다시 계산해 덮어씁니다.
+# 실행 중 들어온 점수도 history 기준으로 다시 집계되므로 여러 번 실행해도 안전합니다.
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.db.core_banking import WriteSessionLocal
+
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS credit_score_monthly (
+    user_id BIGINT NOT NULL,
+    year SMALLINT NOT NULL,
+    month TINYINT NOT NULL,
+    score_sum BIGINT NOT NULL DEFAULT 0,
+    score_count INT NOT NULL DEFAULT 0,
+    avg_score DECIMAL(7, 2) AS (score_sum / NULLIF(score_count, 0)) STORED,
+    PRIMARY KEY (user_id, year, month)
+)
+"""
+
+
+def _next_user_ids(db, after_user_id: int, chunk_size: int) -> list[int]:
+    rows = db.execute(
+        text("""
+        SELECT DISTINCT user_id
+        FROM credit_score_history
+        WHERE user_id > :after_user_id
+        ORDER BY user_id
+        LIMIT :chunk_size
+        """),
+        {"after_user_id": after_user_id, "chunk_size": chunk_size},
+    ).fetchall()
+    return [row.user_id for row in rows]
+
+
+# 운영은 MySQL 문법, 로컬 검증용 SQLite 대체 DB 에서는 같은 의미의 upsert 문을 사용 (app.repository.credit_repository 와 동일)
+_BACKFILL_SQL = {
+    "mysql": """
+    INSERT INTO credit_score_monthly (user_id, year, month, score_sum, score_count)
+    SELECT user_id, YEAR(created_at), MONTH(created_at), SUM(score), COUNT(*)
+    FROM credit_score_history
+    WHERE user_id BETWEEN :first_user_id AND :last_user_id
+    GROUP BY user_id, YEAR(created_at), MONTH(created_at)
+    ON DUPLICATE KEY UPDATE
+        score_sum = VALUES(score_sum),
+        score_count = VALUES(score_count)
+    """,
+    "sqlite": """
+    INSERT INTO credit_score_monthly (user_id, year, month, score_sum, score_count)
+    SELECT
+        user_id,
+        CAST(strftime('%Y', created_at) AS INTEGER),
+        CAST(strftime('%m', created_at) AS INTEGER),
+        SUM(score),
+        COUNT(*)
+    FROM credit_score_history
+    WHERE user_id BETWEEN :first_user_id AND :last_user_id
+    GROUP BY 1, 2, 3
+    ON CONFLICT (user_id, year, month) DO UPDATE SET
+        score_sum = excluded.score_sum,
+        score_count = excluded.score_count
+    """,
+}
+
+
+def _backfill_range(db, first_user_id: int, last_user_id: int):
+    dialect = "sqlite" if db.get_bind().dialect.name == "sqlite" else "mysql"
+    db.execute(
+        text(_BACKFILL_SQL[dialect]),
+        {"first_user_id": first_user_id, "last_user_id": last_user_id},
+    )
+    db.commit()
+
+
+def backfill(chunk_size: int = 1000, create_table: bool = False):
+    db = WriteSessionLocal()
+    try:
+        if create_table:
+            db.execute(text(CREATE_TABLE_SQL))
+            db.commit()
+
+        started = time.monotonic()
+        last_user_id = 0
+        total_users = 0
+        while True:
+            user_ids = _next_user_ids(db, last_user_id, chunk_size)
+            if not user_ids:
+                break
+            _backfill_range(db, user_ids[0], user_ids[-1])
+            last_user_id = user_ids[-1]
+            total_users += len(user_ids)
+            print(f"backfilled {total_users} users (last user_id={last_user_id})")
+
+        print(f"done: {total_users} users in {time.monotonic() - started:.1f}s")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build credit_score_monthly from credit_score_history")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="users per transaction")
+    parser.add_argument("--create-table", action="store_true", help="create credit_score_monthly if missing")
+    args = parser.parse_args()
+
+    backfill(chunk_size=args.chunk_size, create_table=args.create_table)
+
+
+if __name__ == "__main__":
+    main()
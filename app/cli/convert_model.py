@@ -0,0 +1,59 @@
+# 모델 pickle -> 읽기 전용 memory-map 모델 파일 변환
+#
+# 사용법:
+#   python -m app.cli.convert_model --output credit_model.mmap [--model-path credit_model.pkl] [--scaler-path scaler.pkl]
+#
+# credit_model.pkl / scaler.pkl 을 로드해 추론 엔진으로 컴파일(sklearn 결과와 비교 검증)한 뒤
+# 배열을 app.model.mmap_model 형식으로 저장하고, 저장한 파일을 다시 읽어 예측이 같은지 확인합니다.
+# 모델 버전은 pickle 로드 때와 같은 값(두 파일의 sha256)으로 기록되므로 스냅샷/ETag 도 그대로 유효합니다.
+# 서버에서는 MODEL_MMAP_PATH 에 출력 파일을 지정합니다 (기본 경로는 서버와 같은 환경 변수(.env)의 MODEL_PATH / SCALER_PATH).
+
+import argparse
+import os
+
+import numpy as np
+
+from app.config.config import settings
+from app.model.features import MODEL_FEATURE_ORDER
+from app.model.inference import build_inference_engine
+from app.model.load_model import load_model_pickles
+from app.model.mmap_model import load_mmap_model, save_mmap_model
+
+
+def convert_model(model_path: str, scaler_path: str, output_path: str) -> str:
+    model, scaler, version = load_model_pickles(model_path, scaler_path)
+    engine = build_inference_engine(scaler, model, MODEL_FEATURE_ORDER)
+    if not engine.compiled:
+        raise SystemExit(
+            f"{type(scaler).__name__} + {type(model).__name__} cannot be converted "
+            f"(only compiled scalers/models are supported): {engine.describe()}"
+        )
+
+    save_mmap_model(output_path, engine, version)
+
+    # 저장한 파일로 다시 예측해 원래 엔진과 비트 단위로 같은지 확인
+    loaded, loaded_version = load_mmap_model(output_path)
+    rng = np.random.default_rng(0)
+    center = getattr(scaler, "mean_", np.zeros(len(MODEL_FEATURE_ORDER)))
+    spread = getattr(scaler, "scale_", np.ones(len(MODEL_FEATURE_ORDER)))
+    probe = center + spread * rng.normal(size=(256, len(MODEL_FEATURE_ORDER))) * 2
+    if loaded_version != version or not np.array_equal(loaded.predict(probe), engine.predict(probe)):
+        os.remove(output_path)
+        raise SystemExit(f"Verification of {output_path} failed, file removed")
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the model/scaler pickles to a memory-mapped model file")
+    parser.add_argument("--model-path", default=settings.MODEL_PATH, help="model pickle (default: MODEL_PATH)")
+    parser.add_argument("--scaler-path", default=settings.SCALER_PATH, help="scaler pickle (default: SCALER_PATH)")
+    parser.add_argument("--output", required=True, help="memory-mapped model file to write")
+    args = parser.parse_args()
+
+    version = convert_model(args.model_path, args.scaler_path, args.output)
+    size = os.path.getsize(args.output)
+    print(f"wrote {args.output} ({size / 1024 / 1024:.1f} MiB, version={version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# 전체 고객 오프라인 재채점 배치
+#
+# 사용법:
+#   python -m app.cli.rescore_all [--source credit_score] [--chunk-size 1000] [--workers N]
+#                                 [--checkpoint rescore_checkpoint.json] [--restart]
+#
+# user_id 를 keyset 페이지네이션(user_id > 마지막 id)으로 chunk 단위로 읽어
+# 프로세스 풀에 나눠 피처 추출 + 점수 계산 + 일괄 저장(chunk 당 커밋 1회)을 수행합니다.
+# 앞에서부터 연속으로 끝난 chunk 의 마지막 user_id 를 체크포인트 파일에 기록하므로
+# 중간에 종료돼도 같은 명령으로 다시 실행하면 이어서 진행합니다.
+# DB 접속 정보는 서버와 같은 환경 변수(.env)를 사용하며 SQLite URL 로도 실행할 수 있습니다.
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import text
+
+
+# user_id 를 읽어올 테이블 -> DB
+USER_ID_SOURCES = {
+    "credit_score": "core",
+    "credit_score_history": "core",
+    "overseas_remittance": "core",
+    "mydata_transaction": "mydata",
+    "mydata_card": "mydata",
+    "mydata_loan": "mydata",
+}
+
+
+# =========================================================
+# user_id keyset 페이지네이션
+# =========================================================
+def _open_source_session(source: str):
+    if USER_ID_SOURCES[source] == "core":
+        from app.db.core_banking import ReadSessionLocal
+    else:
+        from app.db.mydata import ReadSessionLocal
+    return ReadSessionLocal()
+
+
+def iter_user_id_chunks(db, source: str, after_user_id: int, chunk_size: int):
+    query = text(f"""
+        SELECT DISTINCT user_id
+        FROM {source}
+        WHERE user_id > :after_user_id
+        ORDER BY user_id
+        LIMIT :chunk_size
+    """)
+    while True:
+        rows = db.execute(query, {"after_user_id": after_user_id, "chunk_size": chunk_size}).fetchall()
+        if not rows:
+            return
+        user_ids = [row.user_id for row in rows]
+        yield user_ids
+        after_user_id = user_ids[-1]
+
+
+# =========================================================
+# 워커 프로세스
+# =========================================================
+def _rescore_chunk(user_ids: list[int]) -> int:
+    # 각 워커 프로세스는 자신의 커넥션 풀/모델을 사용
+    from app.db.core_banking import ReadSessionLocal as CoreReadSessionLocal, WriteSessionLocal
+    from app.db.mydata import ReadSessionLocal as MydataReadSessionLocal
+    from app.service.scoring_service import calculate_credit_scores_batch
+
+    core_read_db = CoreReadSessionLocal()
+    core_write_db = WriteSessionLocal()
+    mydata_db = MydataReadSessionLocal()
+    try:
+        results = calculate_credit_scores_batch(user_ids, core_read_db, core_write_db, mydata_db)
+    finally:
+        core_read_db.close()
+        core_write_db.close()
+        mydata_db.close()
+    return len(results)
+
+
+# =========================================================
+# 체크포인트
+# =========================================================
+def load_checkpoint(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"last_user_id": 0, "scored": 0}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, last_user_id: int, scored: int):
+    # 임시 파일에 쓴 뒤 교체해서 종료 시점과 관계없이 파일이 깨지지 않도록 함
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"last_user_id": last_user_id, "scored": scored, "updated_at": time.time()}, f)
+    os.replace(tmp_path, path)
+
+
+# =========================================================
+# 실행
+# =========================================================
+def rescore_all(
+    source: str = "credit_score",
+    chunk_size: int = 1000,
+    workers: int = None,
+    checkpoint_path: str = "rescore_checkpoint.json",
+    restart: bool = False,
+):
+    workers = workers or os.cpu_count() or 1
+
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = load_checkpoint(checkpoint_path)
+    last_user_id = checkpoint["last_user_id"]
+    total_scored = checkpoint["scored"]
+    if last_user_id:
+        print(f"resuming after user_id={last_user_id} ({total_scored} users already scored)")
+
+    started = time.monotonic()
+    run_scored = 0
+    db = _open_source_session(source)
+    # fork 대신 spawn: 부모의 DB 커넥션을 자식이 공유하지 않도록 함
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        # (chunk 마지막 user_id, future) - 제출 순서대로 완료 처리해서 체크포인트가 건너뛰지 않도록 함
+        in_flight = deque()
+        max_in_flight = workers * 2
+
+        def drain_one():
+            nonlocal last_user_id, total_scored, run_scored
+            chunk_last_user_id, future = in_flight.popleft()
+            scored = future.result()
+            last_user_id = chunk_last_user_id
+            total_scored += scored
+            run_scored += scored
+            save_checkpoint(checkpoint_path, last_user_id, total_scored)
+
+            elapsed = time.monotonic() - started
+            rate = run_scored / elapsed if elapsed > 0 else 0.0
+            print(f"scored {total_scored} users (last user_id={last_user_id}, {rate:.1f} users/sec)")
+
+        for user_ids in iter_user_id_chunks(db, source, last_user_id, chunk_size):
+            in_flight.append((user_ids[-1], pool.submit(_rescore_chunk, user_ids)))
+            if len(in_flight) >= max_in_flight:
+                drain_one()
+        while in_flight:
+            drain_one()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        db.close()
+
+    elapsed = time.monotonic() - started
+    rate = run_scored / elapsed if elapsed > 0 else 0.0
+    print(f"done: {run_scored} users in {elapsed:.1f}s ({rate:.1f} users/sec), {total_scored} total")
+    return total_scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore every user offline with a process pool")
+    parser.add_argument("--source", choices=sorted(USER_ID_SOURCES), default="credit_score",
+                        help="table to read user_ids from")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="users per worker task / transaction")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", default="rescore_checkpoint.json", help="checkpoint file path")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start from the first user")
+    args = parser.parse_args()
+
+    rescore_all(
+        source=args.source,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+    )
+
+
+if __name__ == "__main__":
+    main()
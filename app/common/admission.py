@@ -0,0 +1,125 @@
+# 엔드포인트별 동시 처리 제한 (admission control)
+# 엔드포인트마다 동시에 처리하는 요청 수를 max_concurrent 로 제한하고, 넘는 요청은 최대 max_queue 개까지
+# 대기열에서 기다리게 합니다. 대기열이 가득 차면 바로 429, queue_timeout 초 안에 순서가 오지 않으면 503 을
+# Retry-After 헤더와 함께 반환해 과부하 시 DB 풀/MySQL 로 요청이 몰리지 않고 지연 시간이 무한히 늘지 않게 합니다.
+#
+# 제한은 이벤트 루프에서 실행되는 의존성(Depends)에서 걸기 때문에, 대기 중인 요청은 스레드 풀 스레드나
+# DB 커넥션을 잡고 있지 않습니다 (세션은 첫 쿼리 때 커넥션을 가져옴). 워커 프로세스별 제한입니다.
+
+import asyncio
+import time
+from collections import deque
+
+from fastapi import status
+
+from app.common.exceptions import OverloadedException
+from app.common.metrics import Counter, Gauge, Histogram
+from app.config.config import settings
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "credit_admission_in_flight", "Requests currently admitted per endpoint", ["endpoint"],
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "credit_admission_queue_depth", "Requests waiting for admission per endpoint", ["endpoint"],
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "credit_admission_wait_seconds", "Time spent waiting for admission per endpoint", ["endpoint"],
+)
+ADMISSION_REJECTED = Counter(
+    "credit_admission_rejected_total", "Requests rejected by admission control", ["endpoint", "reason"],
+)
+
+
+class AdmissionLimiter:
+    """엔드포인트 1개의 동시 처리 한도 + 대기열 (이벤트 루프 스레드에서만 사용)."""
+
+    def __init__(self, endpoint: str, max_concurrent: int, max_queue: int, queue_timeout: float,
+                 retry_after: int):
+        self.endpoint = endpoint
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self.active = 0
+        self._waiters = deque()
+
+        ADMISSION_IN_FLIGHT.labels(endpoint).set_function(lambda: self.active)
+        ADMISSION_QUEUE_DEPTH.labels(endpoint).set_function(lambda: len(self._waiters))
+
+    async def acquire(self):
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            ADMISSION_WAIT_SECONDS.labels(self.endpoint).observe(0.0)
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._reject("queue_full", status.HTTP_429_TOO_MANY_REQUESTS)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # 타임아웃/취소와 동시에 자리를 넘겨받았으면 다음 대기자에게 돌려줌
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._reject("queue_timeout", status.HTTP_503_SERVICE_UNAVAILABLE)
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+            ADMISSION_WAIT_SECONDS.labels(self.endpoint).observe(time.perf_counter() - started)
+
+    def release(self):
+        # 대기자가 있으면 자리를 그대로 넘김 (active 유지)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _reject(self, reason: str, status_code: int):
+        ADMISSION_REJECTED.labels(self.endpoint, reason).inc()
+        raise OverloadedException(
+            f"Too many concurrent {self.endpoint} requests ({reason})", self.retry_after, status_code,
+        )
+
+
+def _build_limiters() -> dict:
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return {}
+    return {
+        endpoint: AdmissionLimiter(
+            endpoint,
+            max_concurrent,
+            settings.ADMISSION_MAX_QUEUE.get(endpoint, 0),
+            settings.ADMISSION_QUEUE_TIMEOUT_SEC,
+            settings.ADMISSION_RETRY_AFTER_SEC,
+        )
+        for endpoint, max_concurrent in settings.ADMISSION_MAX_CONCURRENT.items()
+    }
+
+
+limiters = _build_limiters()
+
+
+def admission(endpoint: str):
+    """라우터 의존성: Depends(admission("scoring")). 설정에 없는 엔드포인트는 제한 없음."""
+    limiter = limiters.get(endpoint)
+
+    async def dependency():
+        if limiter is None:
+            yield
+            return
+        await limiter.acquire()
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    return dependency
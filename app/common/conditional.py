@@ -0,0 +1,62 @@
+# 조건부 GET (ETag / Last-Modified / 304)
+# 응답 내용을 결정하는 값(점수 갱신 시각, 데이터 워터마크, 모델 버전 등)으로 검증자(validator)를 만들고,
+# 요청의 If-None-Match / If-Modified-Since 와 같으면 본문 없이 304 를 반환합니다.
+# If-None-Match 가 있으면 If-Modified-Since 는 보지 않습니다 (RFC 9110).
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.config.config import settings
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": settings.HTTP_CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def make_validators(*parts, last_modified: datetime = None) -> Validators:
+    """parts 를 해시한 ETag. last_modified 는 naive 면 서버 로컬 시각으로 보고 초 단위로 내림."""
+    digest = hashlib.sha1("|".join("" if part is None else str(part) for part in parts).encode()).hexdigest()
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.astimezone()
+        last_modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+    return Validators(f'"{digest[:20]}"', last_modified)
+
+
+def is_not_modified(http_request: Request, validators: Validators) -> bool:
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or validators.etag in tags
+
+    if_modified_since = http_request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return validators.last_modified <= since
+
+
+def not_modified_response(validators: Validators) -> Response:
+    return Response(status_code=304, headers=validators.headers())
+
+
+def apply_validators(response: Response, validators: Validators):
+    response.headers.update(validators.headers())
@@ -6,3 +6,10 @@ class NotFoundException(HTTPException):
 
     def __init__(self, message: str = "Resource not found"):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+
+
+class OverloadedException(HTTPException):
+    """동시 처리 한도 + 대기열이 가득 찼을 때(429) 또는 대기 시간을 넘겼을 때(503)."""
+
+    def __init__(self, message: str, retry_after: int, status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE):
+        super().__init__(status_code=status_code, detail=message, headers={"Retry-After": str(retry_after)})
@@ -0,0 +1,143 @@
+# 기동 / 준비 상태 (readiness)
+# 워커 기동 시 모델 로드 + 더미 벡터 예측(warm-up), DB 풀 커넥션 미리 열기를 끝낸 뒤에만
+# GET /ready 가 200 을 반환합니다. Kubernetes readinessProbe 를 /ready 로 지정하면
+# 첫 요청이 모델 로드/지연 import(pandas 등)/커넥션 생성 비용을 떠안는 콜드 파드로 트래픽이 가지 않습니다.
+# 단계별 소요 시간(import 포함)은 /ready 응답과 credit_startup_seconds 메트릭으로 확인합니다.
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sqlalchemy import text
+
+from app.common.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+STARTUP_SECONDS = Gauge(
+    "credit_startup_seconds", "Worker startup time per phase", ["phase"],
+)
+READY = Gauge(
+    "credit_ready", "1 when startup warm-up finished and the worker accepts traffic",
+)
+
+# warm-up 예측 행 수: 단건(점수/보고서) + 일괄 채점 크기
+_WARMUP_BATCH_SIZES = (1, 64)
+
+
+class StartupState:
+    """워커 1개의 기동 단계별 소요 시간과 준비 여부."""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.ready = False
+        self.shutting_down = False
+        self.error = None
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float):
+        with self._lock:
+            self.phases[phase] = round(seconds, 6)
+        STARTUP_SECONDS.labels(phase).set(seconds)
+
+    def mark_ready(self):
+        self.ready = True
+        READY.set(1)
+
+    def mark_shutting_down(self):
+        # 종료 중에는 새 트래픽을 받지 않도록 준비 해제
+        self.shutting_down = True
+        READY.set(0)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready and not self.shutting_down
+
+    def info(self) -> dict:
+        with self._lock:
+            phases = dict(self.phases)
+        return {
+            "ready": self.is_ready,
+            "shutting_down": self.shutting_down,
+            "error": self.error,
+            "startup_seconds": phases,
+        }
+
+
+startup_state = StartupState()
+
+
+class _Phase:
+    """with 블록 소요 시간을 startup_state 에 기록."""
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        startup_state.record(self.phase, time.perf_counter() - self._started)
+        return False
+
+
+# =========================================================
+# warm-up
+# =========================================================
+def warm_up_model(registry, feature_order):
+    """
+    모델을 로드하고 MODEL_FEATURE_ORDER 길이의 더미 벡터로 예측해 지연 로드 경로를 미리 실행합니다.
+    (점수 메트릭에 남지 않도록 score_calculator 가 아닌 추론 엔진을 직접 호출)
+    """
+    with _Phase("model_load"):
+        bundle = registry.load()
+    with _Phase("model_warmup"):
+        for size in _WARMUP_BATCH_SIZES:
+            bundle.engine.predict(np.zeros((size, len(feature_order)), dtype=np.float64))
+
+
+def warm_up_features():
+    # 피처 추출 함수도 빈 입력으로 한 번 실행 (모듈 로드 / 첫 호출 비용)
+    from app.service.feature_extractor import extract_features
+
+    with _Phase("feature_warmup"):
+        extract_features([], [], [], [])
+
+
+def _open_connections(engine, count: int):
+    # count 개를 동시에 체크아웃해야 서로 다른 커넥션이 풀에 쌓임
+    connections = []
+    try:
+        for _ in range(count):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _pool_connections(engine, requested: int) -> int:
+    # 풀 크기를 넘겨 열면 overflow 커넥션이라 반환 시 닫힘
+    size = getattr(engine.pool, "size", None)
+    return min(requested, size()) if callable(size) else requested
+
+
+def warm_up_pools(engines: dict, connections_per_engine: int):
+    """엔진별로 커넥션을 미리 열어 풀에 반환해 둡니다. 실패해도 기동은 계속 (요청 시 다시 연결)."""
+    if connections_per_engine <= 0:
+        return
+    with _Phase("pool_warmup"):
+        with ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix="pool-warmup") as executor:
+            futures = {
+                name: executor.submit(_open_connections, engine, _pool_connections(engine, connections_per_engine))
+                for name, engine in engines.items()
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning("Failed to pre-open connections for %s: %s", name, e)
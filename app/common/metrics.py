@@ -0,0 +1,313 @@
+# 단계별 지연 시간 / 건수 메트릭 (Prometheus text format)
+# 외부 패키지 없이 프로세스 내에서 집계하고 GET /metrics 에서 노출합니다.
+# 관측 1회 = dict 조회 + bisect + lock 1회 수준이라 운영에서 항상 켜 둘 수 있습니다.
+# uvicorn 워커가 여러 개면 워커별로 따로 집계됩니다 (Prometheus 에서 instance/pod 단위로 합산).
+# trace_as 를 지정한 메트릭은 요청 프로파일링 중(current_trace 설정 시) 요청별 값도 함께 기록합니다.
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+# 기본 지연 시간 버킷(초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 행 수 버킷
+ROW_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+
+# 현재 요청의 추적 객체 (add(key, value) 제공) - 프로파일링 대상 요청에서만 설정
+current_trace = ContextVar("current_trace", default=None)
+
+
+def _format_labels(labelnames, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry=None, trace_as: str = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.trace_as = trace_as
+        self._children = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    if self.trace_as:
+                        child.trace_key = ".".join((self.trace_as, *key))
+                    self._children[key] = child
+        return child
+
+    def _default(self):
+        # 라벨 없는 메트릭은 자기 자신처럼 사용
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(child.samples(self.name, self.labelnames, values))
+        return lines
+
+
+def _trace(key: str, value: float):
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add(key, value)
+
+
+# -----------------------------
+#   Counter
+# -----------------------------
+class _CounterChild:
+
+    def __init__(self):
+        self.value = 0.0
+        self.trace_key = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+        if self.trace_key is not None:
+            _trace(self.trace_key, amount)
+
+    def samples(self, name, labelnames, values):
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+
+# -----------------------------
+#   Gauge
+# -----------------------------
+class _GaugeChild:
+
+    def __init__(self):
+        self.value = 0.0
+        self._function = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set_function(self, function):
+        # 조회 시점에 값을 계산 (큐 길이 등)
+        self._function = function
+
+    def samples(self, name, labelnames, values):
+        value = self._function() if self._function is not None else self.value
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(value)}"]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default().dec(amount)
+
+    def set_function(self, function):
+        self._default().set_function(function)
+
+
+# -----------------------------
+#   Histogram
+# -----------------------------
+class _Timer:
+
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child):
+        self._child = child
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._child.observe(time.perf_counter() - self._started)
+        return False
+
+
+class _HistogramChild:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # 마지막 칸은 +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.trace_key = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+        if self.trace_key is not None:
+            _trace(self.trace_key, value)
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+    def samples(self, name, labelnames, values):
+        with self._lock:
+            counts = list(self.counts)
+            total = self.sum
+        lines = []
+        cumulative = 0
+        for upper, count in zip((*self.buckets, float("inf")), counts):
+            cumulative += count
+            le = 'le="' + _format_value(upper) + '"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, values)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labelnames, values)} {cumulative}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS,
+                 registry=None, trace_as: str = None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry, trace_as)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default().observe(value)
+
+    def time(self) -> _Timer:
+        return self._default().time()
+
+
+# -----------------------------
+#   Registry
+# -----------------------------
+class MetricsRegistry:
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# =========================================================
+# 신용 점수 서비스 메트릭
+# =========================================================
+# 단계: extract_features (유저 1명), inference (predict 호출 1회)
+STAGE_SECONDS = Histogram(
+    "credit_scoring_stage_seconds", "Latency of scoring pipeline stages", ["stage"], trace_as="stage_seconds",
+)
+# 테이블별 조회 쿼리 (overseas_remittance = Core Banking, mydata_* = MyData)
+DB_QUERY_SECONDS = Histogram(
+    "credit_db_query_seconds", "Latency of feature input queries per table", ["table"], trace_as="query_seconds",
+)
+DB_ROWS_FETCHED = Counter(
+    "credit_db_rows_fetched_total", "Rows returned by feature input queries per table", ["table"],
+    trace_as="rows_fetched",
+)
+# 점수 저장: 테이블별 upsert 와 커밋
+DB_WRITE_SECONDS = Histogram(
+    "credit_db_write_seconds", "Latency of score upserts per table and of the commit", ["statement"],
+    trace_as="write_seconds",
+)
+# 피처 추출 1건에 들어간 테이블별 행 수 (SQL 집계 경로는 집계 대상 행 수)
+FEATURE_INPUT_ROWS = Histogram(
+    "credit_feature_input_rows", "Rows per table used for one feature extraction", ["table"],
+    buckets=ROW_BUCKETS, trace_as="feature_input_rows",
+)
+INFERENCE_ROWS = Counter(
+    "credit_inference_rows_total", "Feature vectors scored by the model",
+)
+SCORING_FALLBACKS = Counter(
+    "credit_scoring_fallback_total", "Scores replaced by the 550 default", ["reason"],
+)
+
+
+def observe_query(table: str, elapsed: float, rows: int):
+    """테이블 조회 1회의 소요 시간(초)과 행 수를 기록합니다."""
+    DB_QUERY_SECONDS.labels(table).observe(elapsed)
+    DB_ROWS_FETCHED.labels(table).inc(rows)
+
+
+def track_query(table: str):
+    """조회 함수 데코레이터: 실행 시간과 반환 행 수(fetchall 리스트 길이, fetchone 은 0/1)를 기록."""
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            result = fetch(*args, **kwargs)
+            rows = len(result) if isinstance(result, list) else int(result is not None)
+            observe_query(table, time.perf_counter() - started, rows)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,207 @@
+# 요청 단위 프로파일링 (opt-in)
+# PROFILING_ENABLED 일 때, 요청 헤더(PROFILING_HEADER)가 있거나 샘플링(PROFILING_SAMPLE_RATE)에
+# 걸린 요청만 cProfile + 단계별 시간/테이블별 행 수를 기록해 PROFILING_DIR 에 남깁니다.
+# 파일은 최신 PROFILING_MAX_FILES 건만 유지합니다 (오래된 것부터 삭제).
+#
+# - <id>.json : 엔드포인트, user_id, 총 소요 시간, 단계별 시간/행 수, 누적 시간 상위 함수
+# - <id>.prof : cProfile 원본 (python -m pstats / snakeviz 로 확인)
+#
+# cProfile 은 스레드 단위이고 await 동안에도 켜져 있어, 이벤트 루프에서 핸들러 전체를 감싸면 그 사이 실행된
+# 다른 요청의 코루틴이 섞이고 스레드 풀에서 실행되는 조회/피처 추출/추론은 빠집니다.
+# 그래서 요청의 스레드 풀 작업(run_profiled 로 실행한 함수)마다 그 스레드에서 따로 cProfile 을 켜고,
+# 요청이 끝나면 합쳐서 저장합니다. 이벤트 루프에서의 대기/조정 시간은 총 소요 시간과 단계별 시간으로 확인합니다.
+
+import cProfile
+import contextvars
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from app.common.metrics import current_trace
+from app.config.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프로파일링 중인 요청의 RequestProfile (스레드 풀 작업에도 컨텍스트로 전달됨)
+_current_profile: contextvars.ContextVar = contextvars.ContextVar("current_profile", default=None)
+# 스레드별로 cProfile 이 이미 켜져 있는지 (중첩 호출은 바깥 프로파일에 포함)
+_thread_state = threading.local()
+
+
+class RequestTrace:
+    """요청 1건 동안 메트릭 관측값을 key 별 (건수, 합계)로 모읍니다."""
+
+    def __init__(self):
+        self.values: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, value: float):
+        with self._lock:
+            entry = self.values.get(key)
+            if entry is None:
+                self.values[key] = [1, value]
+            else:
+                entry[0] += 1
+                entry[1] += value
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                key: {"count": count, "total": round(total, 6)}
+                for key, (count, total) in sorted(self.values.items())
+            }
+
+
+class RequestProfile:
+    """요청 1건의 스레드 풀 작업별 cProfile 결과를 합칩니다."""
+
+    def __init__(self):
+        self.stats = None
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def add(self, profiler: cProfile.Profile):
+        with self._lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profiler)
+            else:
+                self.stats.add(profiler)
+            self.calls += 1
+
+
+def run_profiled(fn, *args, **kwargs):
+    """
+    스레드 풀에서 실행하는 요청 작업용 래퍼. 프로파일링 중인 요청이면 이 스레드에서 fn 실행만 cProfile 로 측정합니다.
+    (예: run_in_threadpool(run_profiled, fn, *args))
+    """
+    profile = _current_profile.get()
+    if profile is None or getattr(_thread_state, "active", False):
+        return fn(*args, **kwargs)
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # 다른 프로파일러가 이미 실행 중 (Python 3.12+ 에서는 cProfile 이 프로세스 전체에 1개)
+        return fn(*args, **kwargs)
+    _thread_state.active = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        _thread_state.active = False
+        profile.add(profiler)
+
+
+class RequestProfiler:
+
+    def __init__(self, enabled: bool, header: str, sample_rate: float, directory: str, max_files: int,
+                 top_functions: int = 40):
+        self.enabled = enabled
+        self.header = header.lower()
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_files = max_files
+        self.top_functions = top_functions
+
+        self._write_lock = threading.Lock()
+        self._seq = 0
+
+    def should_profile(self, http_request) -> bool:
+        if not self.enabled:
+            return False
+        if http_request is not None and http_request.headers.get(self.header):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, endpoint: str, http_request, user_id: int = None):
+        """대상 요청이면 블록 실행을 프로파일링하고 결과 파일을 남깁니다."""
+        if not self.should_profile(http_request):
+            yield
+            return
+
+        trace = RequestTrace()
+        profile = RequestProfile()
+        trace_token = current_trace.set(trace)
+        profile_token = _current_profile.set(profile)
+        started_at = datetime.now()
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = repr(e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_profile.reset(profile_token)
+            current_trace.reset(trace_token)
+            try:
+                self._write(endpoint, user_id, started_at, elapsed, trace, profile, error)
+            except Exception as e:
+                logger.warning("Failed to write request profile for %s: %s", endpoint, e)
+
+    # ---------------- 저장 ----------------
+    def _write(self, endpoint, user_id, started_at, elapsed, trace, profile: RequestProfile, error):
+        with self._write_lock:
+            self._seq += 1
+            profile_id = f"{started_at:%Y%m%d-%H%M%S-%f}-{os.getpid()}-{self._seq}-{endpoint}"
+        if user_id is not None:
+            profile_id += f"-u{user_id}"
+
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, profile_id)
+
+        report = {
+            "endpoint": endpoint,
+            "user_id": user_id,
+            "started_at": started_at.isoformat(),
+            "elapsed_sec": round(elapsed, 6),
+            "error": error,
+            "trace": trace.summary(),
+            "profiled_calls": profile.calls,
+            "top_functions": None,
+        }
+        if profile.stats is not None:
+            profile.stats.dump_stats(base + ".prof")
+            out = io.StringIO()
+            profile.stats.stream = out
+            profile.stats.sort_stats("cumulative").print_stats(self.top_functions)
+            report["top_functions"] = out.getvalue().splitlines()
+
+        with open(base + ".json", "w") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        logger.info("Request profile written: %s.json (%.1f ms)", base, elapsed * 1000)
+        self._prune()
+
+    def _prune(self):
+        # 최신 max_files 건(json 기준)만 남기고 짝이 되는 .prof 도 함께 삭제
+        try:
+            names = sorted(name for name in os.listdir(self.directory) if name.endswith(".json"))
+        except FileNotFoundError:
+            return
+        for name in names[:max(len(names) - self.max_files, 0)]:
+            stem = os.path.join(self.directory, name[:-len(".json")])
+            for path in (stem + ".json", stem + ".prof"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+request_profiler = RequestProfiler(
+    enabled=settings.PROFILING_ENABLED,
+    header=settings.PROFILING_HEADER,
+    sample_rate=settings.PROFILING_SAMPLE_RATE,
+    directory=settings.PROFILING_DIR,
+    max_files=settings.PROFILING_MAX_FILES,
+)
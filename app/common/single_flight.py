@@ -0,0 +1,54 @@
+# 동일 키 동시 요청 병합 (single-flight)
+# 같은 키로 동시에 들어온 요청은 먼저 시작된 계산 1개(asyncio Task)의 결과를 함께 기다립니다.
+# - 계산이 예외로 끝나면 기다리던 모든 요청에 같은 예외가 전달됩니다.
+# - 각 요청은 timeout 초까지만 기다립니다. 한 요청의 타임아웃/취소(클라이언트 연결 끊김)는
+#   공유 계산을 취소하지 않으며, 계산이 끝나면 키가 지워져 다음 요청은 새로 계산합니다.
+# 이벤트 루프 스레드에서만 사용합니다 (워커 프로세스별).
+
+import asyncio
+
+from app.common.metrics import Counter
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "credit_single_flight_calls_total", "Single-flight calls that started (leader) or joined (follower) a computation",
+    ["name", "role"],
+)
+SINGLE_FLIGHT_TIMEOUTS = Counter(
+    "credit_single_flight_timeouts_total", "Single-flight waits that hit the timeout", ["name"],
+)
+
+
+class SingleFlight:
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        self._calls: dict = {}
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key, fn):
+        """key 로 진행 중인 계산이 있으면 그 결과를, 없으면 fn()을 실행해 결과를 반환합니다."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            SINGLE_FLIGHT_CALLS.labels(self.name, "leader").inc()
+        else:
+            SINGLE_FLIGHT_CALLS.labels(self.name, "follower").inc()
+
+        try:
+            # shield: 기다리던 요청이 취소/타임아웃되어도 공유 계산은 계속 진행
+            return await asyncio.wait_for(asyncio.shield(task), self.timeout)
+        except asyncio.TimeoutError:
+            SINGLE_FLIGHT_TIMEOUTS.labels(self.name).inc()
+            raise
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
@@ -4,12 +4,101 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     MODEL_PATH: str
     SCALER_PATH: str
+    # 모델 파일 변경 확인 주기(초), 0이면 핫 리로드 비활성화
+    MODEL_RELOAD_INTERVAL_SEC: float = 5.0
+    # 읽기 전용 memory-map 모델 파일 (python -m app.cli.convert_model 로 생성), 지정하면 pickle 대신 사용
+    # 워커들이 같은 물리 메모리를 공유하므로 워커 수만큼 모델 메모리가 늘지 않음
+    MODEL_MMAP_PATH: Optional[str] = None
 
     CORE_BANKING_DB_URL: str
     CORE_BANKING_READ_DB_URL: Optional[str] = None
     MYDATA_DB_URL: str
     MYDATA_READ_DB_URL: Optional[str] = None
 
+    # 커넥션 풀 (엔진별) - 요청 1건이 MyData 커넥션을 최대 3개 동시에 사용
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # 기동 시 엔진별로 미리 열어 둘 커넥션 수 (DB_POOL_SIZE 이하, 0이면 끔)
+    STARTUP_POOL_PREWARM_CONNECTIONS: int = 4
+    # 4개 테이블 동시 조회에 쓰는 스레드 수
+    DB_FETCH_WORKERS: int = 32
+
+    # 피처 입력 조회 시 기간 조건/집계를 SQL로 처리 (False면 전체 행 조회 후 Python 계산)
+    FEATURE_SQL_PUSHDOWN: bool = True
+    # FEATURE_SQL_PUSHDOWN=False 일 때 전체 행을 서버 사이드 커서로 chunk 단위 조회하며 한 번에 누적 (메모리 일정)
+    FEATURE_STREAMING: bool = False
+    FEATURE_STREAM_CHUNK_SIZE: int = 1000
+    # 유저별 증분 피처 상태(credit_feature_state) 사용: 워터마크 이후 수집된 입출금/카드 행만 조회 (다른 조회 방식보다 우선)
+    FEATURE_INCREMENTAL_STATE: bool = False
+    # 최근 N초 이내 수집된 행은 상태에 저장하지 않고 이번 계산에만 반영 (수집 지연 커밋 대비)
+    FEATURE_STATE_SETTLE_SEC: float = 300.0
+
+    # 점수 계산 시 피처 스냅샷(credit_feature_snapshot)을 함께 저장하고, 보고서/예측은 신선한 스냅샷이 있으면 그대로 사용
+    FEATURE_SNAPSHOT_ENABLED: bool = False
+    FEATURE_SNAPSHOT_MAX_AGE_SEC: float = 300.0
+
+    # 점수/히스토리/보고서 GET 응답의 Cache-Control (ETag 로 재검증, 304 는 본문 없음)
+    HTTP_CACHE_CONTROL: str = "private, no-cache"
+
+    # 유저 피처 캐시 (키에 데이터 워터마크 포함)
+    FEATURE_CACHE_ENABLED: bool = True
+    FEATURE_CACHE_MAX_SIZE: int = 10000
+    FEATURE_CACHE_TTL_SEC: float = 300.0
+    # 워커 간 공유 캐시 (redis 패키지 필요), 없으면 프로세스 내 캐시만 사용
+    FEATURE_CACHE_REDIS_URL: Optional[str] = None
+
+    # 예측 grid 요청 1건의 최대 송금액 수
+    PREDICTION_GRID_MAX_AMOUNTS: int = 200
+
+    # 같은 유저의 동시 요청은 조회 + 피처 추출 1번의 결과를 함께 사용 (요청별 대기 한도, 넘으면 503)
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_TIMEOUT_SEC: float = 10.0
+
+    # 점수 저장 write-behind (동시 요청의 upsert를 모아서 저장)
+    SCORE_WRITE_BEHIND_ENABLED: bool = False
+    SCORE_WRITE_BEHIND_MAX_BATCH: int = 500
+    SCORE_WRITE_BEHIND_FLUSH_INTERVAL_SEC: float = 0.5
+
+    # 비동기 점수 계산 (POST /jobs -> 202 + job id, 로컬 SQLite 파일 큐 + 백그라운드 워커 스레드)
+    SCORE_JOBS_ENABLED: bool = False
+    SCORE_JOB_QUEUE_PATH: str = "score_jobs.db"
+    # 프로세스당 워커 스레드 수 (uvicorn 워커 수만큼 곱해짐)
+    SCORE_JOB_WORKERS: int = 4
+    SCORE_JOB_POLL_INTERVAL_SEC: float = 0.5
+    # 처리 중 프로세스가 죽은 작업을 다시 처리하기까지의 시간
+    SCORE_JOB_LEASE_SEC: float = 300.0
+    # lease 만료로 다시 가져갈 수 있는 최대 횟수 (첫 시도 포함), 넘으면 failed
+    SCORE_JOB_MAX_ATTEMPTS: int = 3
+    # 끝난 작업(결과) 보관 시간
+    SCORE_JOB_RETENTION_SEC: float = 86400.0
+
+    # 일괄 채점 시 한 번에 조회/예측/저장할 유저 수
+    BATCH_SCORE_CHUNK_SIZE: int = 1000
+
+    # 최신 점수/히스토리 일괄 조회 (POST /lookup, NDJSON 스트리밍): 요청 1건의 최대 유저 수, 쿼리 1회당 유저 수
+    BULK_LOOKUP_MAX_USERS: int = 100000
+    BULK_LOOKUP_CHUNK_SIZE: int = 1000
+
+    # 엔드포인트별 동시 처리 제한: 한도를 넘는 요청은 대기열(ADMISSION_MAX_QUEUE)에서 기다리고,
+    # 대기열이 가득 차면 429, ADMISSION_QUEUE_TIMEOUT_SEC 안에 처리되지 못하면 503 (둘 다 Retry-After 포함)
+    ADMISSION_CONTROL_ENABLED: bool = False
+    ADMISSION_MAX_CONCURRENT: dict[str, int] = {
+        "scoring": 8, "batch": 1, "lookup": 2, "latest": 32, "history": 32, "report": 8, "prediction": 8,
+    }
+    ADMISSION_MAX_QUEUE: dict[str, int] = {
+        "scoring": 32, "batch": 2, "lookup": 4, "latest": 128, "history": 128, "report": 32, "prediction": 32,
+    }
+    ADMISSION_QUEUE_TIMEOUT_SEC: float = 2.0
+    ADMISSION_RETRY_AFTER_SEC: int = 1
+
+    # 요청 프로파일링 (opt-in): 헤더가 있거나 샘플링된 요청만 cProfile + 단계별 시간 기록
+    PROFILING_ENABLED: bool = False
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_DIR: str = "profiles"
+    # 보관할 최대 프로파일 수 (넘으면 오래된 것부터 삭제)
+    PROFILING_MAX_FILES: int = 200
+
     class Config:
         env_file = ".env"
 
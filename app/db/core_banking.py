@@ -4,10 +4,17 @@ from sqlalchemy.orm import sessionmaker
 from app.config.config import settings
 
 
-write_engine = create_engine(settings.CORE_BANKING_DB_URL, pool_pre_ping=True)
+write_engine = create_engine(
+    settings.CORE_BANKING_DB_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
 read_engine = create_engine(
     settings.CORE_BANKING_READ_DB_URL or settings.CORE_BANKING_DB_URL,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
 )
 
 WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
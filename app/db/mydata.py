@@ -7,6 +7,8 @@ from app.config.config import settings
 read_engine = create_engine(
     settings.MYDATA_READ_DB_URL or settings.MYDATA_DB_URL,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
 )
 ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
@@ -1,12 +1,104 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from app.api.scoring import router as score_router
+from app.common import metrics
+from app.common.lifecycle import startup_state, warm_up_features, warm_up_model, warm_up_pools
+from app.config.config import settings
+from app.db import core_banking, mydata
+from app.model.features import MODEL_FEATURE_ORDER
+from app.model.registry import model_registry
+from app.repository.score_write_buffer import score_write_buffer
+from app.service.score_jobs import score_job_workers
+from app.service.feature_cache import feature_cache
+
+
+# 기동: 모델/피처/커넥션 풀 warm-up 후 readiness 전환
+def on_startup():
+    started = time.perf_counter()
+    try:
+        # 모델/스케일러는 기동 시 한 번만 로드하고 이후에는 레지스트리에서 재사용 (더미 벡터로 warm-up)
+        warm_up_model(model_registry, MODEL_FEATURE_ORDER)
+        warm_up_features()
+        warm_up_pools(
+            {
+                "core_banking_write": core_banking.write_engine,
+                "core_banking_read": core_banking.read_engine,
+                "mydata_read": mydata.read_engine,
+            },
+            settings.STARTUP_POOL_PREWARM_CONNECTIONS,
+        )
+    except Exception as e:
+        startup_state.error = repr(e)
+        raise
+    if settings.SCORE_WRITE_BEHIND_ENABLED:
+        score_write_buffer.start()
+    if settings.SCORE_JOBS_ENABLED:
+        score_job_workers.start()
+
+    startup_state.record("startup", time.perf_counter() - started)
+    startup_state.mark_ready()
+
+
+# 종료: readiness 해제 후 백그라운드 작업/버퍼 정리
+def on_shutdown():
+    startup_state.mark_shutting_down()
+    # 실행 중인 비동기 작업 마무리 (대기 중 작업은 큐 파일에 남음)
+    if settings.SCORE_JOBS_ENABLED:
+        score_job_workers.close()
+    # 버퍼에 남은 점수 저장
+    if settings.SCORE_WRITE_BEHIND_ENABLED:
+        score_write_buffer.close()
+
+
+# 기동 중 예외가 나면 서버가 시작되지 않으므로 종료 처리는 실행하지 않음
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    on_startup()
+    try:
+        yield
+    finally:
+        on_shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# app.main 모듈 import (설정 로드, 엔진 생성, 라우터/서비스 모듈 import) 소요 시간
+startup_state.record("import", time.perf_counter() - _import_started)
 
-app = FastAPI()
 
 @app.get("/")
 def root():
     return {"message": "Credit Rating API Server Running"}
 
 
+# readiness probe: 기동 warm-up 완료 후 200, 그 전/종료 중에는 503
+@app.get("/ready")
+def ready():
+    return JSONResponse(startup_state.info(), status_code=200 if startup_state.is_ready else 503)
+
+
+# 현재 로드된 모델 버전/로드 시각 (운영 확인용)
+@app.get("/model")
+def model_info():
+    return model_registry.info()
+
+
+# 피처 캐시 적중/미스 통계
+@app.get("/cache/features")
+def feature_cache_stats():
+    return feature_cache.stats()
+
+
+# 단계별 지연 시간 / 조회 행 수 (Prometheus scrape)
+@app.get("/metrics")
+def prometheus_metrics():
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # score 라우터 연결
 app.include_router(score_router, prefix="/api/server/credit-score", tags=["Scoring Credit Rating"])
@@ -0,0 +1,22 @@
+# ML 모델이 학습된 실제 Feature 순서 (18개)
+# 주의: card_risky_month_count는 학습 데이터에 없으므로 포함하지 않습니다.
+MODEL_FEATURE_ORDER = [
+    "income_avg_6m",
+    "income_volatility_6m",
+    "spending_avg_6m",
+    "saving_rate_6m",
+    "min_balance_3m",
+    "liquidity_months_3m",
+    "remittance_count_6m",
+    "remittance_amount_avg_6m",
+    "remittance_amount_std_6m",
+    "remittance_income_ratio",
+    "remittance_failure_rate_6m",
+    "remittance_cycle_stability",
+    "dti_loan_ratio",
+    "loan_overdue_score",
+    "recent_overdue_flag",
+    "card_utilization_3m",
+    "card_cash_advance_ratio",
+    "risk_event_count"
+]
@@ -0,0 +1,288 @@
+# pandas 없이 동작하는 추론 엔진
+# 로드 시점에 scaler 파라미터와 모델 계수/트리 배열을 연속된 NumPy 버퍼로 꺼내 두고
+# 피처 벡터/행렬을 직접 계산합니다. 지원하지 않는 타입은 sklearn 으로 그대로 예측합니다.
+# 컴파일된 scaler/모델은 ARRAYS(NumPy 배열) + META(스칼라) 속성만으로 복원할 수 있어
+# app.model.mmap_model 파일에 저장하고 읽기 전용 memory-map 으로 다시 만들 수 있습니다.
+
+import logging
+import warnings
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+#   Scaler
+# -----------------------------
+class _AffineScaler:
+    """X * mul + add 형태로 표현되는 스케일러 (StandardScaler, MinMaxScaler, RobustScaler)."""
+
+    ARRAYS = ("sub", "div", "mul", "add")
+    META = ()
+
+    def __init__(self, sub, div, mul, add):
+        self.sub = sub
+        self.div = div
+        self.mul = mul
+        self.add = add
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        # sklearn 과 같은 연산 순서 유지 (결과 비트 단위 동일)
+        X = np.array(X, dtype=np.float64)
+        if self.sub is not None:
+            X -= self.sub
+        if self.div is not None:
+            X /= self.div
+        if self.mul is not None:
+            X *= self.mul
+        if self.add is not None:
+            X += self.add
+        return X
+
+
+def _compile_scaler(scaler):
+    from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+
+    if type(scaler) is StandardScaler:
+        return _AffineScaler(
+            sub=np.ascontiguousarray(scaler.mean_) if scaler.with_mean else None,
+            div=np.ascontiguousarray(scaler.scale_) if scaler.with_std else None,
+            mul=None,
+            add=None,
+        )
+    if type(scaler) is RobustScaler:
+        return _AffineScaler(
+            sub=np.ascontiguousarray(scaler.center_) if scaler.with_centering else None,
+            div=np.ascontiguousarray(scaler.scale_) if scaler.with_scaling else None,
+            mul=None,
+            add=None,
+        )
+    if type(scaler) is MinMaxScaler and not scaler.clip:
+        return _AffineScaler(
+            sub=None,
+            div=None,
+            mul=np.ascontiguousarray(scaler.scale_),
+            add=np.ascontiguousarray(scaler.min_),
+        )
+    return None
+
+
+# -----------------------------
+#   Model
+# -----------------------------
+class _LinearModel:
+
+    ARRAYS = ("coef",)
+    META = ("intercept",)
+
+    def __init__(self, coef, intercept):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.coef + self.intercept
+
+
+class _TreeEnsemble:
+    """
+    여러 회귀 트리를 하나의 노드 배열로 합친 구조.
+    모든 행 x 모든 트리를 깊이 단위로 동시에 내려가며 leaf 값을 찾습니다.
+    sklearn 과 같이 입력을 float32 로 변환한 뒤 threshold 와 비교합니다.
+    """
+
+    ARRAYS = ("left", "right", "feature", "threshold", "value", "roots")
+    META = ("max_depth", "scale", "init", "average")
+
+    def __init__(self, trees, scale: float, init: float, average: bool):
+        left, right, feature, threshold, value, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for tree in trees:
+            n = tree.node_count
+            is_leaf = tree.children_left == -1
+            # leaf 노드는 자기 자신을 가리키게 해서 루프 종료 후에도 제자리에 머물도록 함
+            left.append(np.where(is_leaf, np.arange(n), tree.children_left) + offset)
+            right.append(np.where(is_leaf, np.arange(n), tree.children_right) + offset)
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            value.append(tree.value[:, 0, 0])
+            roots.append(offset)
+            offset += n
+            max_depth = max(max_depth, tree.max_depth)
+
+        self.left = np.ascontiguousarray(np.concatenate(left), dtype=np.intp)
+        self.right = np.ascontiguousarray(np.concatenate(right), dtype=np.intp)
+        self.feature = np.ascontiguousarray(np.concatenate(feature), dtype=np.intp)
+        self.threshold = np.ascontiguousarray(np.concatenate(threshold), dtype=np.float64)
+        self.value = np.ascontiguousarray(np.concatenate(value), dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.intp)
+        self.max_depth = max_depth
+        self.scale = scale
+        self.init = init
+        self.average = average
+
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        X32 = X.astype(np.float32)
+        rows = np.arange(X32.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X32.shape[0], self.roots.size)).copy()
+        for _ in range(self.max_depth):
+            go_left = X32[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        leaves = self._leaf_values(X)
+        out = np.full(X.shape[0], self.init, dtype=np.float64)
+        # 트리 순서대로 누적 (sklearn 과 같은 합산 순서)
+        for t in range(leaves.shape[1]):
+            if self.scale == 1.0:
+                out += leaves[:, t]
+            else:
+                out += self.scale * leaves[:, t]
+        if self.average:
+            out /= leaves.shape[1]
+        return out
+
+
+def _compile_model(model):
+    from sklearn.base import is_regressor
+    from sklearn.dummy import DummyRegressor
+    from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingRegressor, RandomForestRegressor
+    from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+    from sklearn.tree import DecisionTreeRegressor, ExtraTreeRegressor
+
+    if type(model) in (LinearRegression, Ridge, Lasso, ElasticNet) and np.ndim(model.coef_) == 1:
+        return _LinearModel(model.coef_, model.intercept_)
+
+    if type(model) in (DecisionTreeRegressor, ExtraTreeRegressor) and model.n_outputs_ == 1:
+        return _TreeEnsemble([model.tree_], scale=1.0, init=0.0, average=False)
+
+    if type(model) in (RandomForestRegressor, ExtraTreesRegressor) and model.n_outputs_ == 1:
+        return _TreeEnsemble([est.tree_ for est in model.estimators_], scale=1.0, init=0.0, average=True)
+
+    if type(model) is GradientBoostingRegressor and is_regressor(model):
+        if model.init_ == "zero":
+            init = 0.0
+        elif type(model.init_) is DummyRegressor:
+            init = float(np.ravel(model.init_.constant_)[0])
+        else:
+            return None
+        return _TreeEnsemble(
+            [est.tree_ for est in model.estimators_[:, 0]],
+            scale=float(model.learning_rate),
+            init=init,
+            average=False,
+        )
+
+    return None
+
+
+# -----------------------------
+#   Engine
+# -----------------------------
+class InferenceEngine:
+    """
+    scaler + 모델 추론기. predict()는 (N, n_features) 행렬을 받아 (N,) 원점수를 반환합니다.
+    컴파일할 수 없는 scaler/모델은 각각 sklearn 객체로 처리합니다.
+    """
+
+    def __init__(self, scaler, model, feature_names):
+        self.scaler = scaler
+        self.model = model
+        self.feature_names = list(feature_names)
+        self.scaler_name = type(scaler).__name__
+        self.model_name = type(model).__name__
+
+        self._scaler = _compile_scaler(scaler)
+        self._model = _compile_model(model)
+
+    @classmethod
+    def from_compiled(cls, compiled_scaler, compiled_model, feature_names, scaler_name: str, model_name: str):
+        """sklearn 객체 없이 컴파일된 scaler/모델만으로 만든 엔진 (mmap 모델 파일 로드용)."""
+        engine = cls.__new__(cls)
+        engine.scaler = None
+        engine.model = None
+        engine.feature_names = list(feature_names)
+        engine.scaler_name = scaler_name
+        engine.model_name = model_name
+        engine._scaler = compiled_scaler
+        engine._model = compiled_model
+        return engine
+
+    @property
+    def compiled(self) -> bool:
+        return self._scaler is not None and self._model is not None
+
+    def describe(self) -> dict:
+        return {
+            "scaler": self.scaler_name,
+            "model": self.model_name,
+            "compiled_scaler": self._scaler is not None,
+            "compiled_model": self._model is not None,
+        }
+
+    def _to_sklearn_input(self, X: np.ndarray, estimator):
+        # 피처 이름으로 학습된 sklearn 객체는 기존과 같이 DataFrame 으로 전달 (이때만 pandas 로드)
+        if hasattr(estimator, "feature_names_in_"):
+            import pandas as pd
+            return pd.DataFrame(X, columns=self.feature_names)
+        return X
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        if self._scaler is not None:
+            return self._scaler.transform(X)
+        return np.asarray(self.scaler.transform(self._to_sklearn_input(X, self.scaler)), dtype=np.float64)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        X_scaled = self.transform(np.asarray(X, dtype=np.float64))
+        if self._model is not None:
+            return self._model.predict(X_scaled)
+        return np.asarray(self.model.predict(self._to_sklearn_input(X_scaled, self.model)), dtype=np.float64)
+
+    def verify(self, X: np.ndarray, atol: float = 1e-9) -> bool:
+        """
+        컴파일 경로와 sklearn 경로의 결과를 비교합니다.
+        다르면 sklearn 경로로 되돌리고 False 를 반환합니다.
+        """
+        if self._scaler is None and self._model is None:
+            return True
+        if self.model is None:
+            # from_compiled() 엔진은 비교할 sklearn 객체가 없음 (변환 시 검증됨)
+            return True
+
+        with warnings.catch_warnings():
+            # 피처 이름 없이 ndarray 로 호출할 때의 경고 무시 (비교 목적)
+            warnings.simplefilter("ignore", UserWarning)
+            expected = np.asarray(self.model.predict(self.scaler.transform(X)), dtype=np.float64)
+        actual = self.predict(X)
+
+        if np.allclose(actual, expected, rtol=0.0, atol=atol):
+            return True
+
+        logger.warning(
+            "Compiled inference mismatch for %s (max diff %g), falling back to sklearn",
+            self.model_name, float(np.max(np.abs(actual - expected))),
+        )
+        self._scaler = None
+        self._model = None
+        return False
+
+
+def build_inference_engine(scaler, model, feature_names) -> InferenceEngine:
+    engine = InferenceEngine(scaler, model, feature_names)
+
+    # scaler 통계 주변의 점들로 sklearn 과 결과 비교 (로드 시 1회)
+    center = getattr(scaler, "mean_", None)
+    spread = getattr(scaler, "scale_", None)
+    n_features = len(engine.feature_names)
+    if center is None:
+        center = np.zeros(n_features)
+    if spread is None:
+        spread = np.ones(n_features)
+    rng = np.random.default_rng(0)
+    probe = center + spread * rng.normal(size=(64, n_features)) * 2
+    engine.verify(np.vstack([np.zeros((1, n_features)), probe]))
+
+    logger.info("Inference engine: %s", engine.describe())
+    return engine
@@ -1,10 +1,12 @@
 # pkl로 저장된 credit_model.pkl 모델과 scaler.pkl을 로드
 # 머신로닝 모델 유지/로드 관련 코드 모듈
 
+import hashlib
 import pickle
 from app.config.config import settings
 
 # 모델, 스케일러 로딩
+# 요청 경로에서는 매번 unpickle 하지 않도록 app.model.registry.model_registry를 사용합니다.
 def load_credit_model():
     with open(settings.MODEL_PATH, "rb") as f:
         model = pickle.load(f)
@@ -13,4 +15,18 @@ def load_credit_model():
 def load_scaler():
     with open(settings.SCALER_PATH, "rb") as f:
         scaler = pickle.load(f)
-    return scaler
\ No newline at end of file
+    return scaler
+
+# 모델 + 스케일러 pickle 과 버전 (두 파일 내용의 sha256 앞 12자리)
+# mmap 모델 파일로 변환해도 같은 버전을 유지하도록 레지스트리와 변환 도구가 함께 사용
+def load_model_pickles(model_path: str, scaler_path: str):
+    with open(model_path, "rb") as f:
+        model_bytes = f.read()
+    with open(scaler_path, "rb") as f:
+        scaler_bytes = f.read()
+
+    digest = hashlib.sha256()
+    digest.update(model_bytes)
+    digest.update(scaler_bytes)
+
+    return pickle.loads(model_bytes), pickle.loads(scaler_bytes), digest.hexdigest()[:12]
@@ -0,0 +1,140 @@
+# 읽기 전용 memory-map 모델 파일
+# 컴파일된 추론 엔진(app.model.inference)의 scaler/모델 배열을 파일 하나에 저장해 두고,
+# 로드할 때는 unpickle 하지 않고 mmap 위의 NumPy 배열(읽기 전용)로 바로 사용합니다.
+# 같은 파일을 여러 uvicorn 워커가 열면 배열은 OS 페이지 캐시의 같은 물리 페이지를 공유하므로
+# 워커 수가 늘어도 모델 메모리는 한 벌만 차지합니다 (pickle 은 워커마다 sklearn 객체 + 컴파일 배열 복사본).
+#
+# 파일 구조: MAGIC(8) | 헤더 길이(uint64 LE) | 헤더 JSON | 배열들 (각각 64바이트 정렬, little-endian)
+# 변환: python -m app.cli.convert_model
+# 파일 교체는 임시 파일에 쓴 뒤 os.replace 로 바꾸므로, 기존 파일을 매핑 중인 워커는 이전 inode 를 계속 사용합니다.
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from app.model.inference import InferenceEngine, _AffineScaler, _LinearModel, _TreeEnsemble
+
+MAGIC = b"CRMMAP01"
+_ALIGN = 64
+
+# 헤더에 기록하는 컴파일 타입 이름
+_KINDS = {
+    "affine_scaler": _AffineScaler,
+    "linear": _LinearModel,
+    "tree_ensemble": _TreeEnsemble,
+}
+
+
+def _kind_of(part) -> str:
+    for kind, cls in _KINDS.items():
+        if type(part) is cls:
+            return kind
+    raise ValueError(f"Unsupported compiled part: {type(part).__name__}")
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGN
+
+
+# =========================================================
+# 저장
+# =========================================================
+def save_mmap_model(path: str, engine: InferenceEngine, version: str):
+    """컴파일된 엔진을 path 에 저장 (sklearn 으로만 예측 가능한 scaler/모델은 ValueError)."""
+    if not engine.compiled:
+        raise ValueError(f"Model cannot be stored for memory-mapping: {engine.describe()}")
+
+    arrays = []
+    parts = {}
+    for role, part in (("scaler", engine._scaler), ("model", engine._model)):
+        entry = {
+            "kind": _kind_of(part),
+            "meta": {name: getattr(part, name) for name in part.META},
+            "arrays": {},
+        }
+        for name in part.ARRAYS:
+            value = getattr(part, name)
+            if value is None:
+                continue
+            # intp 등 플랫폼 의존 타입은 고정 폭 little-endian 으로 저장
+            value = np.ascontiguousarray(value, dtype=np.asarray(value).dtype.newbyteorder("<"))
+            entry["arrays"][name] = {"dtype": value.dtype.str, "shape": list(value.shape)}
+            arrays.append((entry["arrays"][name], value))
+        parts[role] = entry
+
+    header = {
+        "version": version,
+        "feature_names": engine.feature_names,
+        "scaler_name": engine.scaler_name,
+        "model_name": engine.model_name,
+        "parts": parts,
+    }
+
+    # 배열 offset 은 데이터 영역(헤더 뒤 64바이트 정렬 위치) 기준
+    offset = 0
+    for spec, value in arrays:
+        spec["offset"] = offset
+        offset += value.nbytes + _padding(value.nbytes)
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+    prefix = len(MAGIC) + 8 + len(header_bytes)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * _padding(prefix))
+        for spec, value in arrays:
+            f.write(value.tobytes())
+            f.write(b"\0" * _padding(value.nbytes))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# =========================================================
+# 로드
+# =========================================================
+def _restore(entry: dict, buffer) -> object:
+    cls = _KINDS[entry["kind"]]
+    part = cls.__new__(cls)
+    for name in cls.ARRAYS:
+        spec = entry["arrays"].get(name)
+        value = None
+        if spec is not None:
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            value = np.frombuffer(buffer, dtype=dtype, count=count, offset=spec["offset"]).reshape(spec["shape"])
+        setattr(part, name, value)
+    for name in cls.META:
+        setattr(part, name, entry["meta"][name])
+    return part
+
+
+def load_mmap_model(path: str) -> tuple[InferenceEngine, str]:
+    """(엔진, 모델 버전). 배열은 파일을 매핑한 읽기 전용 버퍼를 그대로 가리킵니다."""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buffer[:len(MAGIC)] != MAGIC:
+        buffer.close()
+        raise ValueError(f"Not a memory-mapped model file: {path}")
+    (header_size,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    header = json.loads(buffer[header_start:header_start + header_size])
+    data_start = header_start + header_size
+    data_start += _padding(data_start)
+
+    data = memoryview(buffer)[data_start:]
+    parts = header["parts"]
+    engine = InferenceEngine.from_compiled(
+        _restore(parts["scaler"], data),
+        _restore(parts["model"], data),
+        header["feature_names"],
+        scaler_name=header["scaler_name"],
+        model_name=header["model_name"],
+    )
+    return engine, header["version"]
@@ -0,0 +1,152 @@
+# 프로세스 전역 모델 레지스트리
+# credit_model.pkl / scaler.pkl을 한 번만 로드해 두고, 디스크의 파일이 바뀌면
+# 재시작 없이 새 모델로 원자적으로 교체합니다.
+# MODEL_MMAP_PATH 를 지정하면 pickle 대신 읽기 전용 memory-map 모델 파일(app.model.mmap_model)을 사용합니다.
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from app.config.config import settings
+from app.model.features import MODEL_FEATURE_ORDER
+from app.model.inference import InferenceEngine, build_inference_engine
+from app.model.load_model import load_model_pickles
+from app.model.mmap_model import load_mmap_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """한 시점에 함께 로드된 모델과 스케일러 묶음 (mmap 모델 파일이면 model/scaler 는 None)."""
+
+    model: Optional[Any]
+    scaler: Optional[Any]
+    engine: InferenceEngine
+    version: str
+    loaded_at: datetime
+    file_stamp: tuple
+
+
+def _file_stamp(*paths: str) -> tuple:
+    # 파일 변경 감지용 (mtime, size) 서명
+    stamp = []
+    for path in paths:
+        st = os.stat(path)
+        stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+class ModelRegistry:
+    """
+    모델/스케일러를 프로세스당 한 번만 unpickle 하는 레지스트리.
+
+    - get()은 현재 ModelBundle을 반환합니다. 모델과 스케일러는 항상 같은
+      번들에서 꺼내 쓰므로 교체 중에도 서로 다른 버전이 섞이지 않습니다.
+    - reload_interval 초마다 파일의 (mtime, size)를 확인하고, 바뀌었으면
+      새 번들을 만든 뒤 참조 하나만 바꿔치기 합니다.
+    - 새 파일 로드에 실패하면(쓰는 도중 등) 기존 번들을 그대로 유지합니다.
+    - mmap_path 가 있으면 그 파일 하나만 확인/로드합니다.
+    """
+
+    def __init__(self, model_path: str, scaler_path: str, reload_interval: float = 5.0,
+                 mmap_path: Optional[str] = None):
+        self.model_path = model_path
+        self.scaler_path = scaler_path
+        self.reload_interval = reload_interval
+        self.mmap_path = mmap_path
+
+        self._bundle: Optional[ModelBundle] = None
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+
+    # ---------------- 로드 ----------------
+    def _watched_paths(self) -> tuple:
+        return (self.mmap_path,) if self.mmap_path else (self.model_path, self.scaler_path)
+
+    def _build_bundle(self) -> ModelBundle:
+        stamp = _file_stamp(*self._watched_paths())
+
+        if self.mmap_path:
+            engine, version = load_mmap_model(self.mmap_path)
+            if engine.feature_names != list(MODEL_FEATURE_ORDER):
+                raise ValueError(f"Feature order in {self.mmap_path} does not match MODEL_FEATURE_ORDER")
+            model = scaler = None
+        else:
+            model, scaler, version = load_model_pickles(self.model_path, self.scaler_path)
+            engine = build_inference_engine(scaler, model, MODEL_FEATURE_ORDER)
+
+        return ModelBundle(
+            model=model,
+            scaler=scaler,
+            engine=engine,
+            version=version,
+            loaded_at=datetime.now(),
+            file_stamp=stamp,
+        )
+
+    def load(self) -> ModelBundle:
+        """파일에서 모델을 (다시) 로드하고 현재 번들로 교체합니다."""
+        with self._lock:
+            bundle = self._build_bundle()
+            self._bundle = bundle
+            self._last_check = time.monotonic()
+        logger.info("Loaded credit model version=%s", bundle.version)
+        return bundle
+
+    # ---------------- 조회 ----------------
+    def get(self) -> ModelBundle:
+        bundle = self._bundle
+        if bundle is None:
+            return self.load()
+
+        if self.reload_interval > 0 and time.monotonic() - self._last_check >= self.reload_interval:
+            bundle = self._reload_if_changed(bundle)
+        return bundle
+
+    def _reload_if_changed(self, bundle: ModelBundle) -> ModelBundle:
+        # 다른 스레드가 이미 확인 중이면 기존 번들로 바로 응답
+        if not self._lock.acquire(blocking=False):
+            return bundle
+        try:
+            self._last_check = time.monotonic()
+            try:
+                if _file_stamp(*self._watched_paths()) == bundle.file_stamp:
+                    return bundle
+                new_bundle = self._build_bundle()
+            except Exception as e:
+                logger.warning("Model reload failed, keeping version=%s: %s", bundle.version, e)
+                return bundle
+
+            self._bundle = new_bundle
+            logger.info("Reloaded credit model version=%s -> %s", bundle.version, new_bundle.version)
+            return new_bundle
+        finally:
+            self._lock.release()
+
+    def info(self) -> dict:
+        """운영 확인용: 현재 로드된 모델 버전과 로드 시각."""
+        bundle = self._bundle
+        if bundle is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "version": bundle.version,
+            "loaded_at": bundle.loaded_at.isoformat(),
+            "inference": bundle.engine.describe(),
+            "model_path": self.model_path,
+            "scaler_path": self.scaler_path,
+            "mmap_path": self.mmap_path,
+        }
+
+
+model_registry = ModelRegistry(
+    settings.MODEL_PATH,
+    settings.SCALER_PATH,
+    reload_interval=settings.MODEL_RELOAD_INTERVAL_SEC,
+    mmap_path=settings.MODEL_MMAP_PATH,
+)
@@ -1,37 +1,153 @@
-from datetime import datetime
+from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
+from app.common.metrics import DB_WRITE_SECONDS
 
-# ================ 최신 신용 점수 저장 메서드 ==================
-def save_latest_credit_score(db: Session, user_id: int, credit_score: int):
 
-    db.execute(
-        text("""
+# ================ 저장 SQL (MySQL / 로컬 SQLite 대체 DB) ==================
+# 운영은 MySQL 문법, 로컬 검증/벤치마크용 SQLite 에서는 같은 의미의 upsert 문을 사용
+_WRITE_SQL = {
+    "mysql": {
+        "credit_score": """
         INSERT INTO credit_score (user_id, score, created_at, updated_at)
         VALUES (:user_id, :score, NOW(), NOW())
         ON DUPLICATE KEY UPDATE
             score = VALUES(score),
-            updated_at = NOW();
-        """),
-        {"user_id": user_id, "score": credit_score}
-    )
-    db.commit()
+            updated_at = NOW()
+        """,
+        "credit_score_history": """
+        INSERT INTO credit_score_history (user_id, score, created_at)
+        VALUES (:user_id, :score, NOW())
+        ON DUPLICATE KEY UPDATE
+            score = VALUES(score)
+        """,
+        "credit_score_monthly": """
+        INSERT INTO credit_score_monthly (user_id, year, month, score_sum, score_count)
+        SELECT user_id, YEAR(created_at), MONTH(created_at), SUM(score), COUNT(*)
+        FROM credit_score_history
+        WHERE user_id = :user_id
+          AND created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
+        GROUP BY user_id, YEAR(created_at), MONTH(created_at)
+        ON DUPLICATE KEY UPDATE
+            score_sum = VALUES(score_sum),
+            score_count = VALUES(score_count)
+        """,
+        "credit_feature_snapshot": """
+        INSERT INTO credit_feature_snapshot (user_id, features, has_data, score, model_version, computed_at)
+        VALUES (:user_id, :features, :has_data, :score, :model_version, :computed_at)
+        ON DUPLICATE KEY UPDATE
+            features = VALUES(features),
+            has_data = VALUES(has_data),
+            score = VALUES(score),
+            model_version = VALUES(model_version),
+            computed_at = VALUES(computed_at)
+        """,
+    },
+    "sqlite": {
+        "credit_score": """
+        INSERT INTO credit_score (user_id, score, created_at, updated_at)
+        VALUES (:user_id, :score, datetime('now', 'localtime'), datetime('now', 'localtime'))
+        ON CONFLICT (user_id) DO UPDATE SET
+            score = excluded.score,
+            updated_at = excluded.updated_at
+        """,
+        "credit_score_history": """
+        INSERT INTO credit_score_history (user_id, score, created_at)
+        VALUES (:user_id, :score, datetime('now', 'localtime'))
+        ON CONFLICT (user_id, created_at) DO UPDATE SET
+            score = excluded.score
+        """,
+        "credit_score_monthly": """
+        INSERT INTO credit_score_monthly (user_id, year, month, score_sum, score_count)
+        SELECT
+            user_id,
+            CAST(strftime('%Y', created_at) AS INTEGER),
+            CAST(strftime('%m', created_at) AS INTEGER),
+            SUM(score),
+            COUNT(*)
+        FROM credit_score_history
+        WHERE user_id = :user_id
+          AND created_at >= strftime('%Y-%m-01', 'now', 'localtime')
+        GROUP BY 1, 2, 3
+        ON CONFLICT (user_id, year, month) DO UPDATE SET
+            score_sum = excluded.score_sum,
+            score_count = excluded.score_count
+        """,
+        "credit_feature_snapshot": """
+        INSERT INTO credit_feature_snapshot (user_id, features, has_data, score, model_version, computed_at)
+        VALUES (:user_id, :features, :has_data, :score, :model_version, :computed_at)
+        ON CONFLICT (user_id) DO UPDATE SET
+            features = excluded.features,
+            has_data = excluded.has_data,
+            score = excluded.score,
+            model_version = excluded.model_version,
+            computed_at = excluded.computed_at
+        """,
+    },
+}
+
+
+def _write_sql(db: Session, table: str):
+    dialect = "sqlite" if db.get_bind().dialect.name == "sqlite" else "mysql"
+    return text(_WRITE_SQL[dialect][table])
+
+
+# 테이블별 upsert / 커밋 지연 시간 기록
+def _execute_write(db: Session, table: str, params):
+    with DB_WRITE_SECONDS.labels(table).time():
+        db.execute(_write_sql(db, table), params)
+
+
+def _commit(db: Session):
+    with DB_WRITE_SECONDS.labels("commit").time():
+        db.commit()
+
+
+# ================ 최신 신용 점수 저장 메서드 ==================
+def save_latest_credit_score(db: Session, user_id: int, credit_score: int):
+
+    _execute_write(db, "credit_score", {"user_id": user_id, "score": credit_score})
+    _commit(db)
 
 
 # ================ 신용 점수 기록 저장 메서드 ==================
 # 신용점수 기록 저장 - user_id, created_date 복합 키 저장
 def save_credit_score_history(db: Session, user_id: int, credit_score: int):
-    db.execute(
-        text("""
-        INSERT INTO credit_score_history (user_id, score, created_at)
-        VALUES (:user_id, :score, NOW())
-        ON DUPLICATE KEY UPDATE
-            score = VALUES(score);
-        """),
-        {"user_id": user_id, "score": credit_score}
-    )
-    db.commit()
+    _execute_write(db, "credit_score_history", {"user_id": user_id, "score": credit_score})
+    _add_to_monthly_rollup(db, [{"user_id": user_id, "score": credit_score}])
+    _commit(db)
+
+
+# ================ 월별 점수 롤업 반영 ==================
+# credit_score_history 저장과 같은 트랜잭션에서 이번 달 (합계, 건수)를 history 로 다시 집계
+# (같은 초에 저장되어 history 행이 덮어써진 경우도 history AVG / 백필과 항상 같은 값, (user_id, created_at) PK 범위 조회)
+def _add_to_monthly_rollup(db: Session, params: list[dict]):
+    _execute_write(db, "credit_score_monthly", params)
+
+
+# ================ 최신 점수 + 기록 동시 저장 메서드 ==================
+# 두 테이블을 한 트랜잭션으로 저장 (커밋/fsync 1회)
+def save_credit_score(db: Session, user_id: int, credit_score: int, snapshot: dict = None):
+    save_credit_scores_bulk(db, [(user_id, credit_score)], [snapshot] if snapshot is not None else ())
+
+
+# ================ 신용 점수 일괄 저장 메서드 ==================
+# 여러 유저의 최신 점수 + 기록을 executemany 로 한 번에 upsert 하고 커밋은 1회
+# (pymysql 은 INSERT ... VALUES 의 executemany 를 multi-row INSERT 한 문장으로 보냄)
+# snapshots: 피처 스냅샷 파라미터 (app.service.feature_snapshot.snapshot_params), 같은 트랜잭션에 저장
+def save_credit_scores_bulk(db: Session, scores: list[tuple[int, int]], snapshots=()):
+    if not scores:
+        return
+
+    params = [{"user_id": user_id, "score": score} for user_id, score in scores]
+
+    _execute_write(db, "credit_score", params)
+    _execute_write(db, "credit_score_history", params)
+    _add_to_monthly_rollup(db, params)
+    if snapshots:
+        _execute_write(db, "credit_feature_snapshot", list(snapshots))
+    _commit(db)
 
 # ================ 최신 신용 점수 조회 메서드 ==================
 def get_latest_credit_score(user_id: int, core_db: Session):
@@ -51,30 +167,105 @@ def get_latest_credit_score(user_id: int, core_db: Session):
     return int(result.score)
 
 
+# ================ 최신 점수 + 갱신 시각 조회 메서드 ==================
+# 점수 저장(히스토리/롤업 포함)마다 updated_at 이 바뀌므로 최신 점수/히스토리 응답의 버전으로 사용
+def get_credit_score_version(user_id: int, core_db: Session):
+    return core_db.execute(
+        text("""
+        SELECT score, updated_at
+        FROM credit_score
+        WHERE user_id = :user_id
+        """),
+        {"user_id": user_id}
+    ).fetchone()
+
+
+# ================ 피처 스냅샷 조회 메서드 ==================
+def get_feature_snapshot(user_id: int, core_db: Session):
+    return core_db.execute(
+        text("""
+        SELECT features, has_data, score, model_version, computed_at
+        FROM credit_feature_snapshot
+        WHERE user_id = :user_id
+        """),
+        {"user_id": user_id}
+    ).fetchone()
+
+
 # ================ 신용 점수 기록 조회 메서드 (월별 평균) ==================
-def get_credit_score_history(user_id: int, core_db: Session):
+# credit_score_monthly 롤업에서 최근 months 개월만 조회
+def get_credit_score_history(user_id: int, core_db: Session, months: int = 7):
+    from_year, from_month = _history_from(months)
 
     results = core_db.execute(
         text("""
-        SELECT
-            YEAR(created_at) AS year,
-            MONTH(created_at) AS month,
-            AVG(score) AS avg_score
-        FROM credit_score_history
+        SELECT year, month, score_sum, score_count
+        FROM credit_score_monthly
         WHERE user_id = :user_id
-        GROUP BY YEAR(created_at), MONTH(created_at)
+          AND (year, month) >= (:from_year, :from_month)
         ORDER BY year ASC, month ASC;
         """),
-        {"user_id": user_id}
+        {"user_id": user_id, "from_year": from_year, "from_month": from_month}
     ).fetchall()
 
     history_list = []
 
     for row in results:
-        history_list.append({
-            "year": int(row.year),
-            "month": int(row.month),
-            "avg_score": int(round(row.avg_score))
-        })
+        if not row.score_count:
+            continue
+        history_list.append(_history_item(row))
+
+    return history_list
+
+
+def _history_from(months: int):
+    # 이번 달 포함 최근 months 개월의 시작 (연, 월)
+    today = date.today()
+    from_index = today.year * 12 + (today.month - 1) - (months - 1)
+    from_year, from_month = divmod(from_index, 12)
+    return from_year, from_month + 1
+
 
-    return history_list
\ No newline at end of file
+def _history_item(row) -> dict:
+    return {
+        "year": int(row.year),
+        "month": int(row.month),
+        "avg_score": int(round(row.score_sum / row.score_count))
+    }
+
+
+# ================ 여러 유저 최신 신용 점수 일괄 조회 ==================
+# user_id IN (...) 한 번으로 조회, 점수가 없는 유저는 결과에 없음 (단건 조회처럼 0 으로 채우는 것은 호출한 쪽)
+def get_latest_credit_scores(user_ids: list[int], core_db: Session) -> dict[int, int]:
+    results = core_db.execute(
+        text("""
+        SELECT user_id, score
+        FROM credit_score
+        WHERE user_id IN :user_ids
+        """).bindparams(bindparam("user_ids", expanding=True)),
+        {"user_ids": list(user_ids)}
+    )
+    return {int(row.user_id): int(row.score) for row in results}
+
+
+# ================ 여러 유저 신용 점수 기록 일괄 조회 (월별 평균) ==================
+def get_credit_score_histories(user_ids: list[int], core_db: Session, months: int = 7) -> dict[int, list]:
+    from_year, from_month = _history_from(months)
+
+    results = core_db.execute(
+        text("""
+        SELECT user_id, year, month, score_sum, score_count
+        FROM credit_score_monthly
+        WHERE user_id IN :user_ids
+          AND (year, month) >= (:from_year, :from_month)
+        ORDER BY user_id ASC, year ASC, month ASC
+        """).bindparams(bindparam("user_ids", expanding=True)),
+        {"user_ids": list(user_ids), "from_year": from_year, "from_month": from_month}
+    )
+
+    histories = {user_id: [] for user_id in user_ids}
+    for row in results:
+        if not row.score_count:
+            continue
+        histories[int(row.user_id)].append(_history_item(row))
+    return histories
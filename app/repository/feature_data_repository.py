@@ -0,0 +1,278 @@
+# 피처 계산용 데이터 조회 (기간 조건 pushdown + SQL 집계)
+# 6개월/3개월 기간 조건을 WHERE 절로 내리고, 거래/카드는 합계·건수·최소 잔액·편차 제곱합을
+# DB에서 계산해 집계 1행만 전송합니다. 대출은 행 수가 적어 그대로, 송금은 6개월 이내 행만 가져옵니다.
+# 여러 유저 일괄 조회(fetch_feature_aggregates_batch)는 같은 집계를 GROUP BY user_id 로 테이블당 쿼리 1회에 처리합니다.
+
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.common.metrics import track_query
+from app.repository.user_data_repository import (
+    CARD_COLUMNS,
+    LOAN_COLUMNS,
+    REMITTANCE_COLUMNS,
+    TRANSACTION_COLUMNS,
+    fetch_grouped_rows,
+    fetch_loan_rows,
+)
+
+
+_SPEND_CONDITION = (
+    "direction = 'OUT' AND category IN ('LIVING', 'RENT', 'ENTERTAIN', 'ETC', 'REMIT_OUT')"
+)
+_SALARY_CONDITION = "direction = 'IN' AND category = 'SALARY'"
+
+
+@dataclass
+class FeatureAggregates:
+    """extract_features_from_aggregates() 입력 묶음."""
+
+    windows: tuple
+    transaction: Any
+    card: Any
+    loan_rows: list
+    remit_rows: list
+    has_data: bool
+
+
+# ================ 거래 집계 (6개월 / 3개월) ==================
+# 급여 분산은 SUM(x^2)/n - 평균^2 로 계산하면 급여가 거의 같을 때 자릿수가 상쇄되므로,
+# 평균을 파생 테이블(salary)로 먼저 구해 편차 제곱합 SUM((x - 평균)^2)을 계산
+_TRANSACTION_AGGREGATES = f"""
+            COUNT(*) AS row_count,
+            SUM(CASE WHEN {_SALARY_CONDITION} THEN amount END) AS salary_total,
+            COUNT(CASE WHEN {_SALARY_CONDITION} THEN 1 END) AS salary_count,
+            SUM(CASE WHEN {_SALARY_CONDITION}
+                THEN (amount - salary.mean) * (amount - salary.mean) END) AS salary_sq_dev,
+            SUM(CASE WHEN {_SPEND_CONDITION} THEN amount END) AS spend_total,
+            COUNT(CASE WHEN {_SPEND_CONDITION} THEN 1 END) AS spend_count,
+            MIN(CASE WHEN tx_datetime >= :start_3m THEN balance_after END) AS min_balance_3m,
+            SUM(CASE WHEN tx_datetime >= :start_3m AND {_SPEND_CONDITION} THEN amount END) AS spend_3m_total
+"""
+
+
+@track_query("mydata_transaction")
+def fetch_transaction_aggregates(mydata_db: Session, user_id: int, windows):
+    _, start_6m, _, start_3m = windows
+    return mydata_db.execute(
+        text(f"""
+        SELECT {_TRANSACTION_AGGREGATES}
+        FROM mydata_transaction
+        CROSS JOIN (
+            SELECT AVG(amount) AS mean
+            FROM mydata_transaction
+            WHERE user_id = :user_id
+              AND tx_datetime >= :start_6m
+              AND {_SALARY_CONDITION}
+        ) salary
+        WHERE user_id = :user_id
+          AND tx_datetime >= :start_6m
+        """),
+        {"user_id": user_id, "start_6m": start_6m, "start_3m": start_3m},
+    ).fetchone()
+
+
+# ================ 카드 집계 ==================
+# 한도 소진율은 전체 행 기준, 이용 금액은 3개월 기준
+_CARD_AGGREGATES = """
+            COUNT(*) AS row_count,
+            MAX(CASE WHEN credit_limit > 0 THEN outstanding_amt * 1.0 / credit_limit END) AS max_utilization_ratio,
+            SUM(CASE WHEN tx_datetime >= :start_3m THEN tx_amount END) AS card_total,
+            SUM(CASE WHEN tx_datetime >= :start_3m AND tx_category = 'CASH_ADVANCE' THEN tx_amount END) AS ca_total
+"""
+
+
+@track_query("mydata_card")
+def fetch_card_aggregates(mydata_db: Session, user_id: int, windows):
+    _, _, _, start_3m = windows
+    return mydata_db.execute(
+        text(f"""
+        SELECT {_CARD_AGGREGATES}
+        FROM mydata_card
+        WHERE user_id = :user_id
+        """),
+        {"user_id": user_id, "start_3m": start_3m},
+    ).fetchone()
+
+
+# ================ 최근 6개월 송금 ==================
+@track_query("overseas_remittance")
+def fetch_recent_remittance_rows(core_db: Session, user_id: int, windows):
+    _, start_6m, _, _ = windows
+    return core_db.execute(
+        text(f"""
+        SELECT {REMITTANCE_COLUMNS}
+        FROM overseas_remittance
+        WHERE user_id = :user_id
+          AND created_at >= :start_6m
+        """),
+        {"user_id": user_id, "start_6m": start_6m},
+    ).fetchall()
+
+
+# ================ 워터마크 이후 새로 수집된 행 (증분 피처 상태용) ==================
+# after 가 None 이면 처음 상태를 만드는 경우로 전체 행을 조회
+def _collected_after_condition(after) -> str:
+    return "" if after is None else "AND collected_at > :after"
+
+
+@track_query("mydata_transaction")
+def fetch_new_transaction_rows(mydata_db: Session, user_id: int, after, windows):
+    # 6개월 이전 거래는 피처에 쓰이지 않으므로 제외
+    _, start_6m, _, _ = windows
+    return mydata_db.execute(
+        text(f"""
+        SELECT {TRANSACTION_COLUMNS}
+        FROM mydata_transaction
+        WHERE user_id = :user_id
+          AND tx_datetime >= :start_6m
+          {_collected_after_condition(after)}
+        """),
+        {"user_id": user_id, "start_6m": start_6m, "after": after},
+    ).fetchall()
+
+
+@track_query("mydata_card")
+def fetch_new_card_rows(mydata_db: Session, user_id: int, after):
+    # 한도 소진율은 전체 기간 최댓값이라 기간 조건 없음
+    return mydata_db.execute(
+        text(f"""
+        SELECT {CARD_COLUMNS}
+        FROM mydata_card
+        WHERE user_id = :user_id
+          {_collected_after_condition(after)}
+        """),
+        {"user_id": user_id, "after": after},
+    ).fetchall()
+
+
+# ================ 기간 밖 데이터 존재 여부 ==================
+# 기간 내 데이터가 하나도 없을 때만 호출 (전체 데이터가 없으면 기본 점수 처리)
+def has_transaction_rows(mydata_db: Session, user_id: int) -> bool:
+    return mydata_db.execute(
+        text("SELECT 1 FROM mydata_transaction WHERE user_id = :user_id LIMIT 1"),
+        {"user_id": user_id},
+    ).fetchone() is not None
+
+
+def has_remittance_rows(core_db: Session, user_id: int) -> bool:
+    return core_db.execute(
+        text("SELECT 1 FROM overseas_remittance WHERE user_id = :user_id LIMIT 1"),
+        {"user_id": user_id},
+    ).fetchone() is not None
+
+
+def in_window_has_data(tx_agg, card_agg, loan_rows, remit_rows) -> bool:
+    return bool(tx_agg.row_count or card_agg.row_count or loan_rows or remit_rows)
+
+
+# ================ 유저 1명 피처 입력 조회 ==================
+def fetch_feature_aggregates(user_id: int, core_db: Session, mydata_db: Session, windows):
+    tx_agg = fetch_transaction_aggregates(mydata_db, user_id, windows)
+    card_agg = fetch_card_aggregates(mydata_db, user_id, windows)
+    loan_rows = fetch_loan_rows(mydata_db, user_id)
+    remit_rows = fetch_recent_remittance_rows(core_db, user_id, windows)
+
+    has_data = (
+        in_window_has_data(tx_agg, card_agg, loan_rows, remit_rows)
+        or has_transaction_rows(mydata_db, user_id)
+        or has_remittance_rows(core_db, user_id)
+    )
+    return FeatureAggregates(windows, tx_agg, card_agg, loan_rows, remit_rows, has_data)
+
+
+# ================ 여러 유저 피처 입력 일괄 조회 ==================
+# 기간 내 행이 없는 유저의 집계 행 (SUM / MIN / MAX 는 NULL, COUNT 는 0 - 유저 1명 집계 결과와 같음)
+_EmptyTransactionAggregates = namedtuple(
+    "_EmptyTransactionAggregates",
+    "row_count salary_total salary_count salary_sq_dev spend_total spend_count min_balance_3m spend_3m_total",
+)
+_EmptyCardAggregates = namedtuple("_EmptyCardAggregates", "row_count max_utilization_ratio card_total ca_total")
+_EMPTY_TRANSACTION = _EmptyTransactionAggregates(0, None, 0, None, None, 0, None, None)
+_EMPTY_CARD = _EmptyCardAggregates(0, None, None, None)
+
+
+@track_query("mydata_transaction")
+def fetch_transaction_aggregates_batch(mydata_db: Session, user_ids: list[int], windows):
+    _, start_6m, _, start_3m = windows
+    stmt = text(f"""
+        SELECT user_id, {_TRANSACTION_AGGREGATES}
+        FROM mydata_transaction
+        LEFT JOIN (
+            SELECT user_id AS salary_user_id, AVG(amount) AS mean
+            FROM mydata_transaction
+            WHERE user_id IN :user_ids
+              AND tx_datetime >= :start_6m
+              AND {_SALARY_CONDITION}
+            GROUP BY user_id
+        ) salary ON salary.salary_user_id = mydata_transaction.user_id
+        WHERE user_id IN :user_ids
+          AND tx_datetime >= :start_6m
+        GROUP BY user_id
+        """).bindparams(bindparam("user_ids", expanding=True))
+    return mydata_db.execute(
+        stmt, {"user_ids": list(user_ids), "start_6m": start_6m, "start_3m": start_3m},
+    ).fetchall()
+
+
+@track_query("mydata_card")
+def fetch_card_aggregates_batch(mydata_db: Session, user_ids: list[int], windows):
+    _, _, _, start_3m = windows
+    stmt = text(f"""
+        SELECT user_id, {_CARD_AGGREGATES}
+        FROM mydata_card
+        WHERE user_id IN :user_ids
+        GROUP BY user_id
+        """).bindparams(bindparam("user_ids", expanding=True))
+    return mydata_db.execute(stmt, {"user_ids": list(user_ids), "start_3m": start_3m}).fetchall()
+
+
+def _user_ids_with_rows(db: Session, table: str, user_ids: list[int]) -> set:
+    if not user_ids:
+        return set()
+    stmt = text(
+        f"SELECT DISTINCT user_id FROM {table} WHERE user_id IN :user_ids"
+    ).bindparams(bindparam("user_ids", expanding=True))
+    return {row.user_id for row in db.execute(stmt, {"user_ids": list(user_ids)})}
+
+
+# 테이블당 쿼리 1회 - {user_id: FeatureAggregates} (fetch_feature_aggregates 와 같은 기간 조건 / 집계)
+def fetch_feature_aggregates_batch(user_ids: list[int], core_db: Session, mydata_db: Session, windows):
+    _, start_6m, _, _ = windows
+    transactions = {row.user_id: row for row in fetch_transaction_aggregates_batch(mydata_db, user_ids, windows)}
+    cards = {row.user_id: row for row in fetch_card_aggregates_batch(mydata_db, user_ids, windows)}
+    loans = fetch_grouped_rows(mydata_db, "mydata_loan", LOAN_COLUMNS, user_ids)
+    remittances = fetch_grouped_rows(
+        core_db, "overseas_remittance", REMITTANCE_COLUMNS, user_ids,
+        "AND created_at >= :start_6m", {"start_6m": start_6m},
+    )
+
+    aggregates = {
+        user_id: FeatureAggregates(
+            windows,
+            transactions.get(user_id, _EMPTY_TRANSACTION),
+            cards.get(user_id, _EMPTY_CARD),
+            loans.get(user_id, []),
+            remittances.get(user_id, []),
+            True,
+        )
+        for user_id in user_ids
+    }
+
+    # 기간 내 데이터가 없는 유저만 기간 밖 거래 / 송금 존재 여부 확인 (전체 데이터가 없으면 기본 점수 처리)
+    empty = [
+        user_id for user_id, agg in aggregates.items()
+        if not in_window_has_data(agg.transaction, agg.card, agg.loan_rows, agg.remit_rows)
+    ]
+    if empty:
+        with_rows = (
+            _user_ids_with_rows(mydata_db, "mydata_transaction", empty)
+            | _user_ids_with_rows(core_db, "overseas_remittance", empty)
+        )
+        for user_id in empty:
+            aggregates[user_id].has_data = user_id in with_rows
+    return aggregates
@@ -0,0 +1,48 @@
+# 유저별 증분 피처 상태 저장소 (credit_feature_state)
+# state 는 app.service.incremental_features.FeatureState 의 JSON 직렬화 값,
+# watermark 는 state 에 반영된 MyData 행의 collected_at 상한입니다.
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+_UPSERT_SQL = {
+    "mysql": """
+    INSERT INTO credit_feature_state (user_id, watermark, state, updated_at)
+    VALUES (:user_id, :watermark, :state, NOW())
+    ON DUPLICATE KEY UPDATE
+        watermark = VALUES(watermark),
+        state = VALUES(state),
+        updated_at = NOW()
+    """,
+    "sqlite": """
+    INSERT INTO credit_feature_state (user_id, watermark, state, updated_at)
+    VALUES (:user_id, :watermark, :state, datetime('now', 'localtime'))
+    ON CONFLICT (user_id) DO UPDATE SET
+        watermark = excluded.watermark,
+        state = excluded.state,
+        updated_at = excluded.updated_at
+    """,
+}
+
+
+# ================ 피처 상태 조회 ==================
+def get_feature_state(core_db: Session, user_id: int):
+    """(watermark, state JSON) 또는 None."""
+    row = core_db.execute(
+        text("SELECT watermark, state FROM credit_feature_state WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    ).fetchone()
+    if row is None:
+        return None
+    return row.watermark, row.state
+
+
+# ================ 피처 상태 저장 ==================
+def save_feature_state(core_db: Session, user_id: int, watermark, state: str):
+    dialect = "sqlite" if core_db.get_bind().dialect.name == "sqlite" else "mysql"
+    core_db.execute(
+        text(_UPSERT_SQL[dialect]),
+        {"user_id": user_id, "watermark": watermark, "state": state},
+    )
+    core_db.commit()
@@ -0,0 +1,182 @@
+# 점수 계산 작업 큐 (로컬 SQLite 파일)
+# POST /jobs 로 받은 점수 계산 요청을 파일에 저장해 두고 백그라운드 워커가 하나씩 가져가 처리합니다.
+# 프로세스가 재시작되어도 대기 중인 작업은 남아 있고, 처리 중에 죽은 작업은 lease 만료 후 다시 처리됩니다.
+# lease 가 만료된 채로 max_attempts 번 가져간 작업은 더 이상 재시도하지 않고 failed 로 바꿉니다.
+# 결과 기록은 현재 lease 를 가진 워커(같은 attempts 로 running 중)만 할 수 있어, lease 가 만료된 뒤 늦게 끝난
+# 워커가 다시 가져간 워커의 결과를 덮어쓰지 않습니다.
+# 같은 파일을 여러 uvicorn 워커 프로세스가 함께 사용할 수 있습니다 (작업 가져가기는 BEGIN IMMEDIATE 로 직렬화).
+#
+# 상태: pending -> running -> done | failed
+# 같은 유저의 pending 작업은 1개만 유지합니다 (새 요청은 기존 pending 작업 id 를 반환).
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS score_job (
+    id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    credit_score INTEGER,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    lease_until REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_score_job_pending_user ON score_job (user_id) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS ix_score_job_status_created ON score_job (status, created_at);
+"""
+
+_COLUMNS = "id, user_id, status, attempts, credit_score, error, created_at, updated_at"
+
+
+@dataclass
+class ScoreJob:
+    id: str
+    user_id: int
+    status: str
+    attempts: int
+    credit_score: Optional[int]
+    error: Optional[str]
+    created_at: float
+    updated_at: float
+
+
+class ScoreJobQueue:
+
+    def __init__(self, path: str, lease_sec: float, max_attempts: int):
+        self.path = path
+        self.lease_sec = lease_sec
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    # ---------------- 연결 ----------------
+    def _connection(self) -> sqlite3.Connection:
+        # 스레드별 연결 1개 (autocommit, 트랜잭션은 직접 BEGIN)
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    connection.executescript(_SCHEMA)
+                    self._initialized = True
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    # ---------------- 등록 / 조회 ----------------
+    def enqueue(self, user_id: int) -> tuple[ScoreJob, bool]:
+        """(작업, 새로 만들었는지). 같은 유저의 pending 작업이 있으면 그 작업을 반환."""
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                f"SELECT {_COLUMNS} FROM score_job WHERE user_id = ? AND status = 'pending'", (user_id,),
+            ).fetchone()
+            if row is not None:
+                return ScoreJob(*row), False
+            job = ScoreJob(uuid.uuid4().hex, user_id, "pending", 0, None, None, now, now)
+            connection.execute(
+                "INSERT INTO score_job (id, user_id, status, created_at, updated_at) VALUES (?, ?, 'pending', ?, ?)",
+                (job.id, user_id, now, now),
+            )
+        return job, True
+
+    def get(self, job_id: str) -> Optional[ScoreJob]:
+        row = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM score_job WHERE id = ?", (job_id,),
+        ).fetchone()
+        return ScoreJob(*row) if row is not None else None
+
+    def pending_count(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM score_job WHERE status = 'pending'",
+        ).fetchone()[0]
+
+    # ---------------- 워커 ----------------
+    def claim(self) -> Optional[ScoreJob]:
+        """가장 오래된 pending 작업(또는 lease 가 만료된 running 작업)을 running 으로 바꿔 반환."""
+        now = time.time()
+        with self._transaction() as connection:
+            # 재시도 한도를 넘긴 만료 작업은 실패 처리
+            connection.execute(
+                """
+                UPDATE score_job
+                SET status = 'failed', error = ?, lease_until = NULL, updated_at = ?
+                WHERE status = 'running' AND lease_until < ? AND attempts >= ?
+                """,
+                (f"lease expired after {self.max_attempts} attempts", now, now, self.max_attempts),
+            )
+            row = connection.execute(
+                f"""
+                SELECT {_COLUMNS} FROM score_job
+                WHERE status = 'pending' OR (status = 'running' AND lease_until < ?)
+                ORDER BY created_at
+                LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            job = ScoreJob(*row)
+            connection.execute(
+                """
+                UPDATE score_job
+                SET status = 'running', attempts = attempts + 1, lease_until = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (now + self.lease_sec, now, job.id),
+            )
+        job.attempts += 1
+        return job
+
+    def complete(self, job: ScoreJob, credit_score: int) -> bool:
+        return self._finish(job, "done", credit_score, None)
+
+    def fail(self, job: ScoreJob, error: str) -> bool:
+        return self._finish(job, "failed", None, error)
+
+    def _finish(self, job: ScoreJob, status: str, credit_score, error) -> bool:
+        """claim()으로 받은 작업의 결과 기록. lease 가 만료되어 다른 워커가 가져갔으면 기록하지 않고 False."""
+        with self._transaction() as connection:
+            updated = connection.execute(
+                """
+                UPDATE score_job
+                SET status = ?, credit_score = ?, error = ?, lease_until = NULL, updated_at = ?
+                WHERE id = ? AND status = 'running' AND attempts = ?
+                """,
+                (status, credit_score, error, time.time(), job.id, job.attempts),
+            ).rowcount
+        return updated == 1
+
+    def purge(self, retention_sec: float) -> int:
+        """끝난 지 retention_sec 이 지난 done/failed 작업 삭제."""
+        with self._transaction() as connection:
+            return connection.execute(
+                "DELETE FROM score_job WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - retention_sec,),
+            ).rowcount
@@ -0,0 +1,94 @@
+# 신용 점수 write-behind 버퍼
+# 동시 요청들의 점수 저장을 모아 multi-row INSERT ... ON DUPLICATE KEY UPDATE 로 한 번에 씁니다.
+# 건수(max_batch) 또는 시간(flush_interval)이 차면 flush 합니다.
+# 주의: flush 전 프로세스가 비정상 종료되면 버퍼에 남은 점수는 저장되지 않습니다.
+
+import logging
+import threading
+
+from app.config.config import settings
+from app.db.core_banking import WriteSessionLocal
+from app.repository.credit_repository import save_credit_scores_bulk
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreWriteBuffer:
+
+    def __init__(self, session_factory, max_batch: int, flush_interval: float):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+
+        # user_id -> (최신 점수, 피처 스냅샷 파라미터 또는 None) (같은 유저는 마지막 점수만 저장)
+        self._pending: dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="score-write-behind", daemon=True)
+        self._thread.start()
+
+    def add(self, user_id: int, credit_score: int, snapshot: dict = None):
+        with self._lock:
+            self._pending[user_id] = (credit_score, snapshot)
+            full = len(self._pending) >= self.max_batch
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                save_credit_scores_bulk(
+                    db,
+                    [(user_id, credit_score) for user_id, (credit_score, _) in batch.items()],
+                    [snapshot for _, snapshot in batch.values() if snapshot is not None],
+                )
+            except Exception as e:
+                db.rollback()
+                logger.error("Score write-behind flush failed (%d rows), retrying later: %s", len(batch), e)
+                # 그 사이 들어온 더 최신 점수는 유지
+                with self._lock:
+                    for user_id, entry in batch.items():
+                        self._pending.setdefault(user_id, entry)
+                return 0
+            finally:
+                db.close()
+            return len(batch)
+
+    def close(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+score_write_buffer = ScoreWriteBuffer(
+    WriteSessionLocal,
+    max_batch=settings.SCORE_WRITE_BEHIND_MAX_BATCH,
+    flush_interval=settings.SCORE_WRITE_BEHIND_FLUSH_INTERVAL_SEC,
+)
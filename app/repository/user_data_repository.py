@@ -0,0 +1,166 @@
+import time
+from collections import defaultdict
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.common.metrics import observe_query, track_query
+
+
+# ================ 조회 컬럼 ==================
+REMITTANCE_COLUMNS = "send_amount, remittance_status, created_at"
+CARD_COLUMNS = (
+    "tx_datetime, tx_amount, pay_type, tx_category, credit_limit, "
+    "outstanding_amt, collected_at"
+)
+LOAN_COLUMNS = (
+    "loan_principal, interest_rate, status, overdue_count_12m, "
+    "overdue_amount, max_overdue_days, last_overdue_dt, collected_at"
+)
+TRANSACTION_COLUMNS = "tx_datetime, amount, direction, category, balance_after, collected_at"
+
+
+# ================ 유저 1명 데이터 조회 ==================
+@track_query("overseas_remittance")
+def fetch_remittance_rows(core_db: Session, user_id: int):
+    return core_db.execute(
+        text(f"SELECT {REMITTANCE_COLUMNS} FROM overseas_remittance WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    ).fetchall()
+
+
+@track_query("mydata_card")
+def fetch_card_rows(mydata_db: Session, user_id: int):
+    return mydata_db.execute(
+        text(f"SELECT {CARD_COLUMNS} FROM mydata_card WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    ).fetchall()
+
+
+@track_query("mydata_loan")
+def fetch_loan_rows(mydata_db: Session, user_id: int):
+    return mydata_db.execute(
+        text(f"SELECT {LOAN_COLUMNS} FROM mydata_loan WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    ).fetchall()
+
+
+@track_query("mydata_transaction")
+def fetch_transaction_rows(mydata_db: Session, user_id: int):
+    return mydata_db.execute(
+        text(f"SELECT {TRANSACTION_COLUMNS} FROM mydata_transaction WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    ).fetchall()
+
+
+# (overseas_rows, card_rows, loan_rows, transaction_rows) - 주어진 세션으로 순차 조회
+def fetch_user_data(user_id: int, core_db: Session, mydata_db: Session):
+    return (
+        fetch_remittance_rows(core_db, user_id),
+        fetch_card_rows(mydata_db, user_id),
+        fetch_loan_rows(mydata_db, user_id),
+        fetch_transaction_rows(mydata_db, user_id),
+    )
+
+
+# ================ 데이터 워터마크 조회 ==================
+# 피처 캐시 키 / 보고서 ETag 용: 유저 데이터가 새로 수집/생성되면 값이 바뀜
+# MyData 행은 다시 수집될 때 collected_at 이 바뀌고, 해외송금은 기존 행의 상태(PENDING -> FAILED 등)나
+# 금액이 바뀔 수 있어 MAX(created_at) 외에 건수 / 실패 건수 / 금액 합계도 포함
+def fetch_mydata_watermark(mydata_db: Session, user_id: int):
+    row = mydata_db.execute(
+        text("""
+        SELECT
+            (SELECT MAX(collected_at) FROM mydata_transaction WHERE user_id = :user_id) AS transaction_collected_at,
+            (SELECT MAX(collected_at) FROM mydata_card WHERE user_id = :user_id) AS card_collected_at,
+            (SELECT MAX(collected_at) FROM mydata_loan WHERE user_id = :user_id) AS loan_collected_at
+        """),
+        {"user_id": user_id},
+    ).fetchone()
+    return tuple(row)
+
+
+def fetch_remittance_watermark(core_db: Session, user_id: int):
+    row = core_db.execute(
+        text("""
+        SELECT
+            MAX(created_at) AS remittance_created_at,
+            COUNT(*) AS remittance_count,
+            SUM(CASE WHEN UPPER(remittance_status) = 'FAILED' THEN 1 ELSE 0 END) AS remittance_failed_count,
+            SUM(send_amount) AS remittance_amount_sum
+        FROM overseas_remittance
+        WHERE user_id = :user_id
+        """),
+        {"user_id": user_id},
+    ).fetchone()
+    return tuple(row)
+
+
+def fetch_user_data_watermark(user_id: int, core_db: Session, mydata_db: Session):
+    return fetch_mydata_watermark(mydata_db, user_id) + fetch_remittance_watermark(core_db, user_id)
+
+
+def fetch_grouped_rows(db: Session, table: str, columns: str, user_ids: list[int], condition: str = "", params=None):
+    # user_id IN (...) 한 번으로 여러 유저의 행을 가져와 user_id 별로 묶음 (condition: 추가 WHERE 조건)
+    stmt = text(
+        f"SELECT user_id, {columns} FROM {table} WHERE user_id IN :user_ids {condition}"
+    ).bindparams(bindparam("user_ids", expanding=True))
+
+    started = time.perf_counter()
+    grouped = defaultdict(list)
+    rows = 0
+    for row in db.execute(stmt, {**(params or {}), "user_ids": list(user_ids)}):
+        grouped[row.user_id].append(row)
+        rows += 1
+    observe_query(table, time.perf_counter() - started, rows)
+    return grouped
+
+
+# ================ 유저 1명 데이터 스트리밍 조회 ==================
+# 서버 사이드 커서(stream_results)로 chunk_size 행씩 가져오며 한 행씩 반환
+# 조회 시간은 DB에서 chunk 를 가져오는 시간만 기록 (호출한 쪽의 처리 시간 제외)
+def stream_user_rows(db: Session, table: str, columns: str, user_id: int, chunk_size: int, order_by: str = None):
+    sql = f"SELECT {columns} FROM {table} WHERE user_id = :user_id"
+    if order_by:
+        sql += f" ORDER BY {order_by}"
+
+    elapsed = 0.0
+    rows = 0
+    started = time.perf_counter()
+    result = db.execute(
+        text(sql),
+        {"user_id": user_id},
+        execution_options={"stream_results": True, "yield_per": chunk_size},
+    )
+    try:
+        partitions = result.partitions(chunk_size)
+        while True:
+            partition = next(partitions, None)
+            elapsed += time.perf_counter() - started
+            if partition is None:
+                break
+            rows += len(partition)
+            yield from partition
+            started = time.perf_counter()
+    finally:
+        result.close()
+        observe_query(table, elapsed, rows)
+
+
+# ================ 여러 유저 데이터 일괄 조회 ==================
+# 테이블당 쿼리 1회 - {user_id: (overseas_rows, card_rows, loan_rows, transaction_rows)}
+def fetch_user_data_batch(user_ids: list[int], core_db: Session, mydata_db: Session):
+    overseas = fetch_grouped_rows(core_db, "overseas_remittance", REMITTANCE_COLUMNS, user_ids)
+    cards = fetch_grouped_rows(mydata_db, "mydata_card", CARD_COLUMNS, user_ids)
+    loans = fetch_grouped_rows(mydata_db, "mydata_loan", LOAN_COLUMNS, user_ids)
+    transactions = fetch_grouped_rows(mydata_db, "mydata_transaction", TRANSACTION_COLUMNS, user_ids)
+
+    return {
+        user_id: (
+            overseas.get(user_id, []),
+            cards.get(user_id, []),
+            loans.get(user_id, []),
+            transactions.get(user_id, []),
+        )
+        for user_id in user_ids
+    }
@@ -1,7 +1,12 @@
 # API 요청과 응답 정의 스키마
 
-from pydantic import BaseModel
-from typing import Dict, Union # Import Dict and Union
+import math
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, Dict, Optional, Union # Import Dict and Union
+
+from app.config.config import settings
 
 # 요청: user_id
 class ScoreRequest(BaseModel):
@@ -11,6 +16,37 @@ class ScoreRequest(BaseModel):
 class ScoreResponse(BaseModel):
     credit_score: int
 
+
+# ===============================================
+# 신용 점수 일괄 계산
+# ===============================================
+
+# 요청: user_id 목록
+class BatchScoreRequest(BaseModel):
+    user_ids: list[int] = Field(..., min_length=1)
+
+class BatchScoreItem(BaseModel):
+    user_id: int
+    credit_score: int
+
+# 응답: 유저별 계산 점수 (요청 순서, 중복 제거)
+class BatchScoreResponse(BaseModel):
+    results: list[BatchScoreItem]
+
+# ===============================================
+# 비동기 점수 계산 작업
+# ===============================================
+
+# 작업 상태: pending -> running -> done | failed (done 이면 credit_score 포함)
+class ScoreJobResponse(BaseModel):
+    job_id: str
+    user_id: int
+    status: str
+    credit_score: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
 # ===============================================
 # 신용 보고서 반환
 # ===============================================
@@ -35,6 +71,28 @@ class ScoreHistoryResponse(BaseModel):
     history: list[ScoreHistoryItem]  # 최대 7개월치
 
 
+# ===============================================
+# 최신 점수 / 히스토리 일괄 조회
+# ===============================================
+
+# 요청: user_id 목록 (+ 월별 히스토리 포함 여부)
+class BulkScoreLookupRequest(BaseModel):
+    user_ids: list[int] = Field(..., min_length=1)
+    include_history: bool = False
+
+    @model_validator(mode="after")
+    def check_user_ids(self):
+        if len(self.user_ids) > settings.BULK_LOOKUP_MAX_USERS:
+            raise ValueError(f"Number of user_ids must be at most {settings.BULK_LOOKUP_MAX_USERS}")
+        return self
+
+# 응답(NDJSON 한 줄): 점수가 없는 유저는 credit_score 0, history 는 include_history 일 때만
+class BulkScoreLookupItem(BaseModel):
+    user_id: int
+    credit_score: int
+    history: Optional[list[ScoreHistoryItem]] = None
+
+
 # ===============================================
 # 신용 점수 예측
 # ===============================================
@@ -57,4 +115,61 @@ class CreditScorePredictResponse(BaseModel):
 
     after_6m: PredictedScore
     after_12m: PredictedScore
-    after_18m: PredictedScore
\ No newline at end of file
+    after_18m: PredictedScore
+
+
+# ===============================================
+# 신용 점수 예측 (여러 송금액 what-if grid)
+# ===============================================
+
+# 요청: 유저 ID + 송금액 목록(amounts) 또는 범위(amount_min ~ amount_max, amount_step 간격, 양 끝 포함)
+class CreditScorePredictGridRequest(BaseModel):
+    user_id: int
+    amounts: Optional[list[Annotated[float, Field(ge=0)]]] = None
+    amount_min: Optional[float] = Field(None, ge=0)
+    amount_max: Optional[float] = Field(None, ge=0)
+    amount_step: Optional[float] = Field(None, gt=0)
+
+    @model_validator(mode="after")
+    def check_amounts(self):
+        has_range = self.amount_min is not None or self.amount_max is not None or self.amount_step is not None
+        if (self.amounts is None) == (not has_range):
+            raise ValueError("Provide either amounts or amount_min/amount_max/amount_step")
+        if has_range:
+            if self.amount_min is None or self.amount_max is None or self.amount_step is None:
+                raise ValueError("amount_min, amount_max and amount_step are all required")
+            if self.amount_max < self.amount_min:
+                raise ValueError("amount_max must be greater than or equal to amount_min")
+        max_amounts = settings.PREDICTION_GRID_MAX_AMOUNTS
+        if has_range:
+            # 범위가 매우 크거나 간격이 매우 작으면 몫이 inf 가 되어 int()에서 OverflowError 가 나므로 먼저 확인
+            quotient = (self.amount_max - self.amount_min) / self.amount_step
+            if not math.isfinite(quotient) or quotient >= max_amounts:
+                raise ValueError(f"Number of amounts must be between 1 and {max_amounts}")
+        count = len(self.amounts) if self.amounts is not None else self._range_count()
+        if not 1 <= count <= max_amounts:
+            raise ValueError(f"Number of amounts must be between 1 and {max_amounts}")
+        return self
+
+    def _range_count(self) -> int:
+        # 부동소수점 오차로 마지막 값이 빠지지 않도록 약간의 여유
+        return int((self.amount_max - self.amount_min) / self.amount_step + 1e-9) + 1
+
+    def monthly_amounts(self) -> list[float]:
+        if self.amounts is not None:
+            return list(self.amounts)
+        return [round(self.amount_min + i * self.amount_step, 6) for i in range(self._range_count())]
+
+# 송금액 1개의 시점별 예측 점수
+class CreditScorePredictGridItem(BaseModel):
+    monthly_remit_amount: float
+
+    after_6m: PredictedScore
+    after_12m: PredictedScore
+    after_18m: PredictedScore
+
+# 응답: 현재 점수 + 송금액별 예측 (요청 순서)
+class CreditScorePredictGridResponse(BaseModel):
+    user_id: int
+    current_score: int
+    results: list[CreditScorePredictGridItem]
@@ -0,0 +1,157 @@
+# Core Banking / MyData 동시 조회
+# 4개 테이블 조회를 각자의 풀 커넥션에서 병렬로 실행해
+# 응답 지연을 (4개 쿼리 합) -> (가장 느린 쿼리 1개) 수준으로 줄입니다.
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from app.common.profiling import run_profiled
+from app.config.config import settings
+from app.db.core_banking import ReadSessionLocal as CoreReadSessionLocal
+from app.db.core_banking import WriteSessionLocal as CoreWriteSessionLocal
+from app.db.mydata import ReadSessionLocal as MydataReadSessionLocal
+from app.repository.feature_data_repository import (
+    FeatureAggregates,
+    fetch_card_aggregates,
+    fetch_new_card_rows,
+    fetch_new_transaction_rows,
+    fetch_recent_remittance_rows,
+    fetch_transaction_aggregates,
+    has_remittance_rows,
+    has_transaction_rows,
+    in_window_has_data,
+)
+from app.repository.credit_repository import get_feature_snapshot
+from app.repository.feature_state_repository import get_feature_state
+from app.service.incremental_features import (
+    IncrementalFeatureInputs,
+    build_incremental_inputs,
+    load_feature_state,
+    persist_feature_state,
+)
+from app.service.streaming_feature_extractor import (
+    StreamedFeatureInputs,
+    stream_card_stats,
+    stream_loan_stats,
+    stream_remittance_stats,
+    stream_transaction_stats,
+)
+from app.repository.user_data_repository import (
+    fetch_card_rows,
+    fetch_loan_rows,
+    fetch_mydata_watermark,
+    fetch_remittance_rows,
+    fetch_remittance_watermark,
+    fetch_transaction_rows,
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.DB_FETCH_WORKERS,
+    thread_name_prefix="db-fetch",
+)
+
+# (세션 팩토리, 조회 함수) - 결과 튜플 순서: overseas, card, loan, transaction
+_FETCH_PLAN = (
+    (CoreReadSessionLocal, fetch_remittance_rows),
+    (MydataReadSessionLocal, fetch_card_rows),
+    (MydataReadSessionLocal, fetch_loan_rows),
+    (MydataReadSessionLocal, fetch_transaction_rows),
+)
+
+
+def _fetch_in_own_session(session_factory, fetch, user_id: int, *args):
+    db = session_factory()
+    try:
+        return fetch(db, user_id, *args)
+    finally:
+        db.close()
+
+
+def _run(fn, *args):
+    loop = asyncio.get_running_loop()
+    # 요청 컨텍스트(프로파일링 trace 등)를 조회 스레드로 전달하고, 프로파일링 중인 요청이면 그 스레드에서 측정
+    context = contextvars.copy_context()
+    return loop.run_in_executor(_executor, context.run, run_profiled, fn, *args)
+
+
+def _submit(session_factory, fetch, user_id: int, *args):
+    return _run(_fetch_in_own_session, session_factory, fetch, user_id, *args)
+
+
+async def fetch_user_data_async(user_id: int):
+    """(overseas_rows, card_rows, loan_rows, transaction_rows)를 동시에 조회합니다."""
+    results = await asyncio.gather(*(
+        _submit(session_factory, fetch, user_id)
+        for session_factory, fetch in _FETCH_PLAN
+    ))
+    return tuple(results)
+
+
+async def fetch_feature_aggregates_async(user_id: int, windows) -> FeatureAggregates:
+    """feature_data_repository.fetch_feature_aggregates 의 동시 조회 버전."""
+    tx_agg, card_agg, loan_rows, remit_rows = await asyncio.gather(
+        _submit(MydataReadSessionLocal, fetch_transaction_aggregates, user_id, windows),
+        _submit(MydataReadSessionLocal, fetch_card_aggregates, user_id, windows),
+        _submit(MydataReadSessionLocal, fetch_loan_rows, user_id),
+        _submit(CoreReadSessionLocal, fetch_recent_remittance_rows, user_id, windows),
+    )
+
+    has_data = (
+        in_window_has_data(tx_agg, card_agg, loan_rows, remit_rows)
+        or await _submit(MydataReadSessionLocal, has_transaction_rows, user_id)
+        or await _submit(CoreReadSessionLocal, has_remittance_rows, user_id)
+    )
+    return FeatureAggregates(windows, tx_agg, card_agg, loan_rows, remit_rows, has_data)
+
+
+async def stream_feature_inputs_async(user_id: int, windows, chunk_size: int) -> StreamedFeatureInputs:
+    """테이블별 스트리밍 누적을 각자의 세션(서버 사이드 커서)에서 동시에 실행합니다."""
+    transaction, card, loan, remittance = await asyncio.gather(
+        _submit(MydataReadSessionLocal, stream_transaction_stats, user_id, windows, chunk_size),
+        _submit(MydataReadSessionLocal, stream_card_stats, user_id, windows, chunk_size),
+        _submit(MydataReadSessionLocal, stream_loan_stats, user_id, windows, chunk_size),
+        _submit(CoreReadSessionLocal, stream_remittance_stats, user_id, windows, chunk_size),
+    )
+    return StreamedFeatureInputs(windows, transaction, card, loan, remittance)
+
+
+async def fetch_incremental_inputs_async(user_id: int, windows, settle_sec: float) -> IncrementalFeatureInputs:
+    """incremental_features.fetch_incremental_inputs 의 동시 조회 버전 (상태 조회 후 나머지 4개 동시 조회)."""
+    state = load_feature_state(await _submit(CoreReadSessionLocal, get_feature_state, user_id))
+    transaction_rows, card_rows, loan_rows, remit_rows = await asyncio.gather(
+        _submit(MydataReadSessionLocal, fetch_new_transaction_rows, user_id, state.watermark, windows),
+        _submit(MydataReadSessionLocal, fetch_new_card_rows, user_id, state.watermark),
+        _submit(MydataReadSessionLocal, fetch_loan_rows, user_id),
+        _submit(CoreReadSessionLocal, fetch_recent_remittance_rows, user_id, windows),
+    )
+
+    # 처음 상태를 만들 때는 전체 기간 행을 반영하므로 이벤트 루프 밖에서 실행
+    inputs, settled = await _run(
+        build_incremental_inputs, state, transaction_rows, card_rows, loan_rows, remit_rows, windows, settle_sec,
+    )
+    if not inputs.has_data:
+        inputs.has_data = (
+            await _submit(MydataReadSessionLocal, has_transaction_rows, user_id)
+            or await _submit(CoreReadSessionLocal, has_remittance_rows, user_id)
+        )
+    if settled is not None:
+        await _run(persist_feature_state, CoreWriteSessionLocal, user_id, settled)
+    return inputs
+
+
+def _fetch_feature_snapshot(core_db, user_id: int):
+    return get_feature_snapshot(user_id, core_db)
+
+
+async def fetch_feature_snapshot_async(user_id: int):
+    """credit_feature_snapshot 1행 (PK 조회)."""
+    return await _submit(CoreReadSessionLocal, _fetch_feature_snapshot, user_id)
+
+
+async def fetch_user_data_watermark_async(user_id: int):
+    mydata_watermark, remittance_watermark = await asyncio.gather(
+        _submit(MydataReadSessionLocal, fetch_mydata_watermark, user_id),
+        _submit(CoreReadSessionLocal, fetch_remittance_watermark, user_id),
+    )
+    return mydata_watermark + remittance_watermark
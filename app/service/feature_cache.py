@@ -0,0 +1,160 @@
+# 유저 피처 캐시
+# 점수 계산 직후 보고서/예측 조회처럼 같은 유저의 피처를 짧은 간격으로 다시 계산하는 경우를 줄입니다.
+# 키에 데이터 워터마크(MyData collected_at 최댓값, 송금 created_at 최댓값 + 건수 / 실패 건수 / 금액 합계)와
+# 기준 날짜가 들어가므로 새 데이터가 들어오거나 송금 상태가 바뀌면 키 자체가 바뀌어 오래된 피처는 조회되지 않습니다.
+# (MyData 행을 collected_at 갱신 없이 수정하는 경우는 FEATURE_CACHE_TTL_SEC 이내에는 반영되지 않음)
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from app.config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class UserFeatures(NamedTuple):
+    """유저 1명의 피처 추출 결과. error가 있으면 캐시하지 않습니다."""
+
+    has_data: bool
+    features: Optional[dict]
+    error: Optional[Exception] = None
+
+
+class LocalLRUBackend:
+    """프로세스 내 LRU + TTL 저장소."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend:
+    """여러 워커가 공유하는 Redis 저장소 (redis 패키지가 설치된 경우에만 사용)."""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "credit-features:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return UserFeatures(data["has_data"], data["features"])
+
+    def set(self, key: str, value: UserFeatures):
+        data = json.dumps({"has_data": value.has_data, "features": value.features})
+        self.client.set(self.prefix + key, data, px=int(self.ttl * 1000))
+
+
+class FeatureCache:
+    """로컬 LRU 우선, 없으면 공유 저장소(선택)를 조회하는 2단 캐시."""
+
+    def __init__(self, local: LocalLRUBackend, shared=None, enabled: bool = True):
+        self.local = local
+        self.shared = shared
+        self.enabled = enabled
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(user_id: int, as_of, watermark: tuple) -> str:
+        return f"{user_id}:{as_of.isoformat()}:" + "|".join(
+            "" if value is None else str(value) for value in watermark
+        )
+
+    def get(self, key: str) -> Optional[UserFeatures]:
+        if not self.enabled:
+            return None
+
+        value = self.local.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except Exception as e:
+                logger.warning("Shared feature cache get failed: %s", e)
+                value = None
+            if value is not None:
+                self.shared_hits += 1
+                self.local.set(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: UserFeatures):
+        if not self.enabled or value.error is not None:
+            return
+
+        self.local.set(key, value)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value)
+            except Exception as e:
+                logger.warning("Shared feature cache set failed: %s", e)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "size": len(self.local),
+            "max_size": self.local.max_size,
+            "ttl_sec": self.local.ttl,
+            "shared_backend": type(self.shared).__name__ if self.shared is not None else None,
+        }
+
+
+def _build_feature_cache() -> FeatureCache:
+    shared = None
+    if settings.FEATURE_CACHE_REDIS_URL:
+        try:
+            shared = RedisBackend(settings.FEATURE_CACHE_REDIS_URL, settings.FEATURE_CACHE_TTL_SEC)
+        except ImportError:
+            logger.warning("FEATURE_CACHE_REDIS_URL is set but redis is not installed; using local cache only")
+
+    return FeatureCache(
+        LocalLRUBackend(settings.FEATURE_CACHE_MAX_SIZE, settings.FEATURE_CACHE_TTL_SEC),
+        shared=shared,
+        enabled=settings.FEATURE_CACHE_ENABLED,
+    )
+
+
+feature_cache = _build_feature_cache()
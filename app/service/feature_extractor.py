@@ -1,7 +1,12 @@
+from dataclasses import dataclass
 from datetime import datetime, date
+from typing import Optional
 from dateutil.relativedelta import relativedelta
 import math
 
+# 지출로 집계하는 출금 카테고리
+SPEND_CATEGORIES = ("LIVING", "RENT", "ENTERTAIN", "ETC", "REMIT_OUT")
+
 def to_date(dt):
     if dt is None: return None
     if isinstance(dt, date): return dt
@@ -22,18 +27,118 @@ def safe_int(v):
     except: return 0
 
 
+def feature_windows(today=None):
+    """피처 계산 기준 시점: (start_6m_date, start_6m, start_3m_date, start_3m)"""
+    today = today or date.today()
+    start_6m_date = today - relativedelta(months=6)
+    start_6m = datetime.combine(start_6m_date, datetime.min.time())
+    start_3m_date = today - relativedelta(months=3)
+    start_3m = datetime.combine(start_3m_date, datetime.min.time())
+    return start_6m_date, start_6m, start_3m_date, start_3m
+
+
+# -----------------------------
+#   Feature Statistics
+# -----------------------------
+@dataclass
+class FeatureStats:
+    """
+    피처 계산에 필요한 요약 통계.
+    추출 방식(Python 루프, NumPy, SQL 집계, 스트리밍)과 무관하게 derive_features()로 동일한 피처를 만듭니다.
+    """
+    # 소득 / 지출 (6개월)
+    salary_total: float = 0.0
+    salary_count: int = 0
+    income_volatility: float = 0.0
+    spend_total: float = 0.0
+    spend_count: int = 0
+
+    # 유동성 (3개월)
+    min_balance_3m: float = 0.0
+    spend_3m_total: float = 0.0
+
+    # 해외 송금 (6개월)
+    remit_count: int = 0
+    remit_fail: int = 0
+    remit_total: float = 0.0
+    remit_amount_avg: float = 0.0
+    remit_amount_std: float = 0.0
+    interval_stability: float = 0.0
+
+    # 대출 / 연체
+    loan_principal_total: float = 0.0
+    overdue_cnt_total: int = 0
+    overdue_amt_total: float = 0.0
+    max_overdue_days: int = 0
+    last_overdue_date: Optional[date] = None
+
+    # 카드 (한도 소진율은 전체, 금액은 3개월)
+    max_utilization_ratio: float = 0.0
+    card_total: float = 0.0
+    ca_total: float = 0.0
+
+
+def summarize_loans(loan_rows, stats: FeatureStats):
+    for row in loan_rows:
+        stats.loan_principal_total += safe_float(row.loan_principal)
+        stats.overdue_cnt_total += safe_int(row.overdue_count_12m)
+        stats.overdue_amt_total += safe_float(row.overdue_amount)
+        stats.max_overdue_days = max(stats.max_overdue_days, safe_int(row.max_overdue_days))
+        if row.last_overdue_dt:
+            od = to_date(row.last_overdue_dt)
+            if stats.last_overdue_date is None or (od and od > stats.last_overdue_date):
+                stats.last_overdue_date = od
+
+
+def summarize_remittances(remit_rows, stats: FeatureStats, start_6m: datetime):
+    remit_amounts = []
+    remit_dates = []
+
+    for row in remit_rows:
+        r_date = to_date(row.created_at)
+        if r_date is None: continue
+        r_dt_for_comparison = datetime.combine(r_date, datetime.min.time())
+
+        if r_dt_for_comparison >= start_6m:
+            amount = safe_float(row.send_amount)
+            stats.remit_count += 1
+            stats.remit_total += amount
+            remit_amounts.append(amount)
+            remit_dates.append(r_date)
+
+            if str(row.remittance_status).upper() == "FAILED":
+                stats.remit_fail += 1
+
+    # 금액 기반 평균/표준편차
+    if remit_amounts:
+        avg_amt = sum(remit_amounts)/len(remit_amounts)
+        var_amt = sum((x - avg_amt)**2 for x in remit_amounts) / len(remit_amounts)
+        stats.remit_amount_avg = avg_amt
+        stats.remit_amount_std = math.sqrt(var_amt)
+
+    # 날짜(주기) 기반 Stability
+    if len(remit_dates) >= 3:
+        remit_dates_sorted = sorted(remit_dates)
+        intervals = []
+        for i in range(1, len(remit_dates_sorted)):
+            interval = (remit_dates_sorted[i] - remit_dates_sorted[i-1]).days
+            intervals.append(interval)
+
+        avg_int = sum(intervals) / len(intervals)
+        if avg_int > 0:
+            var_int = sum((x - avg_int)**2 for x in intervals) / len(intervals)
+            std_int = math.sqrt(var_int)
+            stats.interval_stability = max(0.0, 1 - (std_int / avg_int))
+
+
 # -----------------------------
 #   Feature Extract Function
 # -----------------------------
 def extract_features(transaction_rows, card_rows, loan_rows, remit_rows):
 
-    today = date.today()
-    start_6m_date = today - relativedelta(months=6) 
-    start_6m = datetime.combine(start_6m_date, datetime.min.time())
-    start_3m_date = today - relativedelta(months=3)
-    start_3m = datetime.combine(start_3m_date, datetime.min.time())
+    start_6m_date, start_6m, start_3m_date, start_3m = feature_windows()
 
-    features = {}
+    stats = FeatureStats()
 
     # 1) 소득 / 지출 ---------------------------------------
     salary_amounts = []
@@ -46,28 +151,19 @@ def extract_features(transaction_rows, card_rows, loan_rows, remit_rows):
             salary_amounts.append(safe_float(row.amount))
 
         if tx_dt >= start_6m and row.direction == "OUT" and \
-           row.category in ("LIVING", "RENT", "ENTERTAIN", "ETC", "REMIT_OUT"):
+           row.category in SPEND_CATEGORIES:
             spend_amounts.append(safe_float(row.amount))
 
-    income_avg_6m = sum(salary_amounts)/len(salary_amounts) if salary_amounts else 0.0
-    features["income_avg_6m"] = income_avg_6m
+    stats.salary_total = sum(salary_amounts)
+    stats.salary_count = len(salary_amounts)
 
     if len(salary_amounts) >= 2:
-        mean_val = income_avg_6m
+        mean_val = stats.salary_total / stats.salary_count
         var = sum((x - mean_val)**2 for x in salary_amounts) / len(salary_amounts)
-        features["income_volatility_6m"] = math.sqrt(var)
-    else:
-        features["income_volatility_6m"] = 0.0
-
-    spending_avg_6m = sum(spend_amounts)/len(spend_amounts) if spend_amounts else 0.0
-    features["spending_avg_6m"] = spending_avg_6m
+        stats.income_volatility = math.sqrt(var)
 
-    if income_avg_6m > 0:
-        saving_rate = (income_avg_6m - spending_avg_6m) / income_avg_6m
-        saving_rate = max(-1, min(1, saving_rate))
-    else:
-        saving_rate = 0.0
-    features["saving_rate_6m"] = saving_rate
+    stats.spend_total = sum(spend_amounts)
+    stats.spend_count = len(spend_amounts)
 
     # 2) 유동성 -------------------------------------------
     balance_list = []
@@ -82,57 +178,121 @@ def extract_features(transaction_rows, card_rows, loan_rows, remit_rows):
                 balance_list.append(safe_float(row.balance_after))
 
             if row.direction == "OUT" and \
-               row.category in ("LIVING", "RENT", "ENTERTAIN", "ETC", "REMIT_OUT"):
+               row.category in SPEND_CATEGORIES:
                 spend_3m_total += safe_float(row.amount)
 
-    min_balance_3m = min(balance_list) if balance_list else 0.0
-    features["min_balance_3m"] = min_balance_3m
-
-    spend_3m_monthly = (spend_3m_total / 3) if spend_3m_total > 0 else 0.0
-    liquidity_months = min(12, min_balance_3m / spend_3m_monthly) if spend_3m_monthly > 0 else 12
-    features["liquidity_months_3m"] = liquidity_months
+    stats.min_balance_3m = min(balance_list) if balance_list else 0.0
+    stats.spend_3m_total = spend_3m_total
 
     # 3) 해외 송금 -----------------------------------------
-    remit_amounts = []
-    remit_dates = []
-    remit_cnt = 0
-    remit_fail = 0
-    remit_total_amount = 0.0
+    summarize_remittances(remit_rows, stats, start_6m)
 
-    for row in remit_rows:
-        r_date = to_date(row.created_at)
-        if r_date is None: continue
-        r_dt_for_comparison = datetime.combine(r_date, datetime.min.time())
+    # 4) 대출 / 연체 ----------------------------------------
+    summarize_loans(loan_rows, stats)
 
-        if r_dt_for_comparison >= start_6m:
-            amount = safe_float(row.send_amount)
-            remit_cnt += 1
-            remit_total_amount += amount
-            remit_amounts.append(amount)
-            remit_dates.append(r_date)
+    # 5) 카드 위험도 ----------------------------------------
+    for row in card_rows:
+        credit_limit = safe_float(row.credit_limit)
+        outstanding_amt = safe_float(row.outstanding_amt)
 
-            if str(row.remittance_status).upper() == "FAILED":
-                remit_fail += 1
+        if credit_limit > 0:
+            util_ratio = outstanding_amt / credit_limit
+            stats.max_utilization_ratio = max(stats.max_utilization_ratio, util_ratio)
 
-    features["remittance_count_6m"] = remit_cnt
+        tx_dt = row.tx_datetime
+        if tx_dt and tx_dt >= start_3m:
+            amt = safe_float(row.tx_amount)
+            stats.card_total += amt
+            if row.tx_category == "CASH_ADVANCE":
+                stats.ca_total += amt
 
-    # 금액 기반 평균/표준편차
-    if remit_amounts:
-        avg_amt = sum(remit_amounts)/len(remit_amounts)
-        var_amt = sum((x - avg_amt)**2 for x in remit_amounts) / len(remit_amounts)
-        std_amt = math.sqrt(var_amt)
+    return derive_features(stats, start_6m_date)
+
+
+# -----------------------------
+#   SQL 집계 결과 -> Features
+# -----------------------------
+def extract_features_from_aggregates(tx_agg, card_agg, loan_rows, remit_rows, windows):
+    """
+    feature_data_repository 의 집계 결과로 extract_features()와 같은 피처를 만듭니다.
+    합계/편차 제곱합은 SQL에서 더하므로 부동소수점 끝자리는 행 단위 계산과 다를 수 있습니다.
+    """
+    start_6m_date, start_6m, _, _ = windows
+
+    stats = FeatureStats()
+
+    # 1) 소득 / 지출 (6개월) -------------------------------
+    stats.salary_total = safe_float(tx_agg.salary_total)
+    stats.salary_count = safe_int(tx_agg.salary_count)
+    if stats.salary_count >= 2:
+        var = safe_float(tx_agg.salary_sq_dev) / stats.salary_count
+        stats.income_volatility = math.sqrt(var)
+
+    stats.spend_total = safe_float(tx_agg.spend_total)
+    stats.spend_count = safe_int(tx_agg.spend_count)
+
+    # 2) 유동성 (3개월) ------------------------------------
+    stats.min_balance_3m = safe_float(tx_agg.min_balance_3m)
+    stats.spend_3m_total = safe_float(tx_agg.spend_3m_total)
+
+    # 3) 해외 송금: 6개월 이내 행만 조회됨 --------------------
+    summarize_remittances(remit_rows, stats, start_6m)
+
+    # 4) 대출 / 연체 ----------------------------------------
+    summarize_loans(loan_rows, stats)
+
+    # 5) 카드 위험도 ----------------------------------------
+    stats.max_utilization_ratio = max(0.0, safe_float(card_agg.max_utilization_ratio))
+    stats.card_total = safe_float(card_agg.card_total)
+    stats.ca_total = safe_float(card_agg.ca_total)
+
+    return derive_features(stats, start_6m_date)
+
+
+# -----------------------------
+#   Stats -> Features
+# -----------------------------
+def derive_features(stats: FeatureStats, start_6m_date: date):
+
+    features = {}
+
+    # 1) 소득 / 지출 ---------------------------------------
+    income_avg_6m = stats.salary_total / stats.salary_count if stats.salary_count else 0.0
+    features["income_avg_6m"] = income_avg_6m
+    features["income_volatility_6m"] = stats.income_volatility
+
+    spending_avg_6m = stats.spend_total / stats.spend_count if stats.spend_count else 0.0
+    features["spending_avg_6m"] = spending_avg_6m
+
+    if income_avg_6m > 0:
+        saving_rate = (income_avg_6m - spending_avg_6m) / income_avg_6m
+        saving_rate = max(-1, min(1, saving_rate))
     else:
-        avg_amt = 0.0
-        std_amt = 0.0
+        saving_rate = 0.0
+    features["saving_rate_6m"] = saving_rate
+
+    # 2) 유동성 -------------------------------------------
+    min_balance_3m = stats.min_balance_3m
+    features["min_balance_3m"] = min_balance_3m
+
+    spend_3m_monthly = (stats.spend_3m_total / 3) if stats.spend_3m_total > 0 else 0.0
+    liquidity_months = min(12, min_balance_3m / spend_3m_monthly) if spend_3m_monthly > 0 else 12
+    features["liquidity_months_3m"] = liquidity_months
 
+    # 3) 해외 송금 -----------------------------------------
+    remit_cnt = stats.remit_count
+    avg_amt = stats.remit_amount_avg
+    std_amt = stats.remit_amount_std
+
+    features["remittance_count_6m"] = remit_cnt
     features["remittance_amount_avg_6m"] = avg_amt
     features["remittance_amount_std_6m"] = std_amt
 
-    salary_6m_total = sum(salary_amounts)
-    remit_income_ratio = remit_total_amount / salary_6m_total if salary_6m_total > 0 else 0.0
+    salary_6m_total = stats.salary_total
+    remit_income_ratio = stats.remit_total / salary_6m_total if salary_6m_total > 0 else 0.0
     features["remittance_income_ratio"] = remit_income_ratio
 
-    features["remittance_failure_rate_6m"] = (remit_fail / remit_cnt) if remit_cnt > 0 else 0.0
+    features["remittance_failure_rate_6m"] = (stats.remit_fail / remit_cnt) if remit_cnt > 0 else 0.0
 
     # --------- 금액 기반 Stability ----------
     if avg_amt > 0 and remit_cnt >= 2:
@@ -140,91 +300,41 @@ def extract_features(transaction_rows, card_rows, loan_rows, remit_rows):
     else:
         amount_stability = 0.0
 
-    # --------- 날짜(주기) 기반 Stability ----------
-    if len(remit_dates) >= 3:
-        remit_dates_sorted = sorted(remit_dates)
-        intervals = []
-        for i in range(1, len(remit_dates_sorted)):
-            interval = (remit_dates_sorted[i] - remit_dates_sorted[i-1]).days
-            intervals.append(interval)
-
-        avg_int = sum(intervals) / len(intervals)
-        if avg_int > 0:
-            var_int = sum((x - avg_int)**2 for x in intervals) / len(intervals)
-            std_int = math.sqrt(var_int)
-            interval_stability = max(0.0, 1 - (std_int / avg_int))
-        else:
-            interval_stability = 0.0
-    else:
-        interval_stability = 0.0
-
     # -------- 복합 Stability: 금액 50% + 주기 50% --------
-    combined_stability = (amount_stability * 0.5) + (interval_stability * 0.5)
+    combined_stability = (amount_stability * 0.5) + (stats.interval_stability * 0.5)
     features["remittance_cycle_stability"] = combined_stability
 
     # 4) 대출 / 연체 ----------------------------------------
-    loan_principal_total = 0.0
-    overdue_cnt_total = 0
-    overdue_amt_total = 0.0
-    max_overdue_days = 0
-    last_overdue_date = None
-
-    for row in loan_rows:
-        loan_principal_total += safe_float(row.loan_principal)
-        overdue_cnt_total += safe_int(row.overdue_count_12m)
-        overdue_amt_total += safe_float(row.overdue_amount)
-        max_overdue_days = max(max_overdue_days, safe_int(row.max_overdue_days))
-        if row.last_overdue_dt:
-            od = to_date(row.last_overdue_dt)
-            if last_overdue_date is None or (od and od > last_overdue_date):
-                last_overdue_date = od
+    loan_principal_total = stats.loan_principal_total
 
     annual_income = income_avg_6m * 12
     dti = loan_principal_total / annual_income if annual_income > 0 else 0.0
     features["dti_loan_ratio"] = dti
 
-    score_cnt = (overdue_cnt_total / 5.0) * 0.3
-    score_days = (max_overdue_days / 90.0) * 0.4
-    score_amt = (overdue_amt_total / loan_principal_total) * 0.3 if loan_principal_total > 0 else 0.0
+    score_cnt = (stats.overdue_cnt_total / 5.0) * 0.3
+    score_days = (stats.max_overdue_days / 90.0) * 0.4
+    score_amt = (stats.overdue_amt_total / loan_principal_total) * 0.3 if loan_principal_total > 0 else 0.0
     raw_score = score_cnt + score_days + score_amt
 
     loan_overdue_score = max(0, min(1, raw_score))
     features["loan_overdue_score"] = loan_overdue_score
 
+    last_overdue_date = stats.last_overdue_date
     if last_overdue_date and last_overdue_date >= start_6m_date:
         features["recent_overdue_flag"] = 1
     else:
         features["recent_overdue_flag"] = 0
 
     # 5) 카드 위험도 ----------------------------------------
-    max_utilization_ratio = 0.0
-    ca_total = 0.0
-    card_total = 0.0
-
-    for row in card_rows:
-        credit_limit = safe_float(row.credit_limit)
-        outstanding_amt = safe_float(row.outstanding_amt)
-
-        if credit_limit > 0:
-            util_ratio = outstanding_amt / credit_limit
-            max_utilization_ratio = max(max_utilization_ratio, util_ratio)
-
-        tx_dt = row.tx_datetime
-        if tx_dt and tx_dt >= start_3m:
-            amt = safe_float(row.tx_amount)
-            card_total += amt
-            if row.tx_category == "CASH_ADVANCE":
-                ca_total += amt
-
-    features["card_utilization_3m"] = max_utilization_ratio
-    features["card_cash_advance_ratio"] = (ca_total / card_total) if card_total > 0 else 0.0
+    features["card_utilization_3m"] = stats.max_utilization_ratio
+    features["card_cash_advance_ratio"] = (stats.ca_total / stats.card_total) if stats.card_total > 0 else 0.0
 
     # 6) 리스크 --------------------------------------------
     risk_cnt = 0
-    if overdue_cnt_total > 0: risk_cnt += 1
-    if remit_fail > 0: risk_cnt += 1
+    if stats.overdue_cnt_total > 0: risk_cnt += 1
+    if stats.remit_fail > 0: risk_cnt += 1
     if features["card_cash_advance_ratio"] > 0.3: risk_cnt += 1
     if features["card_utilization_3m"] > 0.9: risk_cnt += 1
     features["risk_event_count"] = risk_cnt
 
-    return features
\ No newline at end of file
+    return features
@@ -0,0 +1,86 @@
+# 피처 스냅샷 (credit_feature_snapshot)
+# 점수 계산 때 만든 피처(MODEL_FEATURE_ORDER 순서 벡터)와 점수, 모델 버전, 계산 시각을 점수와 같은 트랜잭션에 저장해 두고
+# 보고서/예측 요청은 스냅샷이 신선하면 4개 테이블 조회 + 피처 추출 대신 PK 1행 조회로 응답합니다.
+#
+# 신선함 기준: 같은 모델 버전, 같은 날짜(피처 기간 기준일), 계산 후 FEATURE_SNAPSHOT_MAX_AGE_SEC 이내.
+# 그 사이 새로 수집된 데이터는 스냅샷이 만료되거나 다시 점수를 계산할 때 반영됩니다.
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.common.metrics import Counter
+from app.model.features import MODEL_FEATURE_ORDER
+from app.service.feature_cache import UserFeatures
+
+SNAPSHOT_LOOKUPS = Counter(
+    "credit_feature_snapshot_lookups_total", "Feature snapshot lookups by result", ["result"],
+)
+
+
+@dataclass
+class FeatureSnapshot:
+    has_data: bool
+    features: dict
+    credit_score: int
+    model_version: str
+    computed_at: datetime
+
+    def is_fresh(self, model_version: str, max_age_sec: float, now: datetime = None) -> bool:
+        now = now or datetime.now()
+        return (
+            self.model_version == model_version
+            and self.computed_at.date() == now.date()
+            and (now - self.computed_at).total_seconds() <= max_age_sec
+        )
+
+    def user_features(self) -> UserFeatures:
+        return UserFeatures(self.has_data, dict(self.features))
+
+
+def snapshot_params(user_id: int, user_features: UserFeatures, credit_score: int, model_version: str,
+                    computed_at: datetime = None) -> Optional[dict]:
+    """credit_repository 저장용 파라미터. 피처 추출에 실패한 경우는 저장하지 않음(None)."""
+    if user_features.error is not None or user_features.features is None:
+        return None
+    vector = [user_features.features.get(col, 0.0) for col in MODEL_FEATURE_ORDER]
+    return {
+        "user_id": user_id,
+        "features": json.dumps(vector, separators=(",", ":")),
+        "has_data": int(bool(user_features.has_data)),
+        "score": credit_score,
+        "model_version": model_version,
+        "computed_at": computed_at or datetime.now(),
+    }
+
+
+def parse_snapshot(row) -> Optional[FeatureSnapshot]:
+    """credit_repository.get_feature_snapshot() 결과 -> FeatureSnapshot (없거나 피처 목록이 다르면 None)."""
+    if row is None:
+        return None
+    vector = json.loads(row.features)
+    if len(vector) != len(MODEL_FEATURE_ORDER):
+        return None
+    computed_at = row.computed_at
+    if isinstance(computed_at, str):
+        computed_at = datetime.fromisoformat(computed_at)
+    return FeatureSnapshot(
+        has_data=bool(row.has_data),
+        features=dict(zip(MODEL_FEATURE_ORDER, vector)),
+        credit_score=int(row.score),
+        model_version=row.model_version,
+        computed_at=computed_at,
+    )
+
+
+def fresh_snapshot(row, model_version: str, max_age_sec: float) -> Optional[FeatureSnapshot]:
+    snapshot = parse_snapshot(row)
+    if snapshot is None:
+        SNAPSHOT_LOOKUPS.labels("miss").inc()
+        return None
+    if not snapshot.is_fresh(model_version, max_age_sec):
+        SNAPSHOT_LOOKUPS.labels("stale").inc()
+        return None
+    SNAPSHOT_LOOKUPS.labels("hit").inc()
+    return snapshot
@@ -0,0 +1,324 @@
+# 증분 피처 상태
+# 입출금/카드 행을 날짜별 부분 집계(bucket)로 유저별로 저장해 두고, 다음 계산 때는
+# collected_at 워터마크 이후에 수집된 행만 읽어 bucket 에 더합니다.
+# 6개월/3개월 기간 조건이 날짜 단위라 bucket 도 날짜 단위이며, 기간을 벗어난 bucket 은 삭제합니다.
+# 계산 비용은 전체 이력이 아니라 새로 수집된 행 수에 비례합니다.
+#
+# - 대출(건수가 적고 행이 갱신됨)과 송금(상태가 바뀜, 6개월 이내만 조회)은 매번 그대로 조회합니다.
+# - 수집 지연으로 워터마크 이전 collected_at 행이 늦게 커밋되는 경우를 피하려고,
+#   (현재 - FEATURE_STATE_SETTLE_SEC) 이후 수집된 행은 상태에 저장하지 않고 이번 계산에만 더합니다.
+# - 합계는 날짜별 bucket 순으로 더하고 분산은 bucket 별 (건수, 합계, M2)를 병합하므로
+#   부동소수점 끝자리가 행 단위 계산(extract_features)과 다를 수 있습니다.
+
+import copy
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.repository.feature_data_repository import (
+    fetch_new_card_rows,
+    fetch_new_transaction_rows,
+    fetch_recent_remittance_rows,
+    has_remittance_rows,
+    has_transaction_rows,
+)
+from app.repository.feature_state_repository import get_feature_state, save_feature_state
+from app.repository.user_data_repository import fetch_loan_rows
+from app.service.feature_extractor import (
+    SPEND_CATEGORIES,
+    FeatureStats,
+    derive_features,
+    safe_float,
+    summarize_loans,
+    summarize_remittances,
+    to_date,
+)
+
+logger = logging.getLogger(__name__)
+
+# 입출금 bucket: [급여 건수, 급여 합계, 급여 M2, 지출 건수, 지출 합계, 최소 잔액]
+_SALARY_COUNT, _SALARY_TOTAL, _SALARY_M2, _SPEND_COUNT, _SPEND_TOTAL, _MIN_BALANCE = range(6)
+# 카드 bucket: [이용 금액, 현금서비스 금액]
+_CARD_TOTAL, _CA_TOTAL = range(2)
+
+
+def _add_moment(bucket: list, x: float):
+    # Welford: (건수, 합계, M2) 갱신
+    count = bucket[_SALARY_COUNT]
+    old_mean = bucket[_SALARY_TOTAL] / count if count else 0.0
+    bucket[_SALARY_COUNT] = count + 1
+    bucket[_SALARY_TOTAL] += x
+    new_mean = bucket[_SALARY_TOTAL] / bucket[_SALARY_COUNT]
+    bucket[_SALARY_M2] += (x - old_mean) * (x - new_mean)
+
+
+def _day_key(value) -> str:
+    # bucket 키 (YYYY-MM-DD). to_date()는 datetime 을 그대로 돌려주므로 날짜 부분만 사용
+    day = to_date(value)
+    return (day.date() if isinstance(day, datetime) else day).isoformat()
+
+
+def _merge_moments(a: tuple, b: tuple) -> tuple:
+    # 두 그룹의 (건수, 합계, M2) 병합 (Chan et al.)
+    n_a, total_a, m2_a = a
+    n_b, total_b, m2_b = b
+    if n_a == 0:
+        return b
+    if n_b == 0:
+        return a
+    n = n_a + n_b
+    delta = total_b / n_b - total_a / n_a
+    return n, total_a + total_b, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+class FeatureState:
+    """유저 1명의 증분 피처 상태 (날짜별 bucket + 워터마크)."""
+
+    VERSION = 2
+
+    def __init__(self, watermark: Optional[datetime] = None, transaction_days: dict = None,
+                 card_days: dict = None, max_utilization_ratio: float = 0.0, card_rows: int = 0):
+        self.watermark = watermark
+        self.transaction_days = transaction_days or {}
+        self.card_days = card_days or {}
+        self.max_utilization_ratio = max_utilization_ratio
+        # 전체 기간 카드 행 수 (데이터 존재 여부 판단용)
+        self.card_rows = card_rows
+
+    # ---------------- 직렬화 ----------------
+    @classmethod
+    def from_json(cls, watermark, raw: str) -> "FeatureState":
+        data = json.loads(raw)
+        if data.get("v") != cls.VERSION:
+            # 형식이 바뀌면 처음부터 다시 만듦
+            return cls()
+        return cls(
+            watermark=watermark,
+            transaction_days=data["tx"],
+            card_days=data["card"],
+            max_utilization_ratio=data["max_util"],
+            card_rows=data["card_rows"],
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "v": self.VERSION,
+            "tx": self.transaction_days,
+            "card": self.card_days,
+            "max_util": self.max_utilization_ratio,
+            "card_rows": self.card_rows,
+        }, separators=(",", ":"))
+
+    def copy(self) -> "FeatureState":
+        return copy.deepcopy(self)
+
+    # ---------------- 행 반영 ----------------
+    def add_transaction(self, row):
+        tx_dt = row.tx_datetime
+        if tx_dt is None:
+            return
+        day = _day_key(tx_dt)
+        bucket = self.transaction_days.get(day)
+        if bucket is None:
+            bucket = self.transaction_days[day] = [0, 0.0, 0.0, 0, 0.0, None]
+
+        if row.direction == "IN" and row.category == "SALARY":
+            _add_moment(bucket, safe_float(row.amount))
+        if row.direction == "OUT" and row.category in SPEND_CATEGORIES:
+            bucket[_SPEND_COUNT] += 1
+            bucket[_SPEND_TOTAL] += safe_float(row.amount)
+        if row.balance_after is not None:
+            balance = safe_float(row.balance_after)
+            if bucket[_MIN_BALANCE] is None or balance < bucket[_MIN_BALANCE]:
+                bucket[_MIN_BALANCE] = balance
+
+    def add_card(self, row, start_3m: datetime):
+        self.card_rows += 1
+        credit_limit = safe_float(row.credit_limit)
+        if credit_limit > 0:
+            self.max_utilization_ratio = max(self.max_utilization_ratio, safe_float(row.outstanding_amt) / credit_limit)
+
+        tx_dt = row.tx_datetime
+        if tx_dt and tx_dt >= start_3m:
+            day = _day_key(tx_dt)
+            bucket = self.card_days.get(day)
+            if bucket is None:
+                bucket = self.card_days[day] = [0.0, 0.0]
+            amt = safe_float(row.tx_amount)
+            bucket[_CARD_TOTAL] += amt
+            if row.tx_category == "CASH_ADVANCE":
+                bucket[_CA_TOTAL] += amt
+
+    def expire(self, windows):
+        """기간(입출금 6개월, 카드 3개월)을 벗어난 bucket 삭제."""
+        start_6m_date, _, start_3m_date, _ = windows
+        start_6m_key, start_3m_key = start_6m_date.isoformat(), start_3m_date.isoformat()
+        self.transaction_days = {day: b for day, b in self.transaction_days.items() if day >= start_6m_key}
+        self.card_days = {day: b for day, b in self.card_days.items() if day >= start_3m_key}
+
+    # ---------------- 통계 ----------------
+    def apply(self, stats: FeatureStats, windows):
+        start_6m_date, _, start_3m_date, _ = windows
+        start_6m_key, start_3m_key = start_6m_date.isoformat(), start_3m_date.isoformat()
+
+        salary = (0, 0.0, 0.0)
+        min_balance = None
+        for day in sorted(self.transaction_days):
+            if day < start_6m_key:
+                continue
+            bucket = self.transaction_days[day]
+            salary = _merge_moments(salary, tuple(bucket[_SALARY_COUNT:_SALARY_M2 + 1]))
+            stats.spend_count += bucket[_SPEND_COUNT]
+            stats.spend_total += bucket[_SPEND_TOTAL]
+            if day >= start_3m_key:
+                stats.spend_3m_total += bucket[_SPEND_TOTAL]
+                if bucket[_MIN_BALANCE] is not None and (min_balance is None or bucket[_MIN_BALANCE] < min_balance):
+                    min_balance = bucket[_MIN_BALANCE]
+
+        stats.salary_count, stats.salary_total, salary_m2 = salary
+        if stats.salary_count >= 2:
+            stats.income_volatility = (max(0.0, salary_m2) / stats.salary_count) ** 0.5
+        stats.min_balance_3m = min_balance if min_balance is not None else 0.0
+
+        for day in sorted(self.card_days):
+            if day < start_3m_key:
+                continue
+            stats.card_total += self.card_days[day][_CARD_TOTAL]
+            stats.ca_total += self.card_days[day][_CA_TOTAL]
+        stats.max_utilization_ratio = self.max_utilization_ratio
+
+
+# =========================================================
+# 상태 갱신
+# =========================================================
+def advance_feature_state(state: FeatureState, transaction_rows, card_rows, windows, cutoff: datetime):
+    """
+    (저장할 상태, 이번 계산에 쓸 상태, 저장 필요 여부)를 반환합니다.
+    collected_at <= cutoff 인 행은 저장할 상태에, 그 이후 행은 이번 계산용 사본에만 반영합니다.
+    """
+    _, _, _, start_3m = windows
+    settled = state.copy()
+    settled.watermark = cutoff if state.watermark is None else max(state.watermark, cutoff)
+
+    pending_transactions = []
+    pending_cards = []
+    settled_rows = 0
+    for row in transaction_rows:
+        if row.collected_at is not None and row.collected_at > cutoff:
+            pending_transactions.append(row)
+        else:
+            settled.add_transaction(row)
+            settled_rows += 1
+    for row in card_rows:
+        if row.collected_at is not None and row.collected_at > cutoff:
+            pending_cards.append(row)
+        else:
+            settled.add_card(row, start_3m)
+            settled_rows += 1
+
+    bucket_count = len(settled.transaction_days) + len(settled.card_days)
+    settled.expire(windows)
+    # 새 행 반영, 만료 bucket 삭제, 처음 만든 상태일 때만 저장
+    changed = (
+        state.watermark is None
+        or settled_rows > 0
+        or bucket_count != len(settled.transaction_days) + len(settled.card_days)
+    )
+
+    if not pending_transactions and not pending_cards:
+        return settled, settled, changed
+
+    current = settled.copy()
+    for row in pending_transactions:
+        current.add_transaction(row)
+    for row in pending_cards:
+        current.add_card(row, start_3m)
+    return settled, current, changed
+
+
+# =========================================================
+# 피처 입력
+# =========================================================
+@dataclass
+class IncrementalFeatureInputs:
+    """증분 상태 + 매번 조회하는 대출/송금 행 (scoring_service 의 피처 입력 타입 중 하나)."""
+
+    windows: tuple
+    state: FeatureState
+    loan_rows: list
+    remit_rows: list
+    has_data: bool
+    new_transaction_rows: int = 0
+    new_card_rows: int = 0
+
+
+def load_feature_state(row) -> FeatureState:
+    """feature_state_repository.get_feature_state() 결과 -> FeatureState (없거나 깨졌으면 새 상태)."""
+    if row is None:
+        return FeatureState()
+    watermark, raw = row
+    try:
+        return FeatureState.from_json(watermark, raw)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("Discarding unreadable feature state: %s", e)
+        return FeatureState()
+
+
+def build_incremental_inputs(state: FeatureState, transaction_rows, card_rows, loan_rows, remit_rows,
+                             windows, settle_sec: float):
+    """(IncrementalFeatureInputs, 저장할 FeatureState 또는 None)"""
+    cutoff = datetime.now() - timedelta(seconds=settle_sec)
+    settled, current, changed = advance_feature_state(state, transaction_rows, card_rows, windows, cutoff)
+
+    inputs = IncrementalFeatureInputs(
+        windows,
+        current,
+        loan_rows,
+        remit_rows,
+        has_data=bool(current.transaction_days or current.card_rows or loan_rows or remit_rows),
+        new_transaction_rows=len(transaction_rows),
+        new_card_rows=len(card_rows),
+    )
+    return inputs, (settled if changed else None)
+
+
+def fetch_incremental_inputs(user_id: int, core_db, mydata_db, windows, settle_sec: float):
+    """상태 조회 -> 워터마크 이후 행만 조회 -> 상태 갱신. (입력, 저장할 상태 또는 None)"""
+    state = load_feature_state(get_feature_state(core_db, user_id))
+    inputs, settled = build_incremental_inputs(
+        state,
+        fetch_new_transaction_rows(mydata_db, user_id, state.watermark, windows),
+        fetch_new_card_rows(mydata_db, user_id, state.watermark),
+        fetch_loan_rows(mydata_db, user_id),
+        fetch_recent_remittance_rows(core_db, user_id, windows),
+        windows,
+        settle_sec,
+    )
+    if not inputs.has_data:
+        # 기간 밖 데이터만 있는 유저 (기존과 같이 데이터 있음으로 처리)
+        inputs.has_data = has_transaction_rows(mydata_db, user_id) or has_remittance_rows(core_db, user_id)
+    return inputs, settled
+
+
+def persist_feature_state(session_factory, user_id: int, state: FeatureState):
+    # 상태 저장 실패는 다음 계산에서 다시 반영되므로 점수 계산은 계속 진행
+    db = session_factory()
+    try:
+        save_feature_state(db, user_id, state.watermark, state.to_json())
+    except Exception as e:
+        db.rollback()
+        logger.warning("Failed to save feature state for user %s: %s", user_id, e)
+    finally:
+        db.close()
+
+
+def derive_incremental_features(inputs: IncrementalFeatureInputs) -> dict:
+    start_6m_date, start_6m, _, _ = inputs.windows
+
+    stats = FeatureStats()
+    inputs.state.apply(stats, inputs.windows)
+    summarize_remittances(inputs.remit_rows, stats, start_6m)
+    summarize_loans(inputs.loan_rows, stats)
+    return derive_features(stats, start_6m_date)
@@ -0,0 +1,170 @@
+# 비동기 점수 계산 워커
+# ScoreJobQueue 에서 작업을 가져와 동기 점수 계산(calculate_credit_score)을 실행하는 스레드 풀입니다.
+# HTTP 요청은 작업 등록 후 바로 202 를 반환하므로 요청 처리 스레드가 DB 지연에 묶이지 않습니다.
+# 같은 프로세스에서 등록된 작업은 바로 깨워서 처리하고, 다른 프로세스가 등록한 작업은 poll_interval 마다 확인합니다.
+
+import logging
+import threading
+import time
+
+from app.common.metrics import Counter, Gauge, Histogram
+from app.config.config import settings
+from app.db.core_banking import ReadSessionLocal as CoreReadSessionLocal
+from app.db.core_banking import WriteSessionLocal as CoreWriteSessionLocal
+from app.db.mydata import ReadSessionLocal as MydataReadSessionLocal
+from app.repository.score_job_queue import ScoreJob, ScoreJobQueue
+from app.schema.score import ScoreRequest
+import app.service.scoring_service as scoring_service
+
+logger = logging.getLogger(__name__)
+
+SCORE_JOB_EVENTS = Counter(
+    "credit_score_jobs_total", "Score job events", ["event"],
+)
+SCORE_JOB_PENDING = Gauge(
+    "credit_score_jobs_pending", "Score jobs waiting in the local queue",
+)
+SCORE_JOB_WAIT_SECONDS = Histogram(
+    "credit_score_job_wait_seconds", "Time from job submission to a worker picking it up",
+)
+SCORE_JOB_RUN_SECONDS = Histogram(
+    "credit_score_job_run_seconds", "Time to compute and save one queued score",
+)
+
+# 끝난 작업 정리 주기(초)
+_PURGE_INTERVAL_SEC = 60.0
+
+
+class ScoreJobWorkers:
+
+    def __init__(self, queue: ScoreJobQueue, workers: int, poll_interval: float, retention_sec: float):
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retention_sec = retention_sec
+
+        self._wakeup = threading.Condition()
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._last_purge = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def start(self):
+        if self._threads:
+            return
+        self._stopped.clear()
+        SCORE_JOB_PENDING.set_function(self._pending_count)
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"score-job-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def close(self):
+        # 실행 중인 작업은 마치고 종료 (pending 작업은 파일에 남아 다음 기동 때 처리)
+        self._stopped.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    # ---------------- 등록 ----------------
+    def submit(self, user_id: int) -> ScoreJob:
+        job, created = self.queue.enqueue(user_id)
+        SCORE_JOB_EVENTS.labels("submitted" if created else "deduplicated").inc()
+        if created:
+            with self._wakeup:
+                self._wakeup.notify()
+        return job
+
+    # ---------------- 처리 ----------------
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                job = self.queue.claim()
+            except Exception as e:
+                logger.error("Failed to claim score job: %s", e)
+                job = None
+
+            if job is None:
+                self._purge_if_due()
+                with self._wakeup:
+                    if not self._stopped.is_set():
+                        self._wakeup.wait(self.poll_interval)
+                continue
+
+            self._process(job)
+
+    def _process(self, job: ScoreJob):
+        SCORE_JOB_WAIT_SECONDS.observe(max(0.0, time.time() - job.created_at))
+        core_read_db = CoreReadSessionLocal()
+        core_write_db = CoreWriteSessionLocal()
+        mydata_db = MydataReadSessionLocal()
+        try:
+            with SCORE_JOB_RUN_SECONDS.time():
+                result = scoring_service.calculate_credit_score(
+                    ScoreRequest(user_id=job.user_id), core_read_db, core_write_db, mydata_db,
+                )
+        except Exception as e:
+            core_write_db.rollback()
+            logger.error("Score job %s for user %s failed: %s", job.id, job.user_id, e)
+            SCORE_JOB_EVENTS.labels("failed").inc()
+            self._finish(self.queue.fail, job, repr(e))
+            return
+        finally:
+            core_read_db.close()
+            core_write_db.close()
+            mydata_db.close()
+
+        SCORE_JOB_EVENTS.labels("done").inc()
+        self._finish(self.queue.complete, job, result["credit_score"])
+
+    def _finish(self, finish, job: ScoreJob, value):
+        # 결과 기록 실패 시 lease 만료 후 다른 워커가 다시 처리
+        try:
+            recorded = finish(job, value)
+        except Exception as e:
+            logger.error("Failed to record score job %s result: %s", job.id, e)
+            return
+        if not recorded:
+            # 처리 중 lease 가 만료되어 다른 워커가 가져간 작업: 그 워커의 결과를 유지
+            SCORE_JOB_EVENTS.labels("lease_lost").inc()
+            logger.warning(
+                "Score job %s lease expired during attempt %d, result discarded", job.id, job.attempts,
+            )
+
+    def _purge_if_due(self):
+        now = time.monotonic()
+        if now - self._last_purge < _PURGE_INTERVAL_SEC:
+            return
+        self._last_purge = now
+        try:
+            purged = self.queue.purge(self.retention_sec)
+        except Exception as e:
+            logger.warning("Failed to purge finished score jobs: %s", e)
+            return
+        if purged:
+            logger.info("Purged %d finished score jobs", purged)
+
+    def _pending_count(self) -> int:
+        try:
+            return self.queue.pending_count()
+        except Exception:
+            return -1
+
+
+score_job_queue = ScoreJobQueue(
+    settings.SCORE_JOB_QUEUE_PATH,
+    lease_sec=settings.SCORE_JOB_LEASE_SEC,
+    max_attempts=settings.SCORE_JOB_MAX_ATTEMPTS,
+)
+
+score_job_workers = ScoreJobWorkers(
+    score_job_queue,
+    workers=settings.SCORE_JOB_WORKERS,
+    poll_interval=settings.SCORE_JOB_POLL_INTERVAL_SEC,
+    retention_sec=settings.SCORE_JOB_RETENTION_SEC,
+)
@@ -1,9 +1,29 @@
-from app.service.score_calculator import calculate_final_score
+import numpy as np
+
+from app.model.features import MODEL_FEATURE_ORDER
+from app.service.score_calculator import calculate_final_scores
+
+REMIT_INCOME_RATIO_CAP = 0.5
+RATIO_SCORE_WEIGHT = 20.0
+DEFAULT_RATIO_SCORE_BONUS = 2.0
+
+# 시점별 시나리오: (응답 키, 주기 안정성, 잔액/유동성 배율, 최소 상승폭, 금액비례 가산점 비율)
+HORIZONS = (
+    ("after_6m", 0.90, 1.00, 5, 0.5),
+    ("after_12m", 0.95, 1.05, 4, 0.3),
+    ("after_18m", 0.99, 1.10, 6, 0.2),
+)
+
+
+def _remittance_income_ratio(income_avg, monthly_remit_amount: float):
+    """(시나리오 remittance_income_ratio, 금액비례 가산점)"""
+    if income_avg > 0:
+        ratio = min(REMIT_INCOME_RATIO_CAP, monthly_remit_amount / income_avg)
+        return ratio, ratio * RATIO_SCORE_WEIGHT
+    return 0.0, DEFAULT_RATIO_SCORE_BONUS # 기본 가산점
+
 
 def predict_credit_score_growth(current_features: dict, monthly_remit_amount: float):
-    # 현재 점수 계산
-    current_score = calculate_final_score(current_features)
-    
     # 미래 시뮬레이션 기본 세팅
     base_future_features = current_features.copy()
 
@@ -12,71 +32,93 @@ def predict_credit_score_growth(current_features: dict, monthly_remit_amount: fl
     base_future_features["remittance_failure_rate_6m"] = 0.0
 
     income_avg = base_future_features.get("income_avg_6m", 0)
-    ratio_score_factor = 0.0
+    base_future_features["remittance_income_ratio"], ratio_score_factor = _remittance_income_ratio(
+        income_avg, monthly_remit_amount
+    )
 
-    REMIT_INCOME_RATIO_CAP = 0.5
-    RATIO_SCORE_WEIGHT = 20.0
-    DEFAULT_RATIO_SCORE_BONUS = 2.0
+    # 6 / 12 / 18개월 후 시나리오: 주기 안정성 상승, 12개월부터 잔액/유동성 상승
+    scenarios = []
+    for _, stability, growth, _, _ in HORIZONS:
+        feat = base_future_features.copy()
+        feat["remittance_cycle_stability"] = stability
+        if growth != 1.00:
+            feat["min_balance_3m"] = feat["min_balance_3m"] * growth
+            feat["liquidity_months_3m"] = feat["liquidity_months_3m"] * growth
+        scenarios.append(feat)
 
-    if income_avg > 0:
-        ratio = monthly_remit_amount / income_avg
-        base_future_features["remittance_income_ratio"] = min(REMIT_INCOME_RATIO_CAP, ratio)
-        ratio_score_factor = min(REMIT_INCOME_RATIO_CAP, ratio) * RATIO_SCORE_WEIGHT
-    else:
-        base_future_features["remittance_income_ratio"] = 0.0
-        ratio_score_factor = DEFAULT_RATIO_SCORE_BONUS # 기본 가산점
-    
-    # 6개월 후 예측
-    feat_6m = base_future_features.copy()
-    feat_6m["remittance_cycle_stability"] = 0.90 # 주기 안정성 설정
-    ai_score_6m = calculate_final_score(feat_6m)
-    
-    # 최소 상승폭 보정, 금액비례 가산점 만큼 상승 보장
-    min_delta_6m = 5 + int(ratio_score_factor * 0.5)
-    score_6m = max(ai_score_6m, current_score + min_delta_6m)
-    
-    # 12개월 후 예측
-    feat_12m = base_future_features.copy()
-    feat_12m["remittance_cycle_stability"] = 0.95 # 안정성 상승
-    feat_12m["min_balance_3m"] = feat_12m["min_balance_3m"] * 1.05 
-    feat_12m["liquidity_months_3m"] = feat_12m["liquidity_months_3m"] * 1.05 # 유동성 상승
-    ai_score_12m = calculate_final_score(feat_12m)
-    
-    min_delta_12m = 4 + int(ratio_score_factor * 0.3)
-    score_12m = max(ai_score_12m, score_6m + min_delta_12m)
-    
-    # 18개월 후 예측
-    feat_18m = base_future_features.copy()
-    feat_18m["remittance_cycle_stability"] = 0.99 # 안정성 최고치
-    feat_18m["min_balance_3m"] = feat_18m["min_balance_3m"] * 1.10
-    feat_18m["liquidity_months_3m"] = feat_18m["liquidity_months_3m"] * 1.10 # 유동성 최고치
-    ai_score_18m = calculate_final_score(feat_18m)
-    
-    min_delta_18m = 6 + int(ratio_score_factor * 0.2)
-    score_18m = max(ai_score_18m, score_12m + min_delta_18m)
-
-    # 최종 캡핑
-    score_6m = min(920, score_6m)
-    score_12m = min(920, score_12m)
-    score_18m = min(920, score_18m)
-
-    score_12m = max(score_12m, score_6m)
-    score_18m = max(score_18m, score_12m)
+    # 현재 + 3개 시점을 한 번의 transform / predict 로 계산
+    current_score, *ai_scores = calculate_final_scores([current_features, *scenarios])
 
     return {
         "user_id": int(current_features.get("user_id", 0)),
         "monthly_remit_amount": monthly_remit_amount,
         "current_score": current_score,
-        "after_6m": {
-            "score": score_6m,
-            "delta": score_6m - current_score
-        },
-        "after_12m": {
-            "score": score_12m,
-            "delta": score_12m - current_score
-        },
-        "after_18m": {
-            "score": score_18m,
-            "delta": score_18m - current_score
-        }
-    }
\ No newline at end of file
+        **_growth_scores(current_score, ai_scores, ratio_score_factor),
+    }
+
+
+def _growth_scores(current_score: int, ai_scores, ratio_score_factor: float) -> dict:
+    # 시점별 최소 상승폭 보정 (금액비례 가산점 만큼 상승 보장) 후 최종 캡핑
+    scores = []
+    previous = current_score
+    for (_, _, _, min_delta, factor_weight), ai_score in zip(HORIZONS, ai_scores):
+        previous = max(ai_score, previous + min_delta + int(ratio_score_factor * factor_weight))
+        scores.append(previous)
+
+    capped = []
+    for score in scores:
+        capped.append(max(min(920, score), capped[-1]) if capped else min(920, score))
+
+    return {
+        key: {"score": score, "delta": score - current_score}
+        for (key, _, _, _, _), score in zip(HORIZONS, capped)
+    }
+
+
+# =========================================================
+# 여러 송금액 시나리오 (what-if grid)
+# =========================================================
+_COLUMN = {name: i for i, name in enumerate(MODEL_FEATURE_ORDER)}
+
+
+def predict_credit_score_grid(current_features: dict, monthly_remit_amounts: list[float]):
+    """
+    송금액 목록 전체에 대해 predict_credit_score_growth()와 같은 결과를 계산합니다.
+    현재 + (송금액 수 x 3개 시점) 행을 하나의 행렬로 만들어 transform / predict 를 1번만 호출합니다.
+    """
+    current = np.array([float(current_features.get(col, 0.0)) for col in MODEL_FEATURE_ORDER], dtype=float)
+
+    base = current.copy()
+    base[_COLUMN["remittance_count_6m"]] = 6.0
+    base[_COLUMN["remittance_failure_rate_6m"]] = 0.0
+
+    income_avg = current_features.get("income_avg_6m", 0)
+    ratios = [_remittance_income_ratio(income_avg, amount) for amount in monthly_remit_amounts]
+
+    # 행 순서: 송금액 i 의 시점 h -> i * 3 + h
+    scenarios = np.tile(base, (len(monthly_remit_amounts) * len(HORIZONS), 1))
+    scenarios[:, _COLUMN["remittance_income_ratio"]] = np.repeat(
+        np.array([ratio for ratio, _ in ratios], dtype=float), len(HORIZONS)
+    )
+    for h, (_, stability, growth, _, _) in enumerate(HORIZONS):
+        rows = scenarios[h::len(HORIZONS)]
+        rows[:, _COLUMN["remittance_cycle_stability"]] = stability
+        if growth != 1.00:
+            rows[:, _COLUMN["min_balance_3m"]] = base[_COLUMN["min_balance_3m"]] * growth
+            rows[:, _COLUMN["liquidity_months_3m"]] = base[_COLUMN["liquidity_months_3m"]] * growth
+
+    current_score, *ai_scores = calculate_final_scores(np.vstack([current, scenarios]))
+
+    results = []
+    for i, (amount, (_, ratio_score_factor)) in enumerate(zip(monthly_remit_amounts, ratios)):
+        row_scores = ai_scores[i * len(HORIZONS):(i + 1) * len(HORIZONS)]
+        results.append({
+            "monthly_remit_amount": amount,
+            **_growth_scores(current_score, row_scores, ratio_score_factor),
+        })
+
+    return {
+        "user_id": int(current_features.get("user_id", 0)),
+        "current_score": current_score,
+        "results": results,
+    }
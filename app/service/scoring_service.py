@@ -1,15 +1,68 @@
-from sqlalchemy import text
+import asyncio
+from datetime import date
+from typing import NamedTuple, Optional
+
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.schema.score import ScoreRequest, CreditScorePredictRequest
-from app.service.feature_extractor import extract_features
-from app.service.score_calculator import calculate_final_score
-from app.service.score_predict import predict_credit_score_growth 
+from app.common.exceptions import OverloadedException
+from app.common.metrics import FEATURE_INPUT_ROWS, SCORING_FALLBACKS, STAGE_SECONDS
+from app.common.profiling import run_profiled
+from app.common.single_flight import SingleFlight
+from app.config.config import settings
+from app.db.core_banking import ReadSessionLocal as CoreReadSessionLocal
+from app.db.core_banking import WriteSessionLocal as CoreWriteSessionLocal
+from app.model.registry import model_registry
+from app.schema.score import (
+    ScoreRequest, CreditScorePredictRequest, CreditScorePredictGridRequest, BulkScoreLookupItem,
+)
+from app.service.data_fetcher import (
+    fetch_feature_aggregates_async,
+    fetch_feature_snapshot_async,
+    fetch_incremental_inputs_async,
+    fetch_user_data_async,
+    fetch_user_data_watermark_async,
+    stream_feature_inputs_async,
+)
+from app.service.feature_cache import FeatureCache, UserFeatures, feature_cache
+from app.service.feature_snapshot import FeatureSnapshot, fresh_snapshot, snapshot_params
+from app.service.feature_extractor import (
+    extract_features,
+    extract_features_from_aggregates,
+    feature_windows,
+)
+from app.service.incremental_features import (
+    IncrementalFeatureInputs,
+    derive_incremental_features,
+    fetch_incremental_inputs,
+    persist_feature_state,
+)
+from app.service.streaming_feature_extractor import (
+    StreamedFeatureInputs,
+    derive_streamed_features,
+    stream_feature_inputs,
+)
+from app.service.score_calculator import calculate_final_score, calculate_final_scores
+from app.service.score_predict import predict_credit_score_grid, predict_credit_score_growth
 
+from app.repository.feature_data_repository import (
+    FeatureAggregates,
+    fetch_feature_aggregates,
+    fetch_feature_aggregates_batch,
+)
+from app.repository.user_data_repository import (
+    fetch_user_data,
+    fetch_user_data_batch,
+    fetch_user_data_watermark,
+)
+from app.repository.score_write_buffer import score_write_buffer
 from app.repository.credit_repository import (
-    save_latest_credit_score,
-    save_credit_score_history,
+    save_credit_score,
+    save_credit_scores_bulk,
+    get_feature_snapshot,
     get_latest_credit_score as repo_get_latest,
+    get_latest_credit_scores,
+    get_credit_score_histories,
     get_credit_score_history as repo_get_history
 )
 
@@ -24,47 +77,180 @@ def calculate_credit_score(
 ):
     user_id = request.user_id
 
-    # DB 조회
-    overseas_rows = core_read_db.execute(
-        text("SELECT send_amount, remittance_status, created_at FROM overseas_remittance WHERE user_id = :user_id"),
-        {"user_id": user_id},
-    ).fetchall()
-    card_rows = mydata_db.execute(text("SELECT tx_datetime, tx_amount, pay_type, tx_category, credit_limit, outstanding_amt, collected_at FROM mydata_card WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
-    loan_rows = mydata_db.execute(text("SELECT loan_principal, interest_rate, status, overdue_count_12m, overdue_amount, max_overdue_days, last_overdue_dt, collected_at FROM mydata_loan WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
-    transaction_rows = mydata_db.execute(text("SELECT tx_datetime, amount, direction, category, balance_after, collected_at FROM mydata_transaction WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
+    # DB 조회 + 피처 추출 (캐시)
+    user_features = _load_user_features(user_id, core_read_db, mydata_db)
+
+    credit_score = _score_user_features(user_features)
+    _save_credit_score(core_write_db, user_id, credit_score, _feature_snapshot(user_id, user_features, credit_score))
+
+    return {"credit_score": credit_score}
+
+
+async def calculate_credit_score_async(request: ScoreRequest, core_write_db: Session):
+    user_id = request.user_id
 
+    # DB 조회 (4개 테이블 동시) + 피처 추출 (캐시)
+    user_features = await _load_user_features_async(user_id)
+
+    credit_score = await run_in_threadpool(run_profiled, _score_user_features, user_features)
+    snapshot = _feature_snapshot(user_id, user_features, credit_score)
+    await run_in_threadpool(run_profiled, _save_credit_score, core_write_db, user_id, credit_score, snapshot)
+
+    return {"credit_score": credit_score}
+
+
+def _score_user_features(user_features: UserFeatures) -> int:
     try:
-        if not overseas_rows and not card_rows and not loan_rows and not transaction_rows:
+        if not user_features.has_data:
+            SCORING_FALLBACKS.labels("no_data").inc()
             credit_score = 550
         else:
-            features = extract_features(transaction_rows, card_rows, loan_rows, overseas_rows)
-            credit_score = calculate_final_score(features)
+            if user_features.error is not None:
+                raise user_features.error
+            credit_score = calculate_final_score(user_features.features)
             if credit_score < 550:
                 credit_score = 550
     except Exception as e:
         # 에러 로깅 (실제 프로덕션에서는 logger 사용)
         print(f"An error occurred during credit score calculation: {e}")
+        SCORING_FALLBACKS.labels("error").inc()
         credit_score = 550
 
-    save_latest_credit_score(core_write_db, user_id, credit_score)
-    save_credit_score_history(core_write_db, user_id, credit_score)
-    
-    return {"credit_score": credit_score}
+    return credit_score
+
+
+def _save_credit_score(core_write_db: Session, user_id: int, credit_score: int, snapshot: dict = None):
+    # write-behind 사용 시 버퍼에 넣고 바로 반환 (백그라운드에서 모아서 저장)
+    if settings.SCORE_WRITE_BEHIND_ENABLED:
+        score_write_buffer.add(user_id, credit_score, snapshot)
+        return
+    save_credit_score(core_write_db, user_id, credit_score, snapshot)
+
+
+def _feature_snapshot(user_id: int, user_features: UserFeatures, credit_score: int):
+    # 점수와 함께 저장할 피처 스냅샷 (보고서/예측에서 재사용)
+    if not settings.FEATURE_SNAPSHOT_ENABLED:
+        return None
+    return snapshot_params(user_id, user_features, credit_score, model_registry.get().version)
+
+
+# =========================================================
+# 신용 점수 일괄 계산 및 저장
+# =========================================================
+def calculate_credit_scores_batch(
+    user_ids: list[int],
+    core_read_db: Session,
+    core_write_db: Session,
+    mydata_db: Session,
+):
+    # 요청 순서는 유지하고 중복 user_id는 한 번만 계산
+    unique_ids = list(dict.fromkeys(user_ids))
+    chunk_size = settings.BATCH_SCORE_CHUNK_SIZE
+    scores = {}
+
+    for i in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[i:i + chunk_size]
+
+        # 테이블당 쿼리 1회로 chunk 전체 조회
+        inputs_by_user = _fetch_feature_inputs_batch(chunk, core_read_db, mydata_db)
 
+        scored_ids = []
+        features_list = []
+        for user_id in chunk:
+            inputs = inputs_by_user[user_id]
+            if not _has_data(inputs):
+                SCORING_FALLBACKS.labels("no_data").inc()
+                scores[user_id] = 550
+                continue
+            _record_feature_input_rows(inputs)
+            try:
+                with STAGE_SECONDS.labels("extract_features").time():
+                    features = _extract_features(inputs)
+            except Exception as e:
+                print(f"An error occurred during feature extraction for user {user_id}: {e}")
+                SCORING_FALLBACKS.labels("error").inc()
+                scores[user_id] = 550
+                continue
+            scored_ids.append(user_id)
+            features_list.append(features)
+
+        # chunk 전체를 한 번의 transform / predict 로 점수화
+        snapshots = []
+        if features_list:
+            try:
+                predicted = calculate_final_scores(features_list)
+            except Exception as e:
+                print(f"An error occurred during batch credit score calculation: {e}")
+                SCORING_FALLBACKS.labels("error").inc(len(features_list))
+                predicted = None
+            if predicted is None:
+                scores.update((user_id, 550) for user_id in scored_ids)
+            else:
+                scores.update(zip(scored_ids, predicted))
+                snapshots = [
+                    _feature_snapshot(user_id, UserFeatures(True, features), scores[user_id])
+                    for user_id, features in zip(scored_ids, features_list)
+                ]
+
+        save_credit_scores_bulk(
+            core_write_db,
+            [(user_id, scores[user_id]) for user_id in chunk],
+            [snapshot for snapshot in snapshots if snapshot is not None],
+        )
+
+    return [{"user_id": user_id, "credit_score": scores[user_id]} for user_id in unique_ids]
 
 
 # =========================================================
 # 신용 점수 및 피처 데이터 조회 (신용 보고서용)
 # =========================================================
 def get_credit_report_data(user_id: int, core_db: Session, mydata_db: Session):
-    overseas_rows, card_rows, loan_rows, transaction_rows = _fetch_user_data(user_id, core_db, mydata_db)
+    user_features, snapshot_score = _load_snapshot_or_features(user_id, core_db, mydata_db)
+    return _build_credit_report(user_features, snapshot_score)
+
+
+class ReportVersion(NamedTuple):
+    """보고서 내용을 결정하는 값 (ETag 재료)과, 보고서를 만들 신선한 스냅샷(있으면)."""
+
+    parts: tuple
+    snapshot: Optional[FeatureSnapshot]
+
 
+async def get_credit_report_data_async(user_id: int, version: ReportVersion = None):
+    # version: get_credit_report_version_async() 결과 (이미 확인한 스냅샷을 다시 조회하지 않음)
+    if version is not None and version.snapshot is not None:
+        user_features, snapshot_score = version.snapshot.user_features(), version.snapshot.credit_score
+    elif version is not None:
+        user_features, snapshot_score = await _load_user_features_async(user_id), None
+    else:
+        user_features, snapshot_score = await _load_snapshot_or_features_async(user_id)
+    return await run_in_threadpool(run_profiled, _build_credit_report, user_features, snapshot_score)
+
+
+async def get_credit_report_version_async(user_id: int) -> ReportVersion:
+    # 보고서 = f(데이터, 기준 날짜, 모델) 이므로 데이터 워터마크 + 날짜 + 모델 버전,
+    # 신선한 스냅샷으로 응답하는 경우에는 스냅샷 계산 시각 + 모델 버전
+    model_version = model_registry.get().version
+    if settings.FEATURE_SNAPSHOT_ENABLED:
+        snapshot = fresh_snapshot(
+            await fetch_feature_snapshot_async(user_id), model_version, settings.FEATURE_SNAPSHOT_MAX_AGE_SEC
+        )
+        if snapshot is not None:
+            return ReportVersion(("snapshot", snapshot.computed_at.isoformat(), model_version), snapshot)
+    watermark = await fetch_user_data_watermark_async(user_id)
+    return ReportVersion(("data", date.today().isoformat(), model_version, *watermark), None)
+
+
+def _build_credit_report(user_features: UserFeatures, snapshot_score: int = None):
     try:
-        if not overseas_rows and not card_rows and not loan_rows and not transaction_rows:
+        if not user_features.has_data:
             return {"credit_score": 550, "features": {}}
 
-        features = extract_features(transaction_rows, card_rows, loan_rows, overseas_rows)
-        credit_score = calculate_final_score(features)
+        if user_features.error is not None:
+            raise user_features.error
+        features = user_features.features
+        # 스냅샷에서 읽은 경우 같은 모델 버전으로 계산해 둔 점수 사용
+        credit_score = snapshot_score if snapshot_score is not None else calculate_final_score(features)
         if credit_score < 550:
             credit_score = 550
     except Exception as e:
@@ -84,31 +270,65 @@ def get_credit_report_data(user_id: int, core_db: Session, mydata_db: Session):
 
 
 # =========================================================
-# 미래 점수 예측 
+# 미래 점수 예측
 # =========================================================
 def process_prediction(
     request: CreditScorePredictRequest,
     core_read_db: Session,
     mydata_db: Session,
 ):
-    user_id = request.user_id
-    
-    # 현재 유저 데이터 조회
-    overseas_rows = core_read_db.execute(text("SELECT send_amount, remittance_status, created_at FROM overseas_remittance WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
-    card_rows = mydata_db.execute(text("SELECT tx_datetime, tx_amount, pay_type, tx_category, credit_limit, outstanding_amt, collected_at FROM mydata_card WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
-    loan_rows = mydata_db.execute(text("SELECT loan_principal, interest_rate, status, overdue_count_12m, overdue_amount, max_overdue_days, last_overdue_dt, collected_at FROM mydata_loan WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
-    transaction_rows = mydata_db.execute(text("SELECT tx_datetime, amount, direction, category, balance_after, collected_at FROM mydata_transaction WHERE user_id = :user_id"), {"user_id": user_id}).fetchall()
+    # 현재 유저 피처 (신선한 스냅샷 또는 데이터 조회 + 피처 추출)
+    user_features, _ = _load_snapshot_or_features(request.user_id, core_read_db, mydata_db)
+    return _predict_from_features(request, user_features)
+
+
+async def process_prediction_async(request: CreditScorePredictRequest):
+    # 현재 유저 피처 (신선한 스냅샷 또는 4개 테이블 동시 조회 + 피처 추출)
+    user_features, _ = await _load_snapshot_or_features_async(request.user_id)
+    return await run_in_threadpool(run_profiled, _predict_from_features, request, user_features)
 
-    # Feature 추출
-    features = extract_features(transaction_rows, card_rows, loan_rows, overseas_rows)
-    features["user_id"] = user_id 
+
+def _predict_from_features(request: CreditScorePredictRequest, user_features: UserFeatures):
+    if user_features.error is not None:
+        raise user_features.error
+
+    # 캐시된 dict를 건드리지 않도록 복사
+    features = dict(user_features.features)
+    features["user_id"] = request.user_id
 
     # 계산 로직 호출
     result = predict_credit_score_growth(features, request.monthly_amount)
-    
+
     return result
 
 
+# =========================================================
+# 미래 점수 예측 (여러 송금액 what-if grid)
+# =========================================================
+def process_prediction_grid(
+    request: CreditScorePredictGridRequest,
+    core_read_db: Session,
+    mydata_db: Session,
+):
+    user_features, _ = _load_snapshot_or_features(request.user_id, core_read_db, mydata_db)
+    return _predict_grid_from_features(request, user_features)
+
+
+async def process_prediction_grid_async(request: CreditScorePredictGridRequest):
+    # 조회 + 피처 추출은 송금액 수와 관계없이 1번 (동시 /prediction 요청과도 공유)
+    user_features, _ = await _load_snapshot_or_features_async(request.user_id)
+    return await run_in_threadpool(run_profiled, _predict_grid_from_features, request, user_features)
+
+
+def _predict_grid_from_features(request: CreditScorePredictGridRequest, user_features: UserFeatures):
+    if user_features.error is not None:
+        raise user_features.error
+
+    features = dict(user_features.features)
+    features["user_id"] = request.user_id
+    return predict_credit_score_grid(features, request.monthly_amounts())
+
+
 # =========================================================
 # 단순 조회 서비스
 # =========================================================
@@ -119,35 +339,228 @@ def get_credit_score_history(user_id: int, core_db: Session):
     return repo_get_history(user_id, core_db)
 
 
-def _fetch_user_data(user_id: int, core_db: Session, mydata_db: Session):
-    overseas_rows = core_db.execute(
-        text(
-            "SELECT send_amount, remittance_status, created_at "
-            "FROM overseas_remittance WHERE user_id = :user_id"
-        ),
-        {"user_id": user_id},
-    ).fetchall()
-    card_rows = mydata_db.execute(
-        text(
-            "SELECT tx_datetime, tx_amount, pay_type, tx_category, credit_limit, "
-            "outstanding_amt, collected_at FROM mydata_card WHERE user_id = :user_id"
-        ),
-        {"user_id": user_id},
-    ).fetchall()
-    loan_rows = mydata_db.execute(
-        text(
-            "SELECT loan_principal, interest_rate, status, overdue_count_12m, "
-            "overdue_amount, max_overdue_days, last_overdue_dt, collected_at "
-            "FROM mydata_loan WHERE user_id = :user_id"
-        ),
-        {"user_id": user_id},
-    ).fetchall()
-    transaction_rows = mydata_db.execute(
-        text(
-            "SELECT tx_datetime, amount, direction, category, balance_after, "
-            "collected_at FROM mydata_transaction WHERE user_id = :user_id"
-        ),
-        {"user_id": user_id},
-    ).fetchall()
-
-    return overseas_rows, card_rows, loan_rows, transaction_rows
+# =========================================================
+# 최신 점수 / 히스토리 일괄 조회 (NDJSON 스트리밍)
+# =========================================================
+def iter_credit_score_lookups(user_ids: list[int], include_history: bool, chunk_size: int = None):
+    """
+    요청 순서대로(중복 제거) 유저별 결과를 NDJSON 한 줄씩 반환합니다.
+    chunk 마다 테이블당 쿼리 1회, 세션은 chunk 조회 동안만 사용 (느린 클라이언트가 커넥션을 잡고 있지 않음)
+    """
+    unique_ids = list(dict.fromkeys(user_ids))
+    chunk_size = chunk_size or settings.BULK_LOOKUP_CHUNK_SIZE
+
+    for i in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[i:i + chunk_size]
+
+        core_db = CoreReadSessionLocal()
+        try:
+            scores = get_latest_credit_scores(chunk, core_db)
+            histories = get_credit_score_histories(chunk, core_db) if include_history else None
+        finally:
+            core_db.close()
+
+        lines = []
+        for user_id in chunk:
+            item = BulkScoreLookupItem(
+                user_id=user_id,
+                credit_score=scores.get(user_id, 0),
+                history=histories[user_id] if histories is not None else None,
+            )
+            lines.append(item.model_dump_json(exclude_none=True))
+        yield "\n".join(lines) + "\n"
+
+
+# =========================================================
+# 유저 피처 로드 (워터마크 기반 캐시)
+# =========================================================
+def _load_user_features(user_id: int, core_db: Session, mydata_db: Session) -> UserFeatures:
+    cache_key = None
+    if feature_cache.enabled:
+        watermark = fetch_user_data_watermark(user_id, core_db, mydata_db)
+        cache_key = FeatureCache.make_key(user_id, date.today(), watermark)
+        cached = feature_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    inputs = _fetch_feature_inputs(user_id, core_db, mydata_db)
+    user_features = _extract_user_features(inputs)
+
+    if cache_key is not None:
+        feature_cache.set(cache_key, user_features)
+    return user_features
+
+
+# 같은 유저의 점수/보고서/예측 요청이 동시에 오면 조회 + 피처 추출을 1번만 실행하고 결과를 공유
+_feature_flight = SingleFlight("user_features", settings.SINGLE_FLIGHT_TIMEOUT_SEC)
+
+
+async def _load_user_features_async(user_id: int) -> UserFeatures:
+    if not settings.SINGLE_FLIGHT_ENABLED:
+        return await _compute_user_features_async(user_id)
+    try:
+        # 날짜가 바뀌면 피처 기간도 바뀌므로 키에 포함
+        return await _feature_flight.do(
+            (user_id, date.today()), lambda: _compute_user_features_async(user_id)
+        )
+    except asyncio.TimeoutError:
+        raise OverloadedException(
+            f"Feature computation for user {user_id} timed out", settings.ADMISSION_RETRY_AFTER_SEC
+        )
+
+
+async def _compute_user_features_async(user_id: int) -> UserFeatures:
+    cache_key = None
+    if feature_cache.enabled:
+        watermark = await fetch_user_data_watermark_async(user_id)
+        cache_key = FeatureCache.make_key(user_id, date.today(), watermark)
+        cached = feature_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    inputs = await _fetch_feature_inputs_async(user_id)
+    user_features = await run_in_threadpool(run_profiled, _extract_user_features, inputs)
+
+    if cache_key is not None:
+        feature_cache.set(cache_key, user_features)
+    return user_features
+
+
+# =========================================================
+# 피처 스냅샷 (보고서 / 예측)
+# =========================================================
+# 신선한 스냅샷이 있으면 (UserFeatures, 스냅샷 점수), 없으면 기존 조회 + 추출 결과와 None
+# 점수 계산 경로는 스냅샷을 새로 만드는 쪽이므로 항상 _load_user_features 사용
+def _load_snapshot_or_features(user_id: int, core_db: Session, mydata_db: Session):
+    if settings.FEATURE_SNAPSHOT_ENABLED:
+        snapshot = fresh_snapshot(
+            get_feature_snapshot(user_id, core_db),
+            model_registry.get().version,
+            settings.FEATURE_SNAPSHOT_MAX_AGE_SEC,
+        )
+        if snapshot is not None:
+            return snapshot.user_features(), snapshot.credit_score
+    return _load_user_features(user_id, core_db, mydata_db), None
+
+
+async def _load_snapshot_or_features_async(user_id: int):
+    if settings.FEATURE_SNAPSHOT_ENABLED:
+        snapshot = fresh_snapshot(
+            await fetch_feature_snapshot_async(user_id),
+            model_registry.get().version,
+            settings.FEATURE_SNAPSHOT_MAX_AGE_SEC,
+        )
+        if snapshot is not None:
+            return snapshot.user_features(), snapshot.credit_score
+    return await _load_user_features_async(user_id), None
+
+
+def _extract_user_features(inputs) -> UserFeatures:
+    # 추출 오류는 호출한 쪽에서 기존 방식대로 처리 (점수/보고서: 550, 예측: 예외)
+    has_data = _has_data(inputs)
+    _record_feature_input_rows(inputs)
+    try:
+        with STAGE_SECONDS.labels("extract_features").time():
+            return UserFeatures(has_data, _extract_features(inputs))
+    except Exception as e:
+        return UserFeatures(has_data, None, e)
+
+
+# =========================================================
+# 피처 입력 조회 / 추출
+# =========================================================
+# FEATURE_INCREMENTAL_STATE 이면 저장된 상태 + 새로 수집된 행만 반영한 IncrementalFeatureInputs,
+# FEATURE_SQL_PUSHDOWN 이면 기간 조건·집계를 SQL에서 처리한 FeatureAggregates,
+# FEATURE_STREAMING 이면 서버 사이드 커서로 누적한 StreamedFeatureInputs,
+# 아니면 4개 테이블 전체 행 튜플 (overseas_rows, card_rows, loan_rows, transaction_rows)
+def _fetch_feature_inputs(user_id: int, core_db: Session, mydata_db: Session):
+    if settings.FEATURE_INCREMENTAL_STATE:
+        inputs, settled = fetch_incremental_inputs(
+            user_id, core_db, mydata_db, feature_windows(), settings.FEATURE_STATE_SETTLE_SEC
+        )
+        if settled is not None:
+            persist_feature_state(CoreWriteSessionLocal, user_id, settled)
+        return inputs
+    if settings.FEATURE_SQL_PUSHDOWN:
+        return fetch_feature_aggregates(user_id, core_db, mydata_db, feature_windows())
+    if settings.FEATURE_STREAMING:
+        return stream_feature_inputs(
+            user_id, core_db, mydata_db, feature_windows(), settings.FEATURE_STREAM_CHUNK_SIZE
+        )
+    return fetch_user_data(user_id, core_db, mydata_db)
+
+
+# 일괄 계산용 {user_id: 피처 입력} - FEATURE_SQL_PUSHDOWN 이면 GROUP BY user_id 집계, 아니면 전체 행
+def _fetch_feature_inputs_batch(user_ids: list[int], core_db: Session, mydata_db: Session) -> dict:
+    if settings.FEATURE_SQL_PUSHDOWN:
+        return fetch_feature_aggregates_batch(user_ids, core_db, mydata_db, feature_windows())
+    return fetch_user_data_batch(user_ids, core_db, mydata_db)
+
+
+async def _fetch_feature_inputs_async(user_id: int):
+    if settings.FEATURE_INCREMENTAL_STATE:
+        return await fetch_incremental_inputs_async(
+            user_id, feature_windows(), settings.FEATURE_STATE_SETTLE_SEC
+        )
+    if settings.FEATURE_SQL_PUSHDOWN:
+        return await fetch_feature_aggregates_async(user_id, feature_windows())
+    if settings.FEATURE_STREAMING:
+        return await stream_feature_inputs_async(
+            user_id, feature_windows(), settings.FEATURE_STREAM_CHUNK_SIZE
+        )
+    return await fetch_user_data_async(user_id)
+
+
+def _has_data(inputs) -> bool:
+    if isinstance(inputs, (FeatureAggregates, StreamedFeatureInputs, IncrementalFeatureInputs)):
+        return inputs.has_data
+    overseas_rows, card_rows, loan_rows, transaction_rows = inputs
+    return bool(overseas_rows or card_rows or loan_rows or transaction_rows)
+
+
+def _record_feature_input_rows(inputs):
+    # 피처 추출 1건의 테이블별 입력 행 수 (SQL 집계 경로는 집계된 행 수, 증분 경로는 새로 조회한 행 수)
+    if isinstance(inputs, IncrementalFeatureInputs):
+        counts = (
+            ("overseas_remittance", len(inputs.remit_rows)),
+            ("mydata_card", inputs.new_card_rows),
+            ("mydata_loan", len(inputs.loan_rows)),
+            ("mydata_transaction", inputs.new_transaction_rows),
+        )
+    elif isinstance(inputs, StreamedFeatureInputs):
+        counts = (
+            ("overseas_remittance", inputs.remittance.rows),
+            ("mydata_card", inputs.card.rows),
+            ("mydata_loan", inputs.loan.rows),
+            ("mydata_transaction", inputs.transaction.rows),
+        )
+    elif isinstance(inputs, FeatureAggregates):
+        counts = (
+            ("overseas_remittance", len(inputs.remit_rows)),
+            ("mydata_card", inputs.card.row_count or 0),
+            ("mydata_loan", len(inputs.loan_rows)),
+            ("mydata_transaction", inputs.transaction.row_count or 0),
+        )
+    else:
+        overseas_rows, card_rows, loan_rows, transaction_rows = inputs
+        counts = (
+            ("overseas_remittance", len(overseas_rows)),
+            ("mydata_card", len(card_rows)),
+            ("mydata_loan", len(loan_rows)),
+            ("mydata_transaction", len(transaction_rows)),
+        )
+    for table, rows in counts:
+        FEATURE_INPUT_ROWS.labels(table).observe(rows)
+
+
+def _extract_features(inputs) -> dict:
+    if isinstance(inputs, IncrementalFeatureInputs):
+        return derive_incremental_features(inputs)
+    if isinstance(inputs, StreamedFeatureInputs):
+        return derive_streamed_features(inputs)
+    if isinstance(inputs, FeatureAggregates):
+        return extract_features_from_aggregates(
+            inputs.transaction, inputs.card, inputs.loan_rows, inputs.remit_rows, inputs.windows
+        )
+    overseas_rows, card_rows, loan_rows, transaction_rows = inputs
+    return extract_features(transaction_rows, card_rows, loan_rows, overseas_rows)
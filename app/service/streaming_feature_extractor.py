@@ -0,0 +1,280 @@
+# 스트리밍 피처 추출기
+# 행을 리스트로 모으지 않고 한 행씩 온라인 누적기(합계, Welford 분산, 최솟값, 건수,
+# 날짜 순 간격)에 반영해 한 번의 순회로 FeatureStats 를 만듭니다.
+# 서버 사이드 커서로 chunk 단위 조회한 행을 바로 흘려 넣으면 이력 길이와 무관하게
+# 메모리 사용량이 일정합니다.
+#
+# 합계/건수/최솟값은 extract_features()와 같은 순서로 누적하므로 동일하고,
+# 표준편차는 Welford 방식이라 부동소수점 끝자리가 2-pass 계산과 다를 수 있습니다.
+# 송금 주기 간격은 created_at 오름차순 입력이 필요합니다 (조회 시 ORDER BY created_at, 순서가 어긋나면 ValueError).
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.repository.user_data_repository import (
+    CARD_COLUMNS,
+    LOAN_COLUMNS,
+    REMITTANCE_COLUMNS,
+    TRANSACTION_COLUMNS,
+    stream_user_rows,
+)
+from app.service.feature_extractor import (
+    SPEND_CATEGORIES,
+    FeatureStats,
+    derive_features,
+    feature_windows,
+    safe_float,
+    summarize_loans,
+    to_date,
+)
+
+
+# -----------------------------
+#   Online accumulators
+# -----------------------------
+class RunningStats:
+    """건수 / 합계 / Welford 평균·분산."""
+
+    __slots__ = ("count", "total", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float):
+        self.count += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        # 모표준편차 (기존 계산과 동일하게 n 으로 나눔)
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+class TransactionAccumulator:
+    """입출금: 6개월 급여/지출, 3개월 최소 잔액/지출."""
+
+    def __init__(self, windows):
+        _, self.start_6m, _, self.start_3m = windows
+        self.rows = 0
+        self.salary = RunningStats()
+        self.spend_total = 0.0
+        self.spend_count = 0
+        self.min_balance_3m = None
+        self.spend_3m_total = 0.0
+
+    def add(self, row):
+        self.rows += 1
+        tx_dt = row.tx_datetime
+        if tx_dt is None:
+            return
+
+        is_spend = row.direction == "OUT" and row.category in SPEND_CATEGORIES
+        if tx_dt >= self.start_6m:
+            if row.direction == "IN" and row.category == "SALARY":
+                self.salary.add(safe_float(row.amount))
+            if is_spend:
+                self.spend_total += safe_float(row.amount)
+                self.spend_count += 1
+
+        if tx_dt >= self.start_3m:
+            if row.balance_after is not None:
+                balance = safe_float(row.balance_after)
+                if self.min_balance_3m is None or balance < self.min_balance_3m:
+                    self.min_balance_3m = balance
+            if is_spend:
+                self.spend_3m_total += safe_float(row.amount)
+
+    def apply(self, stats: FeatureStats):
+        stats.salary_total = self.salary.total
+        stats.salary_count = self.salary.count
+        if self.salary.count >= 2:
+            stats.income_volatility = self.salary.std
+        stats.spend_total = self.spend_total
+        stats.spend_count = self.spend_count
+        stats.min_balance_3m = self.min_balance_3m if self.min_balance_3m is not None else 0.0
+        stats.spend_3m_total = self.spend_3m_total
+
+
+class CardAccumulator:
+    """카드: 전체 최대 한도 소진율, 3개월 사용액/현금서비스."""
+
+    def __init__(self, windows):
+        _, _, _, self.start_3m = windows
+        self.rows = 0
+        self.max_utilization_ratio = 0.0
+        self.card_total = 0.0
+        self.ca_total = 0.0
+
+    def add(self, row):
+        self.rows += 1
+        credit_limit = safe_float(row.credit_limit)
+        if credit_limit > 0:
+            self.max_utilization_ratio = max(self.max_utilization_ratio, safe_float(row.outstanding_amt) / credit_limit)
+
+        tx_dt = row.tx_datetime
+        if tx_dt and tx_dt >= self.start_3m:
+            amt = safe_float(row.tx_amount)
+            self.card_total += amt
+            if row.tx_category == "CASH_ADVANCE":
+                self.ca_total += amt
+
+    def apply(self, stats: FeatureStats):
+        stats.max_utilization_ratio = self.max_utilization_ratio
+        stats.card_total = self.card_total
+        stats.ca_total = self.ca_total
+
+
+class RemittanceAccumulator:
+    """해외 송금 (6개월): 건수/실패/금액 통계, 날짜 순 간격 통계."""
+
+    def __init__(self, windows):
+        _, self.start_6m, _, _ = windows
+        self.rows = 0
+        self.fail = 0
+        self.amounts = RunningStats()
+        self.intervals = RunningStats()
+        self._last_date = None
+
+    def add(self, row):
+        self.rows += 1
+        r_date = to_date(row.created_at)
+        if r_date is None:
+            return
+        if datetime.combine(r_date, datetime.min.time()) < self.start_6m:
+            return
+
+        self.amounts.add(safe_float(row.send_amount))
+        if str(row.remittance_status).upper() == "FAILED":
+            self.fail += 1
+
+        if self._last_date is not None:
+            if r_date < self._last_date:
+                # 정렬되지 않은 입력이면 간격이 틀리므로 잘못된 피처 대신 오류
+                raise ValueError(
+                    f"Remittance rows must be ordered by created_at ({r_date} after {self._last_date})"
+                )
+            self.intervals.add((r_date - self._last_date).days)
+        self._last_date = r_date
+
+    def apply(self, stats: FeatureStats):
+        stats.remit_count = self.amounts.count
+        stats.remit_fail = self.fail
+        stats.remit_total = self.amounts.total
+        if self.amounts.count:
+            stats.remit_amount_avg = self.amounts.total / self.amounts.count
+            stats.remit_amount_std = self.amounts.std
+
+        # 송금 3건 이상 (간격 2개 이상)일 때 주기 안정성
+        if self.amounts.count >= 3:
+            avg_int = self.intervals.total / self.intervals.count
+            if avg_int > 0:
+                stats.interval_stability = max(0.0, 1 - (self.intervals.std / avg_int))
+
+
+class LoanAccumulator:
+    """대출: 행 수가 적어 기존 summarize_loans 를 행 단위로 적용."""
+
+    def __init__(self):
+        self.rows = 0
+        self.stats = FeatureStats()
+
+    def add(self, row):
+        self.rows += 1
+        summarize_loans((row,), self.stats)
+
+    def apply(self, stats: FeatureStats):
+        stats.loan_principal_total = self.stats.loan_principal_total
+        stats.overdue_cnt_total = self.stats.overdue_cnt_total
+        stats.overdue_amt_total = self.stats.overdue_amt_total
+        stats.max_overdue_days = self.stats.max_overdue_days
+        stats.last_overdue_date = self.stats.last_overdue_date
+
+
+def consume(accumulator, rows):
+    for row in rows:
+        accumulator.add(row)
+    return accumulator
+
+
+# -----------------------------
+#   Streamed inputs -> Features
+# -----------------------------
+@dataclass
+class StreamedFeatureInputs:
+    """테이블별 누적기 묶음 (scoring_service 의 피처 입력 타입 중 하나)."""
+
+    windows: tuple
+    transaction: TransactionAccumulator
+    card: CardAccumulator
+    loan: LoanAccumulator
+    remittance: RemittanceAccumulator
+
+    @property
+    def has_data(self) -> bool:
+        return bool(self.transaction.rows or self.card.rows or self.loan.rows or self.remittance.rows)
+
+
+def derive_streamed_features(inputs: StreamedFeatureInputs) -> dict:
+    stats = FeatureStats()
+    inputs.transaction.apply(stats)
+    inputs.remittance.apply(stats)
+    inputs.loan.apply(stats)
+    inputs.card.apply(stats)
+    return derive_features(stats, inputs.windows[0])
+
+
+def extract_features_streaming(transaction_rows, card_rows, loan_rows, remit_rows, windows=None):
+    """
+    extract_features()의 한 번 순회 버전. 각 인자는 리스트가 아니어도 되는 행 iterable.
+    remit_rows 는 created_at 오름차순이어야 합니다 (아니면 ValueError).
+    """
+    windows = windows or feature_windows()
+    return derive_streamed_features(StreamedFeatureInputs(
+        windows,
+        consume(TransactionAccumulator(windows), transaction_rows),
+        consume(CardAccumulator(windows), card_rows),
+        consume(LoanAccumulator(), loan_rows),
+        consume(RemittanceAccumulator(windows), remit_rows),
+    ))
+
+
+# -----------------------------
+#   DB 스트리밍 (테이블 1개 = 세션 1개에서 순차 소비)
+# -----------------------------
+def stream_transaction_stats(mydata_db, user_id: int, windows, chunk_size: int) -> TransactionAccumulator:
+    rows = stream_user_rows(mydata_db, "mydata_transaction", TRANSACTION_COLUMNS, user_id, chunk_size)
+    return consume(TransactionAccumulator(windows), rows)
+
+
+def stream_card_stats(mydata_db, user_id: int, windows, chunk_size: int) -> CardAccumulator:
+    rows = stream_user_rows(mydata_db, "mydata_card", CARD_COLUMNS, user_id, chunk_size)
+    return consume(CardAccumulator(windows), rows)
+
+
+def stream_loan_stats(mydata_db, user_id: int, windows, chunk_size: int) -> LoanAccumulator:
+    rows = stream_user_rows(mydata_db, "mydata_loan", LOAN_COLUMNS, user_id, chunk_size)
+    return consume(LoanAccumulator(), rows)
+
+
+def stream_remittance_stats(core_db, user_id: int, windows, chunk_size: int) -> RemittanceAccumulator:
+    rows = stream_user_rows(
+        core_db, "overseas_remittance", REMITTANCE_COLUMNS, user_id, chunk_size, order_by="created_at",
+    )
+    return consume(RemittanceAccumulator(windows), rows)
+
+
+def stream_feature_inputs(user_id: int, core_db, mydata_db, windows, chunk_size: int) -> StreamedFeatureInputs:
+    return StreamedFeatureInputs(
+        windows,
+        stream_transaction_stats(mydata_db, user_id, windows, chunk_size),
+        stream_card_stats(mydata_db, user_id, windows, chunk_size),
+        stream_loan_stats(mydata_db, user_id, windows, chunk_size),
+        stream_remittance_stats(core_db, user_id, windows, chunk_size),
+    )
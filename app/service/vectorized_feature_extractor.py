@@ -0,0 +1,247 @@
+"""
+NumPy 기반 여러 유저 피처 추출기 (opt-in, 서비스 기본 경로는 extract_features / SQL 집계).
+
+여러 유저의 행을 테이블별로 이어 붙여 열(column) 배열 하나로 만들고, 유저 번호 배열로
+np.bincount / ufunc.at 을 사용해 모든 유저의 합계/건수/최솟값/최댓값을 한 번에 계산합니다.
+(유저 수만큼 반복하는 것은 건수가 적은 대출/송금 날짜 변환과 derive_features() 뿐)
+np.bincount 는 입력 순서대로 더하므로 extract_features()의 Python sum() 과 결과가 비트 단위로 같습니다.
+(Python 3.11 기준, Dockerfile 과 동일. 3.12 부터 sum()은 보정 합산이라 끝자리가 다를 수 있음)
+
+행이 Python 객체로 들어오므로 열 변환 비용이 커서, 유저 1명씩 Python 루프로 계산하는 것보다 빠르지는 않습니다.
+"""
+from datetime import datetime
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+
+from app.model.features import MODEL_FEATURE_ORDER
+from app.service.feature_extractor import (
+    SPEND_CATEGORIES,
+    FeatureStats,
+    derive_features,
+    feature_windows,
+    safe_float,
+    summarize_loans,
+    to_date,
+)
+
+_DAY_US = 86_400_000_000
+
+
+# -----------------------------
+#   열 변환
+# -----------------------------
+def _columns(groups: list, fields: tuple):
+    """유저별 행 목록 -> (유저 번호 배열, 필드별 object 배열). 행은 유저 순서대로 이어 붙임."""
+    counts = [len(rows) for rows in groups]
+    user_index = np.repeat(np.arange(len(groups)), counts)
+    if not user_index.size:
+        return user_index, None
+    rows = list(chain.from_iterable(groups))
+    return user_index, [
+        np.fromiter(map(attrgetter(field), rows), dtype=object, count=len(rows)) for field in fields
+    ]
+
+
+def _floats(values: np.ndarray) -> np.ndarray:
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        # None / 숫자가 아닌 값이 섞인 경우 safe_float 와 같게 0.0
+        return np.fromiter((safe_float(value) for value in values), dtype=float, count=len(values))
+
+
+def _since(values: np.ndarray, start: datetime) -> np.ndarray:
+    """values >= start 마스크 (None 은 False)."""
+    try:
+        return (values >= start).astype(bool)
+    except TypeError:
+        return np.fromiter((value is not None and value >= start for value in values), dtype=bool, count=len(values))
+
+
+def _micros(value) -> int:
+    # to_date()는 datetime 을 그대로 돌려주므로 송금 간격은 시각까지 포함한 차이의 .days (내림)
+    micros = value.toordinal() * _DAY_US
+    if isinstance(value, datetime):
+        micros += ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+    return micros
+
+
+def _sum(user_index: np.ndarray, values: np.ndarray, mask: np.ndarray, n: int) -> np.ndarray:
+    return np.bincount(user_index[mask], weights=values[mask], minlength=n)
+
+
+def _count(user_index: np.ndarray, mask: np.ndarray, n: int) -> np.ndarray:
+    return np.bincount(user_index[mask], minlength=n)
+
+
+def _pop_std(user_index: np.ndarray, values: np.ndarray, mean: np.ndarray, count: np.ndarray) -> np.ndarray:
+    # sqrt(sum((x - mean)^2) / n), 값이 없는 유저는 0
+    dev = values - mean[user_index]
+    squared = np.bincount(user_index, weights=dev * dev, minlength=mean.size)
+    return np.sqrt(np.divide(squared, count, out=np.zeros(mean.size), where=count > 0))
+
+
+# -----------------------------
+#   테이블별 통계 (모든 유저 한 번에)
+# -----------------------------
+def _transaction_stats(groups, columns: dict, start_6m, start_3m):
+    n = len(groups)
+    user_index, values = _columns(groups, ("tx_datetime", "amount", "direction", "category", "balance_after"))
+    if values is None:
+        return
+    tx_dt, amount, direction, category, balance = values
+
+    amounts = _floats(amount)
+    has_balance = np.not_equal(balance, None)
+    balances = np.zeros(len(balance))
+    balances[has_balance] = _floats(balance[has_balance])
+
+    in_6m = _since(tx_dt, start_6m)
+    in_3m = _since(tx_dt, start_3m)
+    is_spend = np.zeros(len(category), dtype=bool)
+    for cat in SPEND_CATEGORIES:
+        is_spend |= category == cat
+    is_spend &= direction == "OUT"
+
+    # 1) 소득 / 지출
+    salary = in_6m & (direction == "IN") & (category == "SALARY")
+    salary_total = _sum(user_index, amounts, salary, n)
+    salary_count = _count(user_index, salary, n)
+    salary_mean = np.divide(salary_total, salary_count, out=np.zeros(n), where=salary_count > 0)
+    volatility = _pop_std(user_index[salary], amounts[salary], salary_mean, salary_count)
+    columns["salary_total"] = salary_total
+    columns["salary_count"] = salary_count
+    columns["income_volatility"] = np.where(salary_count >= 2, volatility, 0.0)
+
+    spend = in_6m & is_spend
+    columns["spend_total"] = _sum(user_index, amounts, spend, n)
+    columns["spend_count"] = _count(user_index, spend, n)
+
+    # 2) 유동성
+    balance_3m = in_3m & has_balance
+    min_balance = np.full(n, np.inf)
+    np.minimum.at(min_balance, user_index[balance_3m], balances[balance_3m])
+    columns["min_balance_3m"] = np.where(np.isinf(min_balance), 0.0, min_balance)
+    columns["spend_3m_total"] = _sum(user_index, amounts, in_3m & is_spend, n)
+
+
+def _remittance_stats(groups, columns: dict, start_6m_date):
+    # 날짜 문자열 등은 extract_features 와 같게 to_date 로 변환 (송금은 행 수가 적음)
+    users, times, amounts, failed = [], [], [], []
+    start_ordinal = start_6m_date.toordinal()
+    for i, rows in enumerate(groups):
+        for row in rows:
+            r_date = to_date(row.created_at)
+            if r_date is None or r_date.toordinal() < start_ordinal:
+                continue
+            users.append(i)
+            times.append(_micros(r_date))
+            amounts.append(safe_float(row.send_amount))
+            failed.append(str(row.remittance_status).upper() == "FAILED")
+    if not users:
+        return
+
+    n = len(groups)
+    user_index = np.asarray(users, dtype=np.intp)
+    amounts = np.asarray(amounts, dtype=float)
+    every = np.ones(user_index.size, dtype=bool)
+
+    count = _count(user_index, every, n)
+    total = _sum(user_index, amounts, every, n)
+    mean = np.divide(total, count, out=np.zeros(n), where=count > 0)
+    columns["remit_count"] = count
+    columns["remit_fail"] = _count(user_index, np.asarray(failed, dtype=bool), n)
+    columns["remit_total"] = total
+    columns["remit_amount_avg"] = mean
+    columns["remit_amount_std"] = _pop_std(user_index, amounts, mean, count)
+
+    # 날짜(주기) 기반 Stability: 유저별 시각 정렬 후 인접 간격(일)
+    times = np.asarray(times, dtype=np.int64)
+    order = np.lexsort((times, user_index))
+    sorted_users = user_index[order]
+    same_user = sorted_users[1:] == sorted_users[:-1]
+    interval_users = sorted_users[1:][same_user]
+    intervals = (np.diff(times[order]) // _DAY_US)[same_user].astype(float)
+
+    interval_count = np.bincount(interval_users, minlength=n)
+    interval_total = np.bincount(interval_users, weights=intervals, minlength=n)
+    interval_avg = np.divide(interval_total, interval_count, out=np.zeros(n), where=interval_count > 0)
+    interval_std = _pop_std(interval_users, intervals, interval_avg, interval_count)
+    ratio = np.divide(interval_std, interval_avg, out=np.zeros(n), where=interval_avg > 0)
+    columns["interval_stability"] = np.where(
+        (count >= 3) & (interval_avg > 0), np.maximum(0.0, 1 - ratio), 0.0,
+    )
+
+
+def _card_stats(groups, columns: dict, start_3m):
+    n = len(groups)
+    user_index, values = _columns(
+        groups, ("credit_limit", "outstanding_amt", "tx_datetime", "tx_amount", "tx_category"),
+    )
+    if values is None:
+        return
+    credit_limit, outstanding_amt, tx_dt, tx_amount, tx_category = values
+
+    credit_limit = _floats(credit_limit)
+    outstanding_amt = _floats(outstanding_amt)
+    has_limit = credit_limit > 0
+    utilization = np.zeros(n)
+    np.maximum.at(utilization, user_index[has_limit], outstanding_amt[has_limit] / credit_limit[has_limit])
+    columns["max_utilization_ratio"] = utilization
+
+    in_3m = _since(tx_dt, start_3m)
+    amounts = _floats(tx_amount)
+    columns["card_total"] = _sum(user_index, amounts, in_3m, n)
+    columns["ca_total"] = _sum(user_index, amounts, in_3m & (tx_category == "CASH_ADVANCE"), n)
+
+
+def _collect_stats(row_groups, windows) -> list[FeatureStats]:
+    """row_groups 의 유저 순서대로 FeatureStats 목록"""
+    start_6m_date, start_6m, _, start_3m = windows
+    row_groups = [tuple(map(list, group)) for group in row_groups]
+    transactions, cards, loans, remittances = (
+        [group[i] for group in row_groups] for i in range(4)
+    )
+
+    columns = {}
+    _transaction_stats(transactions, columns, start_6m, start_3m)
+    _remittance_stats(remittances, columns, start_6m_date)
+    _card_stats(cards, columns, start_3m)
+
+    # 유저별 FeatureStats (NumPy 값은 tolist()로 Python float/int 변환)
+    values = {name: column.tolist() for name, column in columns.items()}
+    stats_list = []
+    for i, loan_rows in enumerate(loans):
+        stats = FeatureStats(**{name: column[i] for name, column in values.items()})
+        summarize_loans(loan_rows, stats)
+        stats_list.append(stats)
+    return stats_list
+
+
+# -----------------------------
+#   Public API
+# -----------------------------
+def extract_features_vectorized(transaction_rows, card_rows, loan_rows, remit_rows, today=None):
+    """extract_features()와 같은 인자/결과(dict)를 갖는 NumPy 구현 (유저 1명)."""
+    windows = feature_windows(today)
+    stats = _collect_stats([(transaction_rows, card_rows, loan_rows, remit_rows)], windows)[0]
+    return derive_features(stats, windows[0])
+
+
+def extract_feature_matrix(row_groups, today=None) -> np.ndarray:
+    """
+    여러 유저의 행 묶음을 (N, 18) 피처 행렬로 변환합니다.
+
+    row_groups: (transaction_rows, card_rows, loan_rows, remit_rows) 튜플의 iterable
+    열 순서는 MODEL_FEATURE_ORDER 를 따릅니다.
+    """
+    windows = feature_windows(today)
+    stats_list = _collect_stats(row_groups, windows)
+
+    matrix = np.zeros((len(stats_list), len(MODEL_FEATURE_ORDER)), dtype=float)
+    for i, stats in enumerate(stats_list):
+        features = derive_features(stats, windows[0])
+        matrix[i] = [features[col] for col in MODEL_FEATURE_ORDER]
+    return matrix
@@ -0,0 +1 @@
+# 신용 점수 서비스 벤치마크 (python -m benchmarks)
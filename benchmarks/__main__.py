@@ -0,0 +1,134 @@
+# 벤치마크 실행
+#
+# 사용법:
+#   python -m benchmarks [--suite all|micro|e2e] [--profile typical] [--users 200] [--seed 42]
+#                        [--runs 50] [--save-baseline] [--threshold 0.25]
+#
+# 1) 시드 고정 합성 데이터로 SQLite 대체 DB(core / mydata)와 합성 모델을 --workdir 에 만들고
+# 2) 서비스 함수 마이크로 벤치마크 / FastAPI end-to-end 벤치마크를 실행한 뒤
+# 3) benchmarks/baselines/<profile>.json 기준값과 "기준 작업(reference workload) 대비 median 배수"를 비교해
+#    threshold 비율 넘게 느려진 항목이 있으면 종료 코드 1 로 끝납니다.
+#    기준값의 meta(profile / users / seed / python / machine)가 현재 실행과 다르면 비교하지 않고 종료 코드 2.
+# 운영 모델로 측정하려면 --model-path / --scaler-path 를 지정합니다.
+
+import argparse
+import os
+import platform
+import sys
+from datetime import datetime
+
+from benchmarks import synthetic
+from benchmarks.harness import BenchResult, compare, load_baseline, meta_mismatches, save_baseline
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+def prepare_environment(args) -> dict:
+    """합성 데이터/모델을 만들고 앱 설정(환경 변수)을 SQLite 대체 DB로 지정합니다."""
+    os.makedirs(args.workdir, exist_ok=True)
+    profile = synthetic.PROFILES[args.profile]
+
+    print(f"generating {args.users} '{args.profile}' users (seed={args.seed}) in {args.workdir}")
+    population = synthetic.generate_population(args.users, profile, seed=args.seed)
+    core_path = os.path.join(args.workdir, "core.db")
+    mydata_path = os.path.join(args.workdir, "mydata.db")
+    synthetic.build_sqlite_databases(core_path, mydata_path, population)
+
+    model_path, scaler_path = args.model_path, args.scaler_path
+    if not model_path or not scaler_path:
+        model_path = os.path.join(args.workdir, "credit_model.pkl")
+        scaler_path = os.path.join(args.workdir, "scaler.pkl")
+        synthetic.build_synthetic_model(model_path, scaler_path, population, seed=args.seed)
+
+    # app.config 가 import 되기 전에 설정 (Settings 는 import 시점에 환경 변수를 읽음)
+    os.environ.update({
+        "MODEL_PATH": model_path,
+        "SCALER_PATH": scaler_path,
+        "MODEL_RELOAD_INTERVAL_SEC": "0",
+        "CORE_BANKING_DB_URL": synthetic.sqlite_url(core_path),
+        "CORE_BANKING_READ_DB_URL": synthetic.sqlite_url(core_path),
+        "MYDATA_DB_URL": synthetic.sqlite_url(mydata_path),
+        "MYDATA_READ_DB_URL": synthetic.sqlite_url(mydata_path),
+        "FEATURE_CACHE_ENABLED": "true" if args.feature_cache else "false",
+        "FEATURE_CACHE_REDIS_URL": "",
+        "SCORE_WRITE_BEHIND_ENABLED": "false",
+    })
+    return population
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Credit scoring benchmarks on synthetic data")
+    parser.add_argument("--suite", choices=["all", "micro", "e2e"], default="all")
+    parser.add_argument("--profile", choices=sorted(synthetic.PROFILES), default="typical")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--runs", type=int, default=50, help="timed calls per benchmark")
+    parser.add_argument("--workdir", default=".benchmarks", help="where the SQLite files and model are written")
+    parser.add_argument("--model-path", default=None, help="use this model pickle instead of a synthetic one")
+    parser.add_argument("--scaler-path", default=None, help="use this scaler pickle instead of a synthetic one")
+    parser.add_argument("--feature-cache", action="store_true", help="keep the feature cache enabled")
+    parser.add_argument("--baseline", default=None, help="baseline file (default: baselines/<profile>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed median slowdown ratio")
+    args = parser.parse_args()
+
+    population = prepare_environment(args)
+
+    results = []
+    if args.suite in ("all", "micro"):
+        from benchmarks import micro
+        print("\n[micro]")
+        for result in micro.run(population, args.runs):
+            print(result.line())
+            results.append(result)
+    if args.suite in ("all", "e2e"):
+        from benchmarks import e2e
+        print("\n[e2e]")
+        for result in e2e.run(population, args.runs):
+            print(result.line())
+            results.append(result)
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f"{args.profile}.json")
+    meta = {
+        "profile": args.profile,
+        "users": args.users,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    baseline_meta, baseline = load_baseline(baseline_path)
+    mismatches = meta_mismatches(baseline_meta, meta) if baseline else []
+
+    if args.save_baseline:
+        # 일부 suite 만 실행한 경우 나머지 기준값은 유지 (같은 조건으로 측정한 기준값일 때만)
+        merged = {} if mismatches else {name: BenchResult(**value) for name, value in baseline.items()}
+        merged.update({r.name: r for r in results})
+        save_baseline(
+            baseline_path,
+            list(merged.values()),
+            meta={**meta, "recorded_at": datetime.now().isoformat(timespec="seconds")},
+        )
+        print(f"\nbaseline saved: {baseline_path}")
+        return
+
+    if not baseline:
+        print(f"\nno baseline at {baseline_path} (run with --save-baseline first)")
+        return
+
+    if mismatches:
+        print(f"\nbaseline {baseline_path} was recorded under different conditions, not comparing:")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        print("re-record it on this machine at the base commit with --save-baseline")
+        sys.exit(2)
+
+    print(f"\ncompared with {baseline_path} (threshold +{args.threshold:.0%} relative to the reference workload)")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# FastAPI 엔드포인트 end-to-end 벤치마크
+# TestClient 로 앱 전체(라우팅, 검증, DB 조회, 추론, 저장)를 SQLite 대체 DB에 대해 측정합니다.
+
+from itertools import cycle
+
+from benchmarks.harness import measure
+
+PREFIX = "/api/server/credit-score"
+
+
+def run(population: dict, runs: int) -> list:
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    user_ids = list(population)
+    next_user_id = cycle(user_ids).__next__
+    id_batch = user_ids[:100]
+
+    def call(method: str, path: str, **kwargs):
+        response = client.request(method, path, **kwargs)
+        if response.status_code != 200:
+            raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text}")
+        return response
+
+    results = []
+    with TestClient(app) as client:
+        # 조회 엔드포인트가 빈 결과가 되지 않도록 먼저 한 번 채점
+        call("POST", f"{PREFIX}/batch", json={"user_ids": user_ids})
+
+        results.append(measure(
+            "POST /credit-score", lambda: call("POST", PREFIX, json={"user_id": next_user_id()}), runs,
+        ))
+        results.append(measure(
+            f"POST /credit-score/batch[{len(id_batch)}]",
+            lambda: call("POST", f"{PREFIX}/batch", json={"user_ids": id_batch}), max(runs // 10, 3),
+        ))
+        results.append(measure(
+            "GET /credit-score/{user_id}", lambda: call("GET", f"{PREFIX}/{next_user_id()}"), runs,
+        ))
+        results.append(measure(
+            "GET /credit-score/history/{user_id}", lambda: call("GET", f"{PREFIX}/history/{next_user_id()}"), runs,
+        ))
+        results.append(measure(
+            "GET /credit-score/report/{user_id}", lambda: call("GET", f"{PREFIX}/report/{next_user_id()}"), runs,
+        ))
+        results.append(measure(
+            "POST /credit-score/prediction",
+            lambda: call("POST", f"{PREFIX}/prediction", json={"user_id": next_user_id(), "monthly_amount": 500000}),
+            runs,
+        ))
+        grid_range = {"amount_min": 0, "amount_max": 2_000_000, "amount_step": 50_000}
+        results.append(measure(
+            "POST /credit-score/prediction/grid[41]",
+            lambda: call("POST", f"{PREFIX}/prediction/grid", json={"user_id": next_user_id(), **grid_range}),
+            runs,
+        ))
+
+    return results
@@ -0,0 +1,144 @@
+# 벤치마크 측정 / 기준값(baseline) 비교 유틸
+#
+# 머신 부하/성능 차이를 빼기 위해 항목마다 직전에 앱 코드와 무관한 기준 작업(reference workload)을
+# 같이 측정하고, 비교는 "항목 median / 기준 작업 median" 비율로 합니다.
+
+import gc
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+
+# 기준값 파일이 이 값들 중 하나라도 다르면 비교하지 않음 (다른 조건의 측정값 비교는 잡음)
+COMPARABLE_META = ("profile", "users", "seed", "python", "machine")
+
+REFERENCE_RUNS = 15
+
+
+@dataclass
+class BenchResult:
+    name: str
+    runs: int
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    reference_ms: float = 0.0  # 직전에 측정한 기준 작업 median
+
+    @property
+    def relative(self) -> float:
+        """기준 작업 대비 median 배수 (머신 속도와 무관한 비교 값)"""
+        return self.median_ms / self.reference_ms if self.reference_ms > 0 else 0.0
+
+    def line(self) -> str:
+        return (
+            f"{self.name:<48} median {self.median_ms:9.3f} ms   "
+            f"p95 {self.p95_ms:9.3f} ms   min {self.min_ms:9.3f} ms   "
+            f"x{self.relative:8.3f} ref   (n={self.runs})"
+        )
+
+
+def reference_workload():
+    """머신 속도 측정용 고정 작업: Python 루프 / dict / 정렬 / 문자열 (앱 코드와 무관, 약 수 ms)"""
+    values = [((i * 7919) % 10007) / 7.0 for i in range(20_000)]
+    total = 0.0
+    for value in values:
+        total += value * value
+    index = {f"k{i}": value for i, value in enumerate(values)}
+    ordered = sorted(values, reverse=True)
+    return total, len(index), ordered[0]
+
+
+def _timings(fn, runs: int) -> list[float]:
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    timings.sort()
+    return timings
+
+
+def measure(name: str, fn, runs: int = 50, warmup: int = 3) -> BenchResult:
+    """
+    fn()을 warmup 후 runs 번 호출해 호출당 경과 시간 통계를 구합니다.
+    측정 전후로 reference_workload()도 REFERENCE_RUNS 번씩 측정해 같은 시점의 머신 속도를 기록합니다.
+    """
+    for _ in range(warmup):
+        fn()
+
+    reference = _timings(reference_workload, REFERENCE_RUNS)
+    timings = _timings(fn, runs)
+    reference += _timings(reference_workload, REFERENCE_RUNS)
+    return BenchResult(
+        name=name,
+        runs=runs,
+        median_ms=statistics.median(timings),
+        p95_ms=timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        min_ms=timings[0],
+        reference_ms=statistics.median(reference),
+    )
+
+
+# =========================================================
+# 기준값 저장 / 비교
+# =========================================================
+def save_baseline(path: str, results: list[BenchResult], meta: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {"meta": meta, "results": {r.name: asdict(r) for r in results}},
+            f, indent=2, ensure_ascii=False, sort_keys=True,
+        )
+        f.write("\n")
+
+
+def load_baseline(path: str) -> tuple[dict, dict]:
+    """(meta, results). 파일이 없으면 ({}, {})"""
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path) as f:
+        data = json.load(f)
+    return data.get("meta", {}), data.get("results", {})
+
+
+def meta_mismatches(baseline_meta: dict, meta: dict) -> list[str]:
+    """COMPARABLE_META 중 기준값과 현재 실행이 다른 항목 ("key: 기준값 != 현재값")"""
+    return [
+        f"{key}: {baseline_meta.get(key)!r} != {meta.get(key)!r}"
+        for key in COMPARABLE_META
+        if baseline_meta.get(key) != meta.get(key)
+    ]
+
+
+def compare(results: list[BenchResult], baseline: dict, threshold: float) -> list[str]:
+    """
+    기준 작업 대비 배수(relative)가 기준값보다 threshold(비율) 넘게 커진 항목을 반환합니다.
+    median 과 min 이 모두 느려진 경우만 회귀로 보고 (한쪽만 느려진 경우는 측정 잡음으로 보고 통과),
+    기준값에 없거나 기준 작업 측정값이 없는 항목은 비교하지 않습니다.
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None or not base.get("reference_ms") or not result.reference_ms:
+            print(f"  {result.name}: no baseline")
+            continue
+        base_relative = base["median_ms"] / base["reference_ms"]
+        base_min_relative = base["min_ms"] / base["reference_ms"]
+        ratio = result.relative / base_relative if base_relative > 0 else 1.0
+        min_ratio = (result.min_ms / result.reference_ms) / base_min_relative if base_min_relative > 0 else 1.0
+        status = "REGRESSION" if ratio > 1 + threshold and min_ratio > 1 + threshold else "ok"
+        print(
+            f"  {result.name:<48} x{base_relative:8.3f} -> x{result.relative:8.3f} ref  "
+            f"({base['median_ms']:9.3f} -> {result.median_ms:9.3f} ms)  x{ratio:5.2f}  {status}"
+        )
+        if status != "ok":
+            regressions.append(result.name)
+    return regressions
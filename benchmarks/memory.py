@@ -0,0 +1,163 @@
+# 워커 프로세스 모델 메모리 비교 (pickle vs memory-map 모델 파일)
+#
+# 사용법:
+#   python -m benchmarks.memory [--workers 4] [--users 200] [--n-estimators 300] [--max-depth 12]
+#                               [--model-path credit_model.pkl --scaler-path scaler.pkl]
+#
+# 합성 모델(또는 지정한 운영 모델 pickle)을 app.model.mmap_model 형식으로 변환한 뒤, 형식별로 워커 수만큼
+# 별도 인터프리터(uvicorn 워커와 같은 spawn 방식)를 띄워 ModelRegistry 로 모델을 로드하고 예측을 실행합니다.
+# 모델 배열 페이지를 모두 한 번씩 읽은 상태에서 /proc/<pid>/smaps_rollup 의 RSS / PSS / USS(전용 페이지)를 합산합니다.
+# PSS 합계는 공유 페이지를 프로세스 수로 나눈 값이라 실제 물리 메모리 사용량에 가깝습니다. (Linux 전용)
+
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks import synthetic
+
+_ROLLUP_FIELDS = ("Rss", "Pss", "Private_Clean", "Private_Dirty")
+
+
+def _smaps_rollup(pid: int) -> dict:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in _ROLLUP_FIELDS:
+                values[name] = int(rest.split()[0])  # kB
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+# =========================================================
+# 워커 (자식 프로세스)
+# =========================================================
+def _touch_model_pages(engine):
+    # 예측 경로에 따라 일부 노드만 읽히지 않도록 모든 배열을 한 번씩 읽음 (최악의 경우 기준)
+    for part in (engine._scaler, engine._model):
+        for name in getattr(part, "ARRAYS", ()):
+            value = getattr(part, name)
+            if value is not None:
+                value.sum()
+
+
+def _child(storage: str):
+    import numpy as np
+
+    from app.config.config import settings
+    from app.model.features import MODEL_FEATURE_ORDER
+    from app.model.registry import ModelRegistry
+
+    if storage != "none":
+        registry = ModelRegistry(
+            settings.MODEL_PATH,
+            settings.SCALER_PATH,
+            reload_interval=0,
+            mmap_path=settings.MODEL_MMAP_PATH if storage == "mmap" else None,
+        )
+        bundle = registry.load()
+        rng = np.random.default_rng(0)
+        bundle.engine.predict(rng.normal(size=(256, len(MODEL_FEATURE_ORDER))))
+        _touch_model_pages(bundle.engine)
+
+    # 부모가 메모리를 읽을 때까지 대기
+    print("ready", flush=True)
+    sys.stdin.readline()
+
+
+def _measure(storage: str, workers: int) -> list[dict]:
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.memory", "--child", storage],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for process in processes:
+            if process.stdout.readline().strip() != "ready":
+                raise RuntimeError(f"{storage} worker failed to load the model")
+        # 모든 워커가 로드를 마친 뒤 측정해야 공유 페이지가 PSS 에 나눠서 반영됨
+        return [_smaps_rollup(process.pid) for process in processes]
+    finally:
+        for process in processes:
+            process.stdin.close()
+            process.wait()
+
+
+def _total(stats: list[dict]) -> dict:
+    return {key: sum(s[key] for s in stats) for key in ("rss", "pss", "uss")}
+
+
+def _line(label: str, total: dict, base: dict = None) -> str:
+    line = (
+        f"{label:<8} rss {total['rss'] / 1024:8.1f} MiB   pss {total['pss'] / 1024:8.1f} MiB   "
+        f"uss {total['uss'] / 1024:8.1f} MiB"
+    )
+    if base is not None:
+        # 모델 로드로 늘어난 물리 메모리 (같은 수의 모듈만 import 한 워커 대비 PSS 증가분)
+        line += f"   model +{(total['pss'] - base['pss']) / 1024:7.1f} MiB"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare worker memory for pickled vs memory-mapped models")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes per storage format")
+    parser.add_argument("--users", type=int, default=200, help="synthetic users to train the synthetic model on")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--n-estimators", type=int, default=300, help="trees in the synthetic model")
+    parser.add_argument("--max-depth", type=int, default=12, help="depth of the synthetic model trees")
+    parser.add_argument("--workdir", default=".benchmarks", help="where the model files are written")
+    parser.add_argument("--model-path", default=None, help="use this model pickle instead of a synthetic one")
+    parser.add_argument("--scaler-path", default=None, help="use this scaler pickle instead of a synthetic one")
+    parser.add_argument("--child", choices=["none", "pickle", "mmap"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+        return
+
+    os.makedirs(args.workdir, exist_ok=True)
+    model_path, scaler_path = args.model_path, args.scaler_path
+    if not model_path or not scaler_path:
+        model_path = os.path.join(args.workdir, "memory_model.pkl")
+        scaler_path = os.path.join(args.workdir, "memory_scaler.pkl")
+        print(f"training synthetic model ({args.n_estimators} trees, depth {args.max_depth}) in {args.workdir}")
+        population = synthetic.generate_population(args.users, synthetic.PROFILES["typical"], seed=args.seed)
+        synthetic.build_synthetic_model(
+            model_path, scaler_path, population, seed=args.seed,
+            n_estimators=args.n_estimators, max_depth=args.max_depth,
+        )
+    mmap_path = os.path.join(args.workdir, "memory_model.mmap")
+
+    # 자식 프로세스도 같은 환경 변수를 사용 (DB 는 사용하지 않음)
+    os.environ.update({
+        "MODEL_PATH": model_path,
+        "SCALER_PATH": scaler_path,
+        "MODEL_MMAP_PATH": mmap_path,
+        "CORE_BANKING_DB_URL": "sqlite://",
+        "MYDATA_DB_URL": "sqlite://",
+    })
+    from app.cli.convert_model import convert_model
+
+    convert_model(model_path, scaler_path, mmap_path)
+    print(
+        f"model pickle {os.path.getsize(model_path) / 1024 / 1024:.1f} MiB, "
+        f"mmap file {os.path.getsize(mmap_path) / 1024 / 1024:.1f} MiB"
+    )
+
+    print(f"\n[memory] {args.workers} workers (sum over workers)")
+    base = _total(_measure("none", args.workers))
+    print(_line("none", base))
+    for storage in ("pickle", "mmap"):
+        print(_line(storage, _total(_measure(storage, args.workers)), base))
+
+
+if __name__ == "__main__":
+    main()
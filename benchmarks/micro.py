@@ -0,0 +1,115 @@
+# 서비스 함수 단위 마이크로 벤치마크
+# 피처 추출 / 점수 계산 / 예측은 메모리의 합성 행으로, 조회/서비스 함수는 SQLite 대체 DB로 측정합니다.
+
+from itertools import cycle
+
+from benchmarks.harness import measure
+
+
+def run(population: dict, runs: int) -> list:
+    from app.db.core_banking import ReadSessionLocal as CoreReadSessionLocal, WriteSessionLocal
+    from app.db.mydata import ReadSessionLocal as MydataReadSessionLocal
+    from app.model.registry import model_registry
+    from app.repository.feature_data_repository import fetch_feature_aggregates, fetch_feature_aggregates_batch
+    from app.repository.user_data_repository import fetch_user_data, fetch_user_data_batch
+    from app.schema.score import CreditScorePredictRequest, ScoreRequest
+    from app.service import scoring_service
+    from app.service.feature_extractor import extract_features, feature_windows
+    from app.service.score_calculator import calculate_final_score, calculate_final_scores
+    from app.service.score_predict import predict_credit_score_grid, predict_credit_score_growth
+    from app.service.streaming_feature_extractor import extract_features_streaming
+    from app.service.vectorized_feature_extractor import extract_feature_matrix, extract_features_vectorized
+
+    model_registry.load()
+
+    user_ids = list(population)
+    rows = [population[user_id] for user_id in user_ids]
+    features = [extract_features(*user_rows) for user_rows in rows]
+    batch = features[:min(len(features), 100)]
+
+    # 스트리밍 추출기는 DB 조회(ORDER BY created_at)와 같이 송금이 날짜순으로 정렬된 입력이 필요
+    sorted_rows = [
+        (transactions, cards, loans, sorted(remittances, key=lambda row: row.created_at))
+        for transactions, cards, loans, remittances in rows
+    ]
+
+    next_rows = cycle(rows).__next__
+    next_sorted_rows = cycle(sorted_rows).__next__
+    next_features = cycle(features).__next__
+    next_user_id = cycle(user_ids).__next__
+
+    results = []
+
+    # ---------------- 피처 추출 ----------------
+    results.append(measure("extract_features", lambda: extract_features(*next_rows()), runs))
+    results.append(measure("extract_features_streaming", lambda: extract_features_streaming(*next_sorted_rows()), runs))
+    results.append(measure("extract_features_vectorized", lambda: extract_features_vectorized(*next_rows()), runs))
+    matrix_input = rows[:100]
+    results.append(measure(
+        f"extract_feature_matrix[{len(matrix_input)}]", lambda: extract_feature_matrix(matrix_input), max(runs // 5, 3),
+    ))
+
+    # ---------------- 점수 계산 / 예측 ----------------
+    results.append(measure("calculate_final_score", lambda: calculate_final_score(next_features()), runs))
+    results.append(measure(
+        f"calculate_final_scores[{len(batch)}]", lambda: calculate_final_scores(batch), max(runs // 5, 3),
+    ))
+    results.append(measure(
+        "predict_credit_score_growth", lambda: predict_credit_score_growth(dict(next_features()), 500_000.0), runs,
+    ))
+    grid_amounts = [i * 50_000.0 for i in range(41)]
+    results.append(measure(
+        f"predict_credit_score_grid[{len(grid_amounts)}]",
+        lambda: predict_credit_score_grid(dict(next_features()), grid_amounts), runs,
+    ))
+
+    # ---------------- 조회 / 서비스 (SQLite) ----------------
+    core_db = CoreReadSessionLocal()
+    core_write_db = WriteSessionLocal()
+    mydata_db = MydataReadSessionLocal()
+    try:
+        windows = feature_windows()
+        results.append(measure("fetch_user_data", lambda: fetch_user_data(next_user_id(), core_db, mydata_db), runs))
+        results.append(measure(
+            "fetch_feature_aggregates",
+            lambda: fetch_feature_aggregates(next_user_id(), core_db, mydata_db, windows), runs,
+        ))
+        id_batch = user_ids[:100]
+        results.append(measure(
+            f"fetch_user_data_batch[{len(id_batch)}]",
+            lambda: fetch_user_data_batch(id_batch, core_db, mydata_db), max(runs // 5, 3),
+        ))
+        results.append(measure(
+            f"fetch_feature_aggregates_batch[{len(id_batch)}]",
+            lambda: fetch_feature_aggregates_batch(id_batch, core_db, mydata_db, windows), max(runs // 5, 3),
+        ))
+
+        results.append(measure(
+            "scoring_service.calculate_credit_score",
+            lambda: scoring_service.calculate_credit_score(
+                ScoreRequest(user_id=next_user_id()), core_db, core_write_db, mydata_db,
+            ),
+            runs,
+        ))
+        results.append(measure(
+            "scoring_service.get_credit_report_data",
+            lambda: scoring_service.get_credit_report_data(next_user_id(), core_db, mydata_db), runs,
+        ))
+        results.append(measure(
+            "scoring_service.process_prediction",
+            lambda: scoring_service.process_prediction(
+                CreditScorePredictRequest(user_id=next_user_id(), monthly_amount=500_000.0), core_db, mydata_db,
+            ),
+            runs,
+        ))
+        results.append(measure(
+            f"scoring_service.calculate_credit_scores_batch[{len(id_batch)}]",
+            lambda: scoring_service.calculate_credit_scores_batch(id_batch, core_db, core_write_db, mydata_db),
+            max(runs // 10, 3),
+        ))
+    finally:
+        core_db.close()
+        core_write_db.close()
+        mydata_db.close()
+
+    return results
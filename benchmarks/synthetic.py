@@ -0,0 +1,272 @@
+# 벤치마크용 합성 데이터 생성기
+# mydata_transaction / mydata_card / mydata_loan / overseas_remittance 행을 시드 고정으로 생성하고,
+# 로컬 SQLite 대체 DB(core / mydata)와 합성 모델(scaler + model pickle)을 만듭니다.
+# 같은 (seed, profile, 유저 수)이면 항상 같은 데이터가 만들어집니다 (기준 시각 now 포함).
+
+import os
+import pickle
+import random
+import sqlite3
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from app.repository.user_data_repository import (
+    CARD_COLUMNS,
+    LOAN_COLUMNS,
+    REMITTANCE_COLUMNS,
+    TRANSACTION_COLUMNS,
+)
+from app.service.feature_extractor import SPEND_CATEGORIES, extract_features
+
+
+def _fields(columns: str) -> list[str]:
+    return [name.strip() for name in columns.split(",")]
+
+
+# DB 조회 결과(Row)와 같은 속성 이름을 갖는 행 타입
+TransactionRow = namedtuple("TransactionRow", _fields(TRANSACTION_COLUMNS))
+CardRow = namedtuple("CardRow", _fields(CARD_COLUMNS))
+LoanRow = namedtuple("LoanRow", _fields(LOAN_COLUMNS))
+RemittanceRow = namedtuple("RemittanceRow", _fields(REMITTANCE_COLUMNS))
+
+
+# =========================================================
+# 유저 규모 프로파일
+# =========================================================
+@dataclass(frozen=True)
+class UserProfile:
+    months: int                       # 거래 이력 기간(개월)
+    transactions_per_month: int
+    card_tx_per_month: int
+    loans: int
+    remittances_per_month: float
+
+
+PROFILES = {
+    # 가입 직후 고객: 이력 짧고 적음
+    "thin": UserProfile(months=3, transactions_per_month=15, card_tx_per_month=5, loans=0, remittances_per_month=0.5),
+    # 일반 고객
+    "typical": UserProfile(months=12, transactions_per_month=60, card_tx_per_month=25, loans=1, remittances_per_month=1.0),
+    # 거래가 많은 고객
+    "heavy": UserProfile(months=24, transactions_per_month=300, card_tx_per_month=120, loans=3, remittances_per_month=4.0),
+}
+
+# 벤치마크 전체에서 같은 기준 시각을 사용 (피처 기간 조건이 실행 시각에 따라 바뀌지 않도록 날짜 단위로 고정)
+BASE_NOW = datetime.combine(date.today(), datetime.min.time()) + timedelta(hours=9)
+
+
+# =========================================================
+# 유저 1명 행 생성
+# =========================================================
+def generate_user_rows(user_id: int, profile: UserProfile, seed: int = 0, now: datetime = BASE_NOW):
+    """(transaction_rows, card_rows, loan_rows, remittance_rows) - extract_features 인자 순서."""
+    rnd = random.Random(f"{seed}:{user_id}")
+    collected_at = now - timedelta(hours=rnd.randint(0, 48))
+    days = profile.months * 30
+
+    def past(max_days: int) -> datetime:
+        return now - timedelta(days=rnd.uniform(0, max_days), seconds=rnd.randint(0, 86399))
+
+    # 입출금: 월급 입금 + 지출 + 기타 입금
+    salary = rnd.choice([2_500_000, 3_200_000, 4_100_000, 5_500_000]) * rnd.uniform(0.9, 1.1)
+    balance = rnd.uniform(500_000, 20_000_000)
+    transactions = []
+    for month in range(profile.months):
+        pay_day = now - timedelta(days=30 * month + rnd.randint(0, 3))
+        transactions.append(TransactionRow(
+            pay_day, round(salary * rnd.uniform(0.95, 1.05), 2), "IN", "SALARY", round(balance, 2), collected_at,
+        ))
+        for _ in range(max(profile.transactions_per_month - 1, 0)):
+            tx_datetime = pay_day - timedelta(days=rnd.uniform(0, 30))
+            if rnd.random() < 0.8:
+                amount = round(rnd.lognormvariate(10.5, 1.0), 2)
+                balance -= amount
+                transactions.append(TransactionRow(
+                    tx_datetime, amount, "OUT", rnd.choice(SPEND_CATEGORIES), round(balance, 2), collected_at,
+                ))
+            else:
+                amount = round(rnd.uniform(10_000, 500_000), 2)
+                balance += amount
+                transactions.append(TransactionRow(
+                    tx_datetime, amount, "IN", "OTHER", round(balance, 2), collected_at,
+                ))
+
+    # 카드 사용 (일부 현금서비스)
+    credit_limit = rnd.choice([3_000_000, 5_000_000, 10_000_000])
+    outstanding = rnd.uniform(0, credit_limit)
+    cards = [
+        CardRow(
+            past(days),
+            round(rnd.lognormvariate(10.0, 1.0), 2),
+            rnd.choice(["LUMP_SUM", "INSTALLMENT"]),
+            "CASH_ADVANCE" if rnd.random() < 0.03 else rnd.choice(["SHOPPING", "FOOD", "TRAVEL"]),
+            credit_limit,
+            round(outstanding * rnd.uniform(0.8, 1.2), 2),
+            collected_at,
+        )
+        for _ in range(profile.months * profile.card_tx_per_month)
+    ]
+
+    # 대출 (일부 연체 이력)
+    loans = []
+    for _ in range(profile.loans):
+        overdue = rnd.random() < 0.2
+        loans.append(LoanRow(
+            round(rnd.uniform(5_000_000, 200_000_000), 2),
+            round(rnd.uniform(3.0, 12.0), 2),
+            "ACTIVE",
+            rnd.randint(1, 3) if overdue else 0,
+            round(rnd.uniform(100_000, 3_000_000), 2) if overdue else 0,
+            rnd.randint(1, 90) if overdue else 0,
+            (now - timedelta(days=rnd.randint(1, 365))).date() if overdue else None,
+            collected_at,
+        ))
+
+    # 해외 송금 (대략 월 주기 + 일부 실패)
+    remittances = []
+    n_remittances = int(profile.months * profile.remittances_per_month)
+    for i in range(n_remittances):
+        interval = 30 / max(profile.remittances_per_month, 0.01)
+        remittances.append(RemittanceRow(
+            round(rnd.uniform(200_000, 2_000_000), 2),
+            "FAILED" if rnd.random() < 0.05 else "COMPLETED",
+            now - timedelta(days=i * interval + rnd.uniform(0, 3)),
+        ))
+
+    return transactions, cards, loans, remittances
+
+
+def generate_population(n_users: int, profile: UserProfile, seed: int = 0, first_user_id: int = 1):
+    """{user_id: (transaction_rows, card_rows, loan_rows, remittance_rows)}"""
+    return {
+        user_id: generate_user_rows(user_id, profile, seed)
+        for user_id in range(first_user_id, first_user_id + n_users)
+    }
+
+
+# =========================================================
+# SQLite 대체 DB
+# =========================================================
+CORE_SCHEMA = """
+CREATE TABLE overseas_remittance (
+    id INTEGER PRIMARY KEY, user_id BIGINT NOT NULL,
+    send_amount NUMERIC, remittance_status VARCHAR(20), created_at TIMESTAMP
+);
+CREATE INDEX ix_overseas_remittance_user ON overseas_remittance (user_id, created_at);
+CREATE TABLE credit_score (
+    user_id BIGINT PRIMARY KEY, score INT NOT NULL, created_at TIMESTAMP, updated_at TIMESTAMP
+);
+CREATE TABLE credit_score_history (
+    user_id BIGINT NOT NULL, score INT NOT NULL, created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (user_id, created_at)
+);
+CREATE TABLE credit_score_monthly (
+    user_id BIGINT NOT NULL, year INT NOT NULL, month INT NOT NULL,
+    score_sum BIGINT NOT NULL DEFAULT 0, score_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, year, month)
+);
+CREATE TABLE credit_feature_snapshot (
+    user_id BIGINT NOT NULL PRIMARY KEY,
+    features TEXT NOT NULL, has_data INT NOT NULL, score INT NOT NULL,
+    model_version VARCHAR(32) NOT NULL, computed_at TIMESTAMP NOT NULL
+);
+CREATE TABLE credit_feature_state (
+    user_id BIGINT NOT NULL PRIMARY KEY,
+    watermark TIMESTAMP NULL, state TEXT NOT NULL, updated_at TIMESTAMP NOT NULL
+);
+"""
+
+MYDATA_SCHEMA = """
+CREATE TABLE mydata_transaction (
+    id INTEGER PRIMARY KEY, user_id BIGINT NOT NULL,
+    tx_datetime TIMESTAMP, amount NUMERIC, direction VARCHAR(10), category VARCHAR(30),
+    balance_after NUMERIC, collected_at TIMESTAMP
+);
+CREATE INDEX ix_mydata_transaction_user ON mydata_transaction (user_id, tx_datetime);
+CREATE TABLE mydata_card (
+    id INTEGER PRIMARY KEY, user_id BIGINT NOT NULL,
+    tx_datetime TIMESTAMP, tx_amount NUMERIC, pay_type VARCHAR(20), tx_category VARCHAR(30),
+    credit_limit NUMERIC, outstanding_amt NUMERIC, collected_at TIMESTAMP
+);
+CREATE INDEX ix_mydata_card_user ON mydata_card (user_id, tx_datetime);
+CREATE TABLE mydata_loan (
+    id INTEGER PRIMARY KEY, user_id BIGINT NOT NULL,
+    loan_principal NUMERIC, interest_rate NUMERIC, status VARCHAR(20), overdue_count_12m INT,
+    overdue_amount NUMERIC, max_overdue_days INT, last_overdue_dt DATE, collected_at TIMESTAMP
+);
+CREATE INDEX ix_mydata_loan_user ON mydata_loan (user_id);
+"""
+
+
+def _insert(conn, table: str, fields, user_id: int, rows):
+    columns = ", ".join(("user_id", *fields))
+    placeholders = ", ".join("?" * (len(fields) + 1))
+    conn.executemany(
+        f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+        [(user_id, *row) for row in rows],
+    )
+
+
+def build_sqlite_databases(core_path: str, mydata_path: str, population: dict):
+    """population 을 core / mydata SQLite 파일로 저장 (기존 파일은 덮어씀)."""
+    for path in (core_path, mydata_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+    core = sqlite3.connect(core_path)
+    mydata = sqlite3.connect(mydata_path)
+    try:
+        core.executescript(CORE_SCHEMA)
+        mydata.executescript(MYDATA_SCHEMA)
+        for user_id, (transactions, cards, loans, remittances) in population.items():
+            _insert(mydata, "mydata_transaction", TransactionRow._fields, user_id, transactions)
+            _insert(mydata, "mydata_card", CardRow._fields, user_id, cards)
+            _insert(mydata, "mydata_loan", LoanRow._fields, user_id, loans)
+            _insert(core, "overseas_remittance", RemittanceRow._fields, user_id, remittances)
+        core.commit()
+        mydata.commit()
+    finally:
+        core.close()
+        mydata.close()
+
+
+def sqlite_url(path: str) -> str:
+    # detect_types: TIMESTAMP/DATE 컬럼을 datetime/date 로 읽도록 함 (MySQL 드라이버와 같은 타입)
+    return f"sqlite:///{os.path.abspath(path)}?detect_types=1"
+
+
+# =========================================================
+# 합성 모델
+# =========================================================
+def build_synthetic_model(model_path: str, scaler_path: str, population: dict, seed: int = 0,
+                          n_estimators: int = 100, max_depth: int = 8):
+    """
+    운영 모델 파일 없이 벤치마크를 돌리기 위한 StandardScaler + RandomForestRegressor.
+    population 에서 추출한 피처에 임의의 선형 점수 + 노이즈를 학습합니다.
+    """
+    import numpy as np
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.preprocessing import StandardScaler
+
+    from app.model.features import MODEL_FEATURE_ORDER
+
+    rows = []
+    for transactions, cards, loans, remittances in population.values():
+        features = extract_features(transactions, cards, loans, remittances)
+        rows.append([features[name] for name in MODEL_FEATURE_ORDER])
+    X = np.asarray(rows, dtype=np.float64)
+
+    rng = np.random.default_rng(seed)
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+    weights = rng.normal(scale=20.0, size=X.shape[1])
+    y = 750 + X_scaled @ weights + rng.normal(scale=10.0, size=X.shape[0])
+
+    model = RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth, random_state=seed)
+    model.fit(X_scaled, y)
+
+    with open(model_path, "wb") as f:
+        pickle.dump(model, f)
+    with open(scaler_path, "wb") as f:
+        pickle.dump(scaler, f)
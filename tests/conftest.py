@@ -0,0 +1,117 @@
+# 테스트 공통 설정
+# Settings 는 import 시점에 환경 변수를 읽으므로, app 모듈을 import 하기 전에 임시 디렉터리의
+# SQLite 대체 DB(core / mydata)와 합성 모델(benchmarks.synthetic)을 만들고 경로를 지정합니다.
+#
+# 실행: python -m pytest -q
+
+import os
+import shutil
+import sqlite3
+import tempfile
+
+import pytest
+
+_WORKDIR = tempfile.mkdtemp(prefix="credit-tests-")
+CORE_DB_PATH = os.path.join(_WORKDIR, "core.db")
+MYDATA_DB_PATH = os.path.join(_WORKDIR, "mydata.db")
+
+os.environ.update({
+    "MODEL_PATH": os.path.join(_WORKDIR, "credit_model.pkl"),
+    "SCALER_PATH": os.path.join(_WORKDIR, "scaler.pkl"),
+    "MODEL_RELOAD_INTERVAL_SEC": "0",
+    "CORE_BANKING_DB_URL": f"sqlite:///{CORE_DB_PATH}?detect_types=1",
+    "MYDATA_DB_URL": f"sqlite:///{MYDATA_DB_PATH}?detect_types=1",
+    "FEATURE_CACHE_REDIS_URL": "",
+    "SCORE_WRITE_BEHIND_ENABLED": "false",
+    "STARTUP_POOL_PREWARM_CONNECTIONS": "0",
+    "SCORE_JOB_QUEUE_PATH": os.path.join(_WORKDIR, "score_jobs.db"),
+    "PROFILING_DIR": os.path.join(_WORKDIR, "profiles"),
+})
+
+from benchmarks import synthetic  # noqa: E402
+
+# 테스트 데이터: 일반 고객 20명 (user_id 1~20). 테스트에서 행을 추가할 때는 1000 이상의 user_id 사용
+POPULATION = synthetic.generate_population(20, synthetic.PROFILES["typical"], seed=7)
+synthetic.build_sqlite_databases(CORE_DB_PATH, MYDATA_DB_PATH, POPULATION)
+synthetic.build_synthetic_model(
+    os.environ["MODEL_PATH"], os.environ["SCALER_PATH"], POPULATION, seed=7, n_estimators=10, max_depth=4,
+)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_WORKDIR, ignore_errors=True)
+
+
+# =========================================================
+# fixtures
+# =========================================================
+@pytest.fixture(scope="session")
+def population():
+    return POPULATION
+
+
+@pytest.fixture
+def core_db():
+    from app.db.core_banking import ReadSessionLocal
+
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def mydata_db():
+    from app.db.mydata import ReadSessionLocal
+
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _insert_rows(path: str, table: str, fields, user_id: int, rows):
+    conn = sqlite3.connect(path)
+    try:
+        columns = ", ".join(("user_id", *fields))
+        placeholders = ", ".join("?" * (len(fields) + 1))
+        conn.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            [(user_id, *row) for row in rows],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def add_user_rows():
+    """add_user_rows(user_id, transactions=..., cards=..., loans=..., remittances=...) - synthetic 행 타입으로 DB에 추가."""
+    def add(user_id: int, transactions=(), cards=(), loans=(), remittances=()):
+        _insert_rows(MYDATA_DB_PATH, "mydata_transaction", synthetic.TransactionRow._fields, user_id, transactions)
+        _insert_rows(MYDATA_DB_PATH, "mydata_card", synthetic.CardRow._fields, user_id, cards)
+        _insert_rows(MYDATA_DB_PATH, "mydata_loan", synthetic.LoanRow._fields, user_id, loans)
+        _insert_rows(CORE_DB_PATH, "overseas_remittance", synthetic.RemittanceRow._fields, user_id, remittances)
+
+    return add
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def update_remittance_status(user_id: int, status: str):
+    conn = sqlite3.connect(CORE_DB_PATH)
+    try:
+        conn.execute("UPDATE overseas_remittance SET remittance_status = ? WHERE user_id = ?", (status, user_id))
+        conn.commit()
+    finally:
+        conn.close()
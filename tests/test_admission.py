@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from app.common.admission import AdmissionLimiter
+from app.common.exceptions import OverloadedException
+
+RETRY_AFTER = 7
+
+
+def _limiter(max_concurrent: int = 1, max_queue: int = 2, queue_timeout: float = 5.0) -> AdmissionLimiter:
+    return AdmissionLimiter("test", max_concurrent, max_queue, queue_timeout, RETRY_AFTER)
+
+
+async def _until_queued(limiter: AdmissionLimiter, depth: int):
+    # 대기 task 들이 acquire() 안에서 대기열에 들어갈 때까지 이벤트 루프를 돌림
+    for _ in range(100):
+        if len(limiter._waiters) == depth:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(f"expected {depth} waiters, got {len(limiter._waiters)}")
+
+
+# ================ 대기열 가득 참 -> 429 ==================
+def test_full_queue_is_rejected_with_429():
+    async def scenario():
+        limiter = _limiter(max_concurrent=1, max_queue=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await _until_queued(limiter, 1)
+
+        with pytest.raises(OverloadedException) as rejected:
+            await limiter.acquire()
+        assert rejected.value.status_code == 429
+        assert rejected.value.headers["Retry-After"] == str(RETRY_AFTER)
+
+        limiter.release()
+        await waiter
+        limiter.release()
+        assert (limiter.active, len(limiter._waiters)) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+# ================ 대기 시간 초과 -> 503 + Retry-After ==================
+def test_queue_timeout_is_rejected_with_503():
+    async def scenario():
+        limiter = _limiter(max_concurrent=1, max_queue=1, queue_timeout=0.05)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedException) as rejected:
+            await limiter.acquire()
+        assert rejected.value.status_code == 503
+        assert rejected.value.headers["Retry-After"] == str(RETRY_AFTER)
+        assert (limiter.active, len(limiter._waiters)) == (1, 0)
+
+        limiter.release()
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+
+
+# ================ 자리 넘김은 도착 순서(FIFO) ==================
+def test_slots_are_handed_to_waiters_in_arrival_order():
+    async def scenario():
+        limiter = _limiter(max_concurrent=1, max_queue=3)
+        order = []
+        max_active = 0
+
+        async def request(i: int):
+            nonlocal max_active
+            await limiter.acquire()
+            try:
+                order.append(i)
+                max_active = max(max_active, limiter.active)
+                await asyncio.sleep(0)
+            finally:
+                limiter.release()
+
+        await limiter.acquire()
+        tasks = []
+        for i in range(3):
+            tasks.append(asyncio.create_task(request(i)))
+            await _until_queued(limiter, i + 1)
+
+        # 새로 온 요청은 대기자가 있으면 자리가 나도 바로 들어가지 않음
+        limiter.release()
+        assert limiter.active == 1
+        await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+        assert order == [0, 1, 2]
+        assert max_active == 1
+        assert (limiter.active, len(limiter._waiters)) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+# ================ 대기 중 취소 ==================
+def test_cancelled_waiter_does_not_leak_a_slot():
+    async def scenario():
+        limiter = _limiter(max_concurrent=1, max_queue=2)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await _until_queued(limiter, 1)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert len(limiter._waiters) == 0
+
+        limiter.release()
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("cancel_first", [False, True])
+def test_waiter_cancelled_around_handoff_does_not_leak_a_slot(cancel_first):
+    # 연결 끊김(취소)과 release 의 자리 넘김이 겹친 경우: 취소된 요청이 자리를 받았으면 다음 대기자에게 넘어가야 함
+    async def scenario():
+        limiter = _limiter(max_concurrent=1, max_queue=2)
+        await limiter.acquire()
+
+        async def request():
+            await limiter.acquire()
+            try:
+                await asyncio.sleep(0)
+            finally:
+                limiter.release()
+
+        handed = asyncio.create_task(request())
+        follower = asyncio.create_task(request())
+        await _until_queued(limiter, 2)
+
+        # 두 동작 모두 대기 task 가 다시 실행되기 전에 일어남
+        if cancel_first:
+            handed.cancel()
+            limiter.release()
+        else:
+            limiter.release()
+            handed.cancel()
+        await asyncio.wait_for(asyncio.gather(handed, follower, return_exceptions=True), 5)
+
+        assert follower.done() and not follower.cancelled()
+        assert (limiter.active, len(limiter._waiters)) == (0, 0)
+
+    asyncio.run(scenario())
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from benchmarks import synthetic
+from tests.conftest import update_remittance_status
+
+API = "/api/server/credit-score"
+
+
+def _report(client, user_id: int, etag: str = None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(f"{API}/report/{user_id}", headers=headers)
+
+
+def test_report_not_modified_until_data_changes(client, add_user_rows):
+    user_id = 1101
+    now = synthetic.BASE_NOW
+    add_user_rows(
+        user_id,
+        transactions=[
+            synthetic.TransactionRow(now - timedelta(days=30 * i + 1), 3_000_000.0, "IN", "SALARY", 4_000_000.0, now)
+            for i in range(4)
+        ],
+        remittances=[
+            synthetic.RemittanceRow(500_000.0, "PENDING", now - timedelta(days=30 * i + 2)) for i in range(4)
+        ],
+    )
+
+    first = _report(client, user_id)
+    assert first.status_code == 200
+    assert first.json()["features"]["remittance_failure_rate_6m"] == 0.0
+    etag = first.headers["etag"]
+    assert _report(client, user_id, etag).status_code == 304
+
+    # 기존 송금 행의 상태만 바뀌어도 (새 행 / created_at 변화 없음) 보고서가 다시 계산되어야 함
+    update_remittance_status(user_id, "FAILED")
+    changed = _report(client, user_id, etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["features"]["remittance_failure_rate_6m"] == 1.0
+    assert _report(client, user_id, changed.headers["etag"]).status_code == 304
@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+import pytest
+
+from app.repository.feature_data_repository import fetch_feature_aggregates, fetch_feature_aggregates_batch
+from app.repository.user_data_repository import fetch_user_data
+from app.service.feature_extractor import extract_features, extract_features_from_aggregates, feature_windows
+from app.service.score_calculator import calculate_final_score
+from app.service.scoring_service import calculate_credit_scores_batch
+from benchmarks import synthetic
+
+
+def _python_features(user_id, core_db, mydata_db):
+    remit_rows, card_rows, loan_rows, transaction_rows = fetch_user_data(user_id, core_db, mydata_db)
+    return extract_features(transaction_rows, card_rows, loan_rows, remit_rows)
+
+
+def _pushdown_features(user_id, core_db, mydata_db):
+    aggregates = fetch_feature_aggregates(user_id, core_db, mydata_db, feature_windows())
+    return extract_features_from_aggregates(
+        aggregates.transaction, aggregates.card, aggregates.loan_rows, aggregates.remit_rows, aggregates.windows,
+    )
+
+
+# ================ SQL 집계 경로 == Python 경로 ==================
+def test_sql_pushdown_matches_python_path(population, core_db, mydata_db):
+    for user_id in population:
+        expected = _python_features(user_id, core_db, mydata_db)
+        actual = _pushdown_features(user_id, core_db, mydata_db)
+        assert actual.keys() == expected.keys()
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, rel=1e-9, abs=1e-9), (user_id, name)
+
+
+def test_income_volatility_of_identical_salaries_is_zero(core_db, mydata_db, add_user_rows):
+    # SUM(x^2)/n - 평균^2 방식은 큰 급여가 모두 같을 때 상쇄 오차로 0이 아닌 값이 나왔음
+    user_id = 1001
+    now = synthetic.BASE_NOW
+    salaries = [
+        synthetic.TransactionRow(now - timedelta(days=25 * i + 1), 3_123_456.7, "IN", "SALARY", 5_000_000.0, now)
+        for i in range(6)
+    ]
+    add_user_rows(user_id, transactions=salaries)
+
+    expected = _python_features(user_id, core_db, mydata_db)
+    actual = _pushdown_features(user_id, core_db, mydata_db)
+    assert expected["income_volatility_6m"] == pytest.approx(0.0, abs=1e-6)
+    assert actual["income_volatility_6m"] == pytest.approx(0.0, abs=1e-6)
+    assert actual["income_avg_6m"] == pytest.approx(3_123_456.7)
+
+
+# ================ 일괄 계산 (GROUP BY user_id 집계) == Python 경로 ==================
+def test_batch_pushdown_matches_python_path(population, core_db, mydata_db, add_user_rows):
+    # 기간 밖 거래만 있는 유저 (has_data 는 True, 피처는 0) + 데이터가 없는 유저
+    old_only, no_data = 1002, 1003
+    now = synthetic.BASE_NOW
+    add_user_rows(old_only, transactions=[
+        synthetic.TransactionRow(now - timedelta(days=400), 2_000_000.0, "IN", "SALARY", 1_000.0, now),
+    ])
+    user_ids = [*population, old_only, no_data]
+
+    aggregates = fetch_feature_aggregates_batch(user_ids, core_db, mydata_db, feature_windows())
+
+    assert list(aggregates) == user_ids
+    assert aggregates[old_only].has_data
+    assert not aggregates[no_data].has_data
+    for user_id in [*population, old_only]:
+        assert aggregates[user_id].has_data
+        batch = aggregates[user_id]
+        actual = extract_features_from_aggregates(
+            batch.transaction, batch.card, batch.loan_rows, batch.remit_rows, batch.windows,
+        )
+        assert actual == _pushdown_features(user_id, core_db, mydata_db), user_id
+        expected = _python_features(user_id, core_db, mydata_db)
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, rel=1e-9, abs=1e-9), (user_id, name)
+
+
+def test_batch_scores_match_single_user_scores(population, core_db, mydata_db):
+    from app.db.core_banking import WriteSessionLocal
+
+    user_ids = [*population, 1004]
+    core_write_db = WriteSessionLocal()
+    try:
+        results = calculate_credit_scores_batch(user_ids, core_db, core_write_db, mydata_db)
+    finally:
+        core_write_db.close()
+
+    expected = {user_id: calculate_final_score(_python_features(user_id, core_db, mydata_db)) for user_id in population}
+    expected[1004] = 550  # 데이터 없음 -> 기본 점수
+    assert results == [{"user_id": user_id, "credit_score": expected[user_id]} for user_id in user_ids]
@@ -0,0 +1,77 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.config import settings
+from app.model.features import MODEL_FEATURE_ORDER
+from app.service.feature_snapshot import SNAPSHOT_LOOKUPS, FeatureSnapshot, fresh_snapshot
+
+API = "/api/server/credit-score"
+MAX_AGE = 300.0
+COMPUTED_AT = datetime(2026, 3, 10, 12, 0, 0)
+
+
+def _snapshot(model_version: str = "v1", computed_at: datetime = COMPUTED_AT) -> FeatureSnapshot:
+    return FeatureSnapshot(True, dict.fromkeys(MODEL_FEATURE_ORDER, 1.0), 700, model_version, computed_at)
+
+
+# ================ 신선함 기준: 같은 모델 버전 + 같은 날짜 + 최대 나이 이내 ==================
+@pytest.mark.parametrize("model_version, now, fresh", [
+    ("v1", COMPUTED_AT, True),
+    ("v1", COMPUTED_AT + timedelta(seconds=MAX_AGE), True),
+    ("v1", COMPUTED_AT + timedelta(seconds=MAX_AGE + 1), False),
+    ("v2", COMPUTED_AT + timedelta(seconds=1), False),
+])
+def test_is_fresh(model_version, now, fresh):
+    assert _snapshot().is_fresh(model_version, MAX_AGE, now) is fresh
+
+
+def test_snapshot_from_previous_day_is_stale():
+    # 나이는 기준 이내여도 날짜가 바뀌면 피처 기간(기준일)이 달라지므로 사용하지 않음
+    snapshot = _snapshot(computed_at=datetime(2026, 3, 10, 23, 59, 0))
+    assert not snapshot.is_fresh("v1", MAX_AGE, datetime(2026, 3, 11, 0, 1, 0))
+
+
+def test_fresh_snapshot_parses_row():
+    computed_at = datetime.now() - timedelta(seconds=10)
+    row = SimpleNamespace(
+        features=json.dumps([float(i) for i in range(len(MODEL_FEATURE_ORDER))]),
+        has_data=1, score=712, model_version="v1", computed_at=computed_at.isoformat(sep=" "),
+    )
+
+    snapshot = fresh_snapshot(row, "v1", MAX_AGE)
+    assert snapshot.features == {name: float(i) for i, name in enumerate(MODEL_FEATURE_ORDER)}
+    assert (snapshot.has_data, snapshot.credit_score, snapshot.computed_at) == (True, 712, computed_at)
+
+    assert fresh_snapshot(row, "v2", MAX_AGE) is None
+    assert fresh_snapshot(None, "v1", MAX_AGE) is None
+    # 피처 목록이 바뀐 뒤의 스냅샷은 사용하지 않음
+    assert fresh_snapshot(SimpleNamespace(**{**vars(row), "features": "[1.0]"}), "v1", MAX_AGE) is None
+
+
+# ================ 스냅샷으로 만든 /report == 다시 계산한 /report ==================
+def test_report_from_snapshot_matches_recomputed_report(client, population, monkeypatch):
+    from app.service.feature_cache import feature_cache
+
+    # 캐시에 있으면 다시 계산하지 않으므로 끔
+    monkeypatch.setattr(feature_cache, "enabled", False)
+    monkeypatch.setattr(settings, "FEATURE_SNAPSHOT_ENABLED", True)
+    hits = SNAPSHOT_LOOKUPS.labels("hit")
+
+    for user_id in list(population)[:5]:
+        assert client.post(API, json={"user_id": user_id}).status_code == 200
+
+        before = hits.value
+        from_snapshot = client.get(f"{API}/report/{user_id}")
+        assert from_snapshot.status_code == 200
+        assert hits.value > before
+
+        monkeypatch.setattr(settings, "FEATURE_SNAPSHOT_ENABLED", False)
+        recomputed = client.get(f"{API}/report/{user_id}")
+        monkeypatch.setattr(settings, "FEATURE_SNAPSHOT_ENABLED", True)
+
+        assert recomputed.status_code == 200
+        assert from_snapshot.json() == recomputed.json()
+        assert from_snapshot.headers["etag"] != recomputed.headers["etag"]
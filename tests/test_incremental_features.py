@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.config.config import settings
+from app.service.feature_extractor import extract_features, feature_windows
+from app.service.incremental_features import (
+    FeatureState,
+    advance_feature_state,
+    build_incremental_inputs,
+    derive_incremental_features,
+)
+from benchmarks import synthetic
+
+
+def _collected(rows, collected_at):
+    return [row._replace(collected_at=collected_at) for row in rows]
+
+
+def _assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        assert actual[name] == pytest.approx(value, rel=1e-9, abs=1e-9), name
+
+
+# ================ 증분 2회 + JSON 저장/복원 == extract_features ==================
+def test_two_increments_match_extract_features(population):
+    windows = feature_windows()
+    first_at = datetime.now() - timedelta(hours=6)
+    second_at = datetime.now() - timedelta(hours=1)
+
+    for transactions, cards, loans, remittances in population.values():
+        # 행을 번갈아 두 번의 수집으로 나눔 (같은 날짜 bucket 에 두 번에 걸쳐 더해지도록)
+        tx_first, tx_second = _collected(transactions[::2], first_at), _collected(transactions[1::2], second_at)
+        card_first, card_second = _collected(cards[::2], first_at), _collected(cards[1::2], second_at)
+
+        _, settled = build_incremental_inputs(FeatureState(), tx_first, card_first, loans, remittances, windows, 0)
+        assert settled is not None
+        restored = FeatureState.from_json(settled.watermark, settled.to_json())
+        assert restored.to_json() == settled.to_json()
+
+        inputs, _ = build_incremental_inputs(restored, tx_second, card_second, loans, remittances, windows, 0)
+
+        expected = extract_features(transactions, cards, loans, remittances)
+        _assert_close(derive_incremental_features(inputs), expected)
+
+
+# ================ 정착 시간(settle) 이후 수집된 행 ==================
+def test_rows_newer_than_settle_cutoff_are_not_persisted(population):
+    windows = feature_windows()
+    transactions, cards, loans, remittances = next(iter(population.values()))
+    settled_at = datetime.now() - timedelta(seconds=settings.FEATURE_STATE_SETTLE_SEC + 60)
+    recent_at = datetime.now()
+
+    old_rows = _collected(transactions[:-5], settled_at)
+    new_rows = _collected(transactions[-5:], recent_at)
+    cards = _collected(cards, settled_at)
+
+    inputs, settled = build_incremental_inputs(
+        FeatureState(), old_rows + new_rows, cards, loans, remittances, windows, settings.FEATURE_STATE_SETTLE_SEC,
+    )
+
+    # 저장할 상태에는 정착된 행만, 이번 계산에는 모든 행
+    _, only_settled = build_incremental_inputs(
+        FeatureState(), old_rows, cards, loans, remittances, windows, settings.FEATURE_STATE_SETTLE_SEC,
+    )
+    assert settled.to_json() == only_settled.to_json()
+    assert settled.watermark < recent_at
+    expected = extract_features(transactions, cards, loans, remittances)
+    _assert_close(derive_incremental_features(inputs), expected)
+
+    # 다음 계산에서 같은 행이 다시 조회되어도 한 번만 반영
+    next_inputs, _ = build_incremental_inputs(
+        settled, new_rows, [], loans, remittances, windows, settings.FEATURE_STATE_SETTLE_SEC,
+    )
+    _assert_close(derive_incremental_features(next_inputs), expected)
+
+
+# ================ 기간 밖 bucket 만료 ==================
+def test_buckets_outside_windows_are_expired():
+    today = date.today()
+    past_windows = feature_windows(today - timedelta(days=60))
+    windows = feature_windows(today)
+    start_6m_date, _, start_3m_date, _ = windows
+    now = datetime.combine(today, datetime.min.time()) + timedelta(hours=9)
+    collected_at = now - timedelta(days=1)
+
+    transactions = [
+        synthetic.TransactionRow(now - timedelta(days=190), 3_000_000.0, "IN", "SALARY", 1_000.0, collected_at),
+        synthetic.TransactionRow(now - timedelta(days=10), 3_100_000.0, "IN", "SALARY", 2_000.0, collected_at),
+    ]
+    cards = [
+        synthetic.CardRow(now - timedelta(days=120), 10_000.0, "LUMP_SUM", "FOOD", 1_000_000, 10.0, collected_at),
+        synthetic.CardRow(now - timedelta(days=5), 20_000.0, "LUMP_SUM", "FOOD", 1_000_000, 10.0, collected_at),
+    ]
+    cutoff = datetime.now()
+
+    # 60일 전 기준으로는 모두 기간 내
+    state, _, _ = advance_feature_state(FeatureState(), transactions, cards, past_windows, cutoff)
+    assert len(state.transaction_days) == 2
+    assert len(state.card_days) == 2
+
+    # 새 행 없이 오늘 기준으로 갱신하면 기간 밖 bucket 이 지워지고 저장 대상
+    settled, current, changed = advance_feature_state(state, [], [], windows, cutoff)
+    assert changed
+    assert list(settled.transaction_days) == [(now - timedelta(days=10)).date().isoformat()]
+    assert list(settled.card_days) == [(now - timedelta(days=5)).date().isoformat()]
+    assert all(day >= start_6m_date.isoformat() for day in current.transaction_days)
+    assert all(day >= start_3m_date.isoformat() for day in current.card_days)
+
+    # 만료 후 다시 갱신하면 바뀐 것이 없으므로 저장하지 않음
+    _, _, changed = advance_feature_state(settled, [], [], windows, cutoff)
+    assert not changed
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+from sklearn.tree import DecisionTreeRegressor, ExtraTreeRegressor
+
+from app.model.features import MODEL_FEATURE_ORDER
+from app.model.inference import InferenceEngine
+
+N_FEATURES = len(MODEL_FEATURE_ORDER)
+
+SCALERS = {
+    "standard": lambda: StandardScaler(),
+    "standard_no_mean": lambda: StandardScaler(with_mean=False),
+    "robust": lambda: RobustScaler(),
+    "minmax": lambda: MinMaxScaler(),
+}
+
+MODELS = {
+    "linear": lambda: LinearRegression(),
+    "ridge": lambda: Ridge(alpha=1.0),
+    "lasso": lambda: Lasso(alpha=0.1),
+    "elastic_net": lambda: ElasticNet(alpha=0.1),
+    "decision_tree": lambda: DecisionTreeRegressor(max_depth=6, random_state=0),
+    "extra_tree": lambda: ExtraTreeRegressor(max_depth=6, random_state=0),
+    "random_forest": lambda: RandomForestRegressor(n_estimators=8, max_depth=5, random_state=0),
+    "extra_trees": lambda: ExtraTreesRegressor(n_estimators=8, max_depth=5, random_state=0),
+    "gradient_boosting": lambda: GradientBoostingRegressor(n_estimators=20, max_depth=3, random_state=0),
+    "gradient_boosting_zero_init": lambda: GradientBoostingRegressor(
+        n_estimators=20, max_depth=3, init="zero", random_state=0,
+    ),
+}
+
+
+def _training_data(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(loc=100.0, scale=30.0, size=(300, N_FEATURES))
+    y = 700 + (X - 100.0) @ rng.normal(size=N_FEATURES) + rng.normal(scale=5.0, size=X.shape[0])
+    return X, y
+
+
+def _fit(scaler, model):
+    X, y = _training_data()
+    scaler.fit(X)
+    model.fit(scaler.transform(X), y)
+    return scaler, model
+
+
+def _expected(scaler, model, X):
+    return np.asarray(model.predict(scaler.transform(X)), dtype=np.float64)
+
+
+def _probe(seed: int = 1):
+    # 학습 범위 밖 값과 0 행도 포함
+    rng = np.random.default_rng(seed)
+    X = rng.normal(loc=100.0, scale=60.0, size=(64, N_FEATURES))
+    return np.vstack([np.zeros((1, N_FEATURES)), X])
+
+
+# ================ 컴파일 경로 == scaler.transform + model.predict ==================
+@pytest.mark.parametrize("model_name", sorted(MODELS))
+@pytest.mark.parametrize("scaler_name", sorted(SCALERS))
+def test_compiled_engine_matches_sklearn(scaler_name, model_name):
+    scaler, model = _fit(SCALERS[scaler_name](), MODELS[model_name]())
+    engine = InferenceEngine(scaler, model, MODEL_FEATURE_ORDER)
+    assert engine.compiled, engine.describe()
+
+    X = _probe()
+    # 배치 경로
+    np.testing.assert_array_equal(engine.predict(X), _expected(scaler, model, X))
+    # 1행 경로 (점수 1건 계산)
+    for row in X[:8]:
+        single = row.reshape(1, -1)
+        np.testing.assert_array_equal(engine.predict(single), _expected(scaler, model, single))
+
+
+def test_uncompiled_parts_fall_back_to_sklearn():
+    scaler, model = _fit(MinMaxScaler(clip=True), KNeighborsRegressor(n_neighbors=3))
+    engine = InferenceEngine(scaler, model, MODEL_FEATURE_ORDER)
+    assert engine.describe()["compiled_scaler"] is False
+    assert engine.describe()["compiled_model"] is False
+
+    X = _probe()
+    np.testing.assert_array_equal(engine.predict(X), _expected(scaler, model, X))
+    np.testing.assert_array_equal(engine.predict(X[:1]), _expected(scaler, model, X[:1]))
+
+
+def test_verify_detects_mismatch_and_falls_back():
+    scaler, model = _fit(StandardScaler(), Ridge())
+    engine = InferenceEngine(scaler, model, MODEL_FEATURE_ORDER)
+    engine._model.intercept += 1.0
+
+    X = _probe()
+    assert engine.verify(X) is False
+    assert not engine.compiled
+    np.testing.assert_array_equal(engine.predict(X), _expected(scaler, model, X))
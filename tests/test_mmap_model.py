@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsRegressor
+from sklearn.preprocessing import StandardScaler
+
+from app.config.config import settings
+from app.model.features import MODEL_FEATURE_ORDER
+from app.model.inference import InferenceEngine, build_inference_engine
+from app.model.load_model import load_model_pickles
+from app.model.mmap_model import MAGIC, load_mmap_model, save_mmap_model
+from app.service.feature_extractor import extract_features
+
+
+def _fixture_engine():
+    model, scaler, version = load_model_pickles(settings.MODEL_PATH, settings.SCALER_PATH)
+    return build_inference_engine(scaler, model, MODEL_FEATURE_ORDER), version
+
+
+def _feature_matrix(population):
+    return np.array(
+        [[extract_features(*rows)[name] for name in MODEL_FEATURE_ORDER] for rows in population.values()],
+        dtype=float,
+    )
+
+
+# ================ 저장 -> 로드 == 원래 엔진 (비트 단위) ==================
+def test_round_trip_matches_fixture_model(population, tmp_path):
+    engine, version = _fixture_engine()
+    assert engine.compiled, engine.describe()
+    path = str(tmp_path / "credit_model.mmap")
+
+    save_mmap_model(path, engine, version)
+    loaded, loaded_version = load_mmap_model(path)
+
+    assert loaded_version == version
+    assert loaded.feature_names == engine.feature_names
+    assert loaded.describe() == engine.describe()
+
+    X = _feature_matrix(population)
+    rng = np.random.default_rng(0)
+    probe = np.vstack([X, X * rng.uniform(0.0, 3.0, size=X.shape), np.zeros((1, X.shape[1]))])
+    np.testing.assert_array_equal(loaded.predict(probe), engine.predict(probe))
+    np.testing.assert_array_equal(loaded.predict(probe[:1]), engine.predict(probe[:1]))
+
+    # 배열은 매핑된 읽기 전용 버퍼를 그대로 가리킴
+    arrays = [value for value in vars(loaded._model).values() if isinstance(value, np.ndarray)]
+    assert arrays and not any(value.flags.writeable for value in arrays)
+
+
+# ================ 형식 검증 ==================
+def test_bad_magic_is_rejected(tmp_path):
+    engine, version = _fixture_engine()
+    path = tmp_path / "credit_model.mmap"
+    save_mmap_model(str(path), engine, version)
+
+    data = path.read_bytes()
+    assert data.startswith(MAGIC)
+    path.write_bytes(b"CRMMAP00" + data[len(MAGIC):])
+
+    with pytest.raises(ValueError, match="Not a memory-mapped model file"):
+        load_mmap_model(str(path))
+
+
+def test_pickle_file_is_rejected():
+    with pytest.raises(ValueError, match="Not a memory-mapped model file"):
+        load_mmap_model(settings.MODEL_PATH)
+
+
+def test_uncompiled_engine_cannot_be_saved(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, len(MODEL_FEATURE_ORDER)))
+    scaler = StandardScaler().fit(X)
+    model = KNeighborsRegressor(n_neighbors=3).fit(scaler.transform(X), X[:, 0])
+    engine = InferenceEngine(scaler, model, MODEL_FEATURE_ORDER)
+
+    with pytest.raises(ValueError):
+        save_mmap_model(str(tmp_path / "knn.mmap"), engine, "v1")
+    assert not (tmp_path / "knn.mmap").exists()
@@ -0,0 +1,81 @@
+import asyncio
+import contextvars
+import json
+import pstats
+from types import SimpleNamespace
+
+from app.common.profiling import RequestProfiler, run_profiled
+
+API = "/api/server/credit-score"
+
+
+def _request_work():
+    return sum(i * i for i in range(20000))
+
+
+def _other_request_work():
+    return sum(i * i for i in range(20000))
+
+
+def _profiles(directory) -> list[dict]:
+    return [json.loads(path.read_text()) for path in sorted(directory.glob("*.json"))]
+
+
+def _profiled_functions(directory) -> set[str]:
+    (path,) = directory.glob("*.prof")
+    return {name for _, _, name in pstats.Stats(str(path)).stats}
+
+
+def test_profile_covers_thread_pool_work_of_the_request_only(tmp_path):
+    profiler = RequestProfiler(enabled=True, header="X-Profile", sample_rate=0.0, directory=str(tmp_path), max_files=10)
+    http_request = SimpleNamespace(headers={"x-profile": "1"})
+
+    async def other_request():
+        # 같은 이벤트 루프에서 다른 요청의 코루틴이 실행되어도 프로파일에 섞이지 않아야 함
+        for _ in range(5):
+            _other_request_work()
+            await asyncio.sleep(0.005)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        other = asyncio.create_task(other_request())
+        with profiler.profile("test", http_request, 1):
+            await asyncio.sleep(0.01)
+            context = contextvars.copy_context()
+            await loop.run_in_executor(None, context.run, run_profiled, _request_work)
+            await asyncio.sleep(0.01)
+        await other
+
+    asyncio.run(main())
+
+    (report,) = _profiles(tmp_path)
+    assert report["profiled_calls"] == 1
+    functions = _profiled_functions(tmp_path)
+    assert "_request_work" in functions
+    assert "_other_request_work" not in functions
+
+
+def test_run_profiled_without_active_profile_just_calls():
+    assert run_profiled(_request_work) == _request_work()
+
+
+def test_profiled_endpoint_includes_fetch_and_extraction(client, population, tmp_path, monkeypatch):
+    from app.common.profiling import request_profiler
+    from app.service.feature_cache import feature_cache
+
+    # 캐시에 있으면 피처 추출이 실행되지 않으므로 끔
+    monkeypatch.setattr(feature_cache, "enabled", False)
+    monkeypatch.setattr(request_profiler, "enabled", True)
+    monkeypatch.setattr(request_profiler, "directory", str(tmp_path))
+    user_id = max(population)
+
+    response = client.post(
+        f"{API}/prediction", json={"user_id": user_id, "monthly_amount": 300000.0}, headers={"X-Profile": "1"},
+    )
+    assert response.status_code == 200
+
+    (report,) = _profiles(tmp_path)
+    assert report["endpoint"] == "prediction"
+    assert report["profiled_calls"] > 1
+    functions = _profiled_functions(tmp_path)
+    assert {"_fetch_in_own_session", "_extract_user_features", "_predict_from_features"} <= functions
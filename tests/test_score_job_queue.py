@@ -0,0 +1,65 @@
+import time
+
+from app.repository.score_job_queue import ScoreJobQueue
+
+
+def _queue(tmp_path, lease_sec: float = 300.0, max_attempts: int = 3) -> ScoreJobQueue:
+    return ScoreJobQueue(str(tmp_path / "jobs.db"), lease_sec=lease_sec, max_attempts=max_attempts)
+
+
+def _expire_lease():
+    # lease_sec=0 이면 lease_until = claim 시각이므로 시계가 조금만 지나도 만료
+    time.sleep(0.01)
+
+
+def test_claim_and_complete(tmp_path):
+    queue = _queue(tmp_path)
+    job, created = queue.enqueue(1)
+    assert created
+    assert queue.enqueue(1) == (queue.get(job.id), False)
+
+    claimed = queue.claim()
+    assert (claimed.id, claimed.attempts) == (job.id, 1)
+    assert queue.get(job.id).status == "running"
+    assert queue.claim() is None
+    assert queue.complete(claimed, 812)
+
+    finished = queue.get(job.id)
+    assert (finished.status, finished.credit_score) == ("done", 812)
+
+
+def test_stale_worker_cannot_overwrite_reclaimed_job(tmp_path):
+    queue = _queue(tmp_path, lease_sec=0.0)
+    job, _ = queue.enqueue(1)
+
+    stale = queue.claim()
+    _expire_lease()
+    current = queue.claim()
+    assert current.id == stale.id
+    assert current.attempts == stale.attempts + 1
+
+    # lease 가 만료된 첫 워커는 기록할 수 없음 (성공/실패 모두)
+    assert not queue.fail(stale, "timeout")
+    assert not queue.complete(stale, 700)
+    assert queue.complete(current, 800)
+    assert not queue.complete(stale, 700)
+
+    finished = queue.get(job.id)
+    assert (finished.status, finished.credit_score, finished.error) == ("done", 800, None)
+
+
+def test_expired_job_fails_after_max_attempts(tmp_path):
+    queue = _queue(tmp_path, lease_sec=0.0, max_attempts=2)
+    job, _ = queue.enqueue(1)
+
+    assert queue.claim().attempts == 1
+    _expire_lease()
+    assert queue.claim().attempts == 2
+    _expire_lease()
+    assert queue.claim() is None
+
+    failed = queue.get(job.id)
+    assert failed.status == "failed"
+    assert "2 attempts" in failed.error
+    # 실패 처리된 뒤 같은 유저의 새 작업은 다시 등록 가능
+    assert queue.enqueue(1)[1]
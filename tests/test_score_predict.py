@@ -0,0 +1,46 @@
+import pytest
+
+from app.service.feature_extractor import extract_features
+from app.service.score_predict import predict_credit_score_grid, predict_credit_score_growth
+
+API = "/api/server/credit-score"
+AMOUNTS = [0.0, 1.0, 50_000.0, 300_000.0, 1_000_000.0, 2_500_000.0, 10_000_000.0]
+
+
+# ================ grid == 송금액별 predict_credit_score_growth ==================
+def test_grid_matches_growth_per_amount(population):
+    for user_id, user_rows in population.items():
+        features = extract_features(*user_rows)
+        grid = predict_credit_score_grid(dict(features), AMOUNTS)
+
+        assert [item["monthly_remit_amount"] for item in grid["results"]] == AMOUNTS
+        for amount, item in zip(AMOUNTS, grid["results"]):
+            growth = predict_credit_score_growth(dict(features), amount)
+            assert grid["current_score"] == growth["current_score"], (user_id, amount)
+            for key in ("after_6m", "after_12m", "after_18m"):
+                assert item[key] == growth[key], (user_id, amount, key)
+
+
+# ================ 요청 검증 ==================
+def test_grid_range_expands_inclusive(client):
+    response = client.post(
+        f"{API}/prediction/grid",
+        json={"user_id": 1, "amount_min": 0, "amount_max": 100_000, "amount_step": 25_000},
+    )
+    assert response.status_code == 200
+    amounts = [item["monthly_remit_amount"] for item in response.json()["results"]]
+    assert amounts == [0.0, 25_000.0, 50_000.0, 75_000.0, 100_000.0]
+
+
+@pytest.mark.parametrize("body", [
+    # 몫이 inf -> int() OverflowError 로 500 이 나던 입력
+    {"amount_min": 0, "amount_max": 1e300, "amount_step": 1e-300},
+    {"amount_min": 0, "amount_max": 1e9, "amount_step": 1},
+    {"amounts": [100_000.0, -1.0]},
+    {"amounts": []},
+    {"amounts": [1.0], "amount_step": 1},
+    {"amount_min": 10, "amount_max": 0, "amount_step": 1},
+])
+def test_grid_rejects_invalid_amounts(client, body):
+    response = client.post(f"{API}/prediction/grid", json={"user_id": 1, **body})
+    assert response.status_code == 422
@@ -0,0 +1,88 @@
+import sqlite3
+
+import pytest
+
+from app.cli.backfill_score_rollup import backfill
+from app.repository.credit_repository import save_credit_score, save_credit_scores_bulk
+from tests.conftest import CORE_DB_PATH
+
+USER_IDS = (1201, 1202, 1203)
+
+
+@pytest.fixture
+def write_db():
+    from app.db.core_banking import WriteSessionLocal
+
+    db = WriteSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _query(sql: str):
+    conn = sqlite3.connect(CORE_DB_PATH)
+    try:
+        placeholders = ", ".join("?" * len(USER_IDS))
+        return conn.execute(sql.format(placeholders=placeholders), USER_IDS).fetchall()
+    finally:
+        conn.close()
+
+
+def _history_averages() -> dict:
+    rows = _query("""
+        SELECT user_id, CAST(strftime('%Y', created_at) AS INTEGER), CAST(strftime('%m', created_at) AS INTEGER),
+               AVG(score), COUNT(*)
+        FROM credit_score_history
+        WHERE user_id IN ({placeholders})
+        GROUP BY 1, 2, 3
+    """)
+    return {(user_id, year, month): (avg, count) for user_id, year, month, avg, count in rows}
+
+
+def _monthly_averages() -> dict:
+    rows = _query("""
+        SELECT user_id, year, month, score_sum, score_count
+        FROM credit_score_monthly
+        WHERE user_id IN ({placeholders})
+    """)
+    return {(user_id, year, month): (total / count, count) for user_id, year, month, total, count in rows}
+
+
+def _add_history(user_id: int, score: int, created_at: str):
+    conn = sqlite3.connect(CORE_DB_PATH)
+    try:
+        conn.execute(
+            "INSERT INTO credit_score_history (user_id, score, created_at) VALUES (?, ?, ?)",
+            (user_id, score, created_at),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ================ 롤업 == history AVG (저장 / 일괄 저장 / 백필) ==================
+def test_monthly_rollup_matches_history_average(write_db):
+    # 이번 달: 같은 초에 저장되어 history 행이 덮어써져도 롤업은 history 와 같은 값
+    save_credit_score(write_db, USER_IDS[0], 700)
+    save_credit_score(write_db, USER_IDS[0], 710)
+    assert _monthly_averages() == _history_averages()
+
+    save_credit_scores_bulk(write_db, [(USER_IDS[0], 720), (USER_IDS[1], 650)])
+    assert _monthly_averages() == _history_averages()
+
+    # 롤업 도입 전에 쌓인 지난 달 history 는 백필로 반영
+    _add_history(USER_IDS[0], 600, "2025-01-10 09:00:00")
+    _add_history(USER_IDS[0], 615, "2025-01-20 18:30:00")
+    _add_history(USER_IDS[1], 640, "2025-02-03 12:00:00")
+    _add_history(USER_IDS[2], 580, "2025-02-28 23:59:59")
+    assert _monthly_averages() != _history_averages()
+
+    backfill(chunk_size=1)
+    monthly = _monthly_averages()
+    assert monthly == _history_averages()
+    assert monthly[(USER_IDS[0], 2025, 1)] == (607.5, 2)
+
+    # 여러 번 실행해도 같은 결과
+    backfill(chunk_size=2)
+    assert _monthly_averages() == monthly
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from app.common.single_flight import SingleFlight
+
+
+# ================ 동시 요청은 leader 의 결과를 공유 ==================
+def test_followers_share_the_leader_result():
+    async def scenario():
+        flight = SingleFlight("test", timeout=5.0)
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"score": calls}
+
+        waiters = [asyncio.create_task(flight.do("user:1", compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 1
+
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*waiters), 5)
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert results[0] == {"score": 1}
+
+    asyncio.run(scenario())
+
+
+def test_different_keys_are_computed_separately():
+    async def scenario():
+        flight = SingleFlight("test", timeout=5.0)
+
+        async def compute(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("user:1", lambda: compute(1)), flight.do("user:2", lambda: compute(2)),
+        )
+        assert results == [1, 2]
+
+    asyncio.run(scenario())
+
+
+# ================ 예외는 모든 대기 요청에 전달 ==================
+def test_exception_reaches_every_waiter():
+    async def scenario():
+        flight = SingleFlight("test", timeout=5.0)
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            raise ValueError("model failed")
+
+        waiters = [asyncio.create_task(flight.do("user:1", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 5)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len({id(result) for result in results}) == 1
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+# ================ follower 타임아웃은 공유 계산을 취소하지 않음 ==================
+def test_follower_timeout_does_not_cancel_the_shared_task():
+    async def scenario():
+        flight = SingleFlight("test", timeout=5.0)
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("user:1", compute))
+        await asyncio.sleep(0)
+
+        # 같은 키를 짧은 timeout 으로 기다리는 follower (timeout 은 인스턴스 속성이라 잠시 낮춤)
+        flight.timeout = 0.01
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.do("user:1", compute)
+        flight.timeout = 5.0
+
+        assert not leader.done()
+        assert flight.in_flight() == 1
+
+        # 취소된 follower 도 공유 계산을 끝내지 않음
+        cancelled = asyncio.create_task(flight.do("user:1", compute))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert flight.in_flight() == 1
+
+        release.set()
+        assert await asyncio.wait_for(leader, 5) == "done"
+        assert calls == 1
+
+    asyncio.run(scenario())
+
+
+# ================ 완료 후 키 삭제 ==================
+def test_key_is_forgotten_after_completion():
+    async def scenario():
+        flight = SingleFlight("test", timeout=5.0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return calls
+
+        assert await flight.do("user:1", compute) == 1
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 0
+
+        # 끝난 계산의 결과를 재사용하지 않고 새로 계산
+        assert await flight.do("user:1", compute) == 2
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,42 @@
+import pytest
+
+from app.service.feature_extractor import extract_features, feature_windows
+from app.service.streaming_feature_extractor import (
+    derive_streamed_features,
+    extract_features_streaming,
+    stream_feature_inputs,
+)
+
+
+def _by_created_at(rows):
+    return sorted(rows, key=lambda row: row.created_at)
+
+
+def _assert_same_features(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        # 표준편차는 Welford 누적이라 끝자리만 다를 수 있음
+        assert actual[name] == pytest.approx(value, rel=1e-12, abs=1e-9), name
+
+
+def test_streaming_matches_extract_features(population):
+    for transactions, cards, loans, remittances in population.values():
+        expected = extract_features(transactions, cards, loans, remittances)
+        actual = extract_features_streaming(iter(transactions), iter(cards), iter(loans), _by_created_at(remittances))
+        _assert_same_features(actual, expected)
+
+
+def test_streaming_rejects_unordered_remittances(population):
+    transactions, cards, loans, remittances = next(
+        rows for rows in population.values() if len(rows[3]) >= 3
+    )
+    unordered = list(reversed(_by_created_at(remittances)))
+    with pytest.raises(ValueError, match="ordered by created_at"):
+        extract_features_streaming(transactions, cards, loans, unordered)
+
+
+def test_db_streaming_matches_extract_features(population, core_db, mydata_db):
+    windows = feature_windows()
+    for user_id, rows in population.items():
+        inputs = stream_feature_inputs(user_id, core_db, mydata_db, windows, chunk_size=16)
+        _assert_same_features(derive_streamed_features(inputs), extract_features(*rows))
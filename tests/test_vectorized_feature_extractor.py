@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from app.model.features import MODEL_FEATURE_ORDER
+from app.service.feature_extractor import extract_features
+from app.service.vectorized_feature_extractor import extract_feature_matrix, extract_features_vectorized
+from benchmarks import synthetic
+
+
+def _expected_matrix(row_groups):
+    return np.array(
+        [[extract_features(*rows)[name] for name in MODEL_FEATURE_ORDER] for rows in row_groups], dtype=float,
+    ).reshape(len(row_groups), len(MODEL_FEATURE_ORDER))
+
+
+# ================ NumPy 행렬 == extract_features (비트 단위) ==================
+@pytest.mark.parametrize("profile, n_users", [("thin", 30), ("typical", 30), ("heavy", 5)])
+def test_feature_matrix_matches_extract_features(profile, n_users):
+    population = synthetic.generate_population(n_users, synthetic.PROFILES[profile], seed=11)
+    row_groups = list(population.values())
+
+    np.testing.assert_array_equal(extract_feature_matrix(row_groups), _expected_matrix(row_groups))
+
+
+def test_single_user_matches_extract_features(population):
+    for rows in population.values():
+        assert extract_features_vectorized(*rows) == extract_features(*rows)
+
+
+def test_feature_matrix_handles_missing_values():
+    now = synthetic.BASE_NOW
+    transactions = [
+        synthetic.TransactionRow(None, 1_000.0, "OUT", "LIVING", 10.0, now),
+        synthetic.TransactionRow(now - timedelta(days=3), 2_000.0, "OUT", "RENT", None, now),
+        synthetic.TransactionRow(now - timedelta(days=40), 3_000_000.0, "IN", "SALARY", 5_000.0, now),
+        synthetic.TransactionRow(now - timedelta(days=10), 3_100_000.0, "IN", "SALARY", 8_000.0, now),
+    ]
+    cards = [
+        synthetic.CardRow(now - timedelta(days=5), 50_000.0, "LUMP_SUM", "CASH_ADVANCE", 0, 100.0, now),
+        synthetic.CardRow(None, 70_000.0, "LUMP_SUM", "FOOD", 1_000_000, 900_000.0, now),
+    ]
+    # 시각이 다른 송금: 간격은 날짜 차이가 아니라 datetime 차이의 .days (extract_features 와 동일)
+    remittances = [
+        synthetic.RemittanceRow(500_000.0, "COMPLETED", now - timedelta(days=61, hours=20)),
+        synthetic.RemittanceRow(450_000.0, "failed", now - timedelta(days=30, hours=2)),
+        synthetic.RemittanceRow(480_000.0, "COMPLETED", now - timedelta(hours=1)),
+        synthetic.RemittanceRow(None, "COMPLETED", None),
+    ]
+    row_groups = [
+        (transactions, cards, [], remittances),
+        ([], [], [], []),
+        (transactions[:1], [], [], remittances[:2]),
+    ]
+
+    np.testing.assert_array_equal(extract_feature_matrix(row_groups), _expected_matrix(row_groups))
+
+
+def test_feature_matrix_of_no_users_is_empty():
+    assert extract_feature_matrix([]).shape == (0, len(MODEL_FEATURE_ORDER))